@@ -222,6 +222,19 @@ AVAILABLE_CLI_OPTIONS = {
         default=constants.BACKTEST_CACHE_DEFAULT,
         choices=constants.BACKTEST_CACHE_AGE,
     ),
+    "backtest_engine": Arg(
+        '--backtest-engine',
+        help='Backtest engine to use. `vectorized` only processes candles with entry signals '
+        'or possible exits and is considerably faster for strategies without per-candle '
+        'callbacks (default: `default`).',
+        choices=constants.BACKTEST_ENGINES,
+    ),
+    "export_db_url": Arg(
+        '--export-db-url',
+        help='Also store backtest trades and orders in this database, tagged with run id '
+        'and strategy (sqlalchemy url, e.g. `sqlite:///user_data/backtest_results.sqlite`).',
+        metavar='PATH',
+    ),
     # Edge
     "stoploss_range": Arg(
         '--stoplosses',
@@ -291,6 +304,32 @@ AVAILABLE_CLI_OPTIONS = {
         metavar='JOBS',
         default=-1,
     ),
+    "hyperopt_persistent_workers": Arg(
+        '--persistent-workers',
+        help='Store preprocessed data as memory-mapped columnar store, which hyperopt worker '
+        'processes attach to once and keep across epochs, instead of loading a pickle '
+        'every epoch.',
+        action='store_true',
+    ),
+    "hyperopt_async_scheduler": Arg(
+        '--async-scheduler',
+        help='Evaluate epochs asynchronously: submit a new epoch as soon as any worker '
+        'finishes, instead of waiting for a full batch of epochs.',
+        action='store_true',
+    ),
+    "hyperopt_fast_metrics": Arg(
+        '--fast-metrics',
+        help='Only calculate summary metrics (trades, profit, duration, drawdown) per epoch. '
+        'Full backtest statistics are generated for best epochs only.',
+        action='store_true',
+    ),
+    "hyperopt_disable_signal_cache": Arg(
+        '--disable-signal-cache',
+        help='Populate buy / sell signals in every epoch instead of reusing signals '
+        'for repeated buy / sell parameters. Use if signals depend on anything besides '
+        'the buy / sell parameters.',
+        action='store_true',
+    ),
     "hyperopt_random_state": Arg(
         '--random-state',
         help='Set random state to some positive integer for reproducible hyperopt results.',
@@ -406,6 +445,13 @@ AVAILABLE_CLI_OPTIONS = {
         type=check_int_positive,
         metavar='INT',
     ),
+    "download_concurrency": Arg(
+        '--dl-concurrency',
+        help='Number of pair / timeframe combinations to download concurrently. '
+        'Requests are still limited by the exchange rate limit. Default: 1.',
+        type=check_int_positive,
+        metavar='INT',
+    ),
     "download_trades": Arg(
         '--dl-trades',
         help='Download trades instead of OHLCV data. The bot will resample trades to the '
@@ -429,6 +475,13 @@ AVAILABLE_CLI_OPTIONS = {
         help='Storage format for downloaded candle (OHLCV) data. (default: `json`).',
         choices=constants.AVAILABLE_DATAHANDLERS,
     ),
+    "dataload_workers": Arg(
+        '--data-load-workers',
+        help='Number of processes loading candle (OHLCV) data of pairs concurrently. '
+        '(default: 1).',
+        type=check_int_positive,
+        metavar='INT',
+    ),
     "dataformat_trades": Arg(
         '--data-format-trades',
         help='Storage format for downloaded trades data. (default: `jsongz`).',
@@ -95,8 +95,14 @@ def start_hyperopt_show(args: Dict[str, Any]) -> None:
         metrics = val['results_metrics']
         if 'strategy_name' in metrics:
             strategy_name = metrics['strategy_name']
-            show_backtest_result(strategy_name, metrics,
-                                 metrics['stake_currency'], config.get('backtest_breakdown', []))
+            if 'trades' in metrics:
+                show_backtest_result(strategy_name, metrics, metrics['stake_currency'],
+                                     config.get('backtest_breakdown', []))
+            else:
+                # Epochs evaluated with --fast-metrics which were not best when evaluated
+                print("Detailed backtest statistics are only available for best epochs "
+                      "when hyperopt ran with `--fast-metrics`. Run backtesting with this "
+                      "epoch's parameters to see them.")
 
             HyperoptTools.try_export_params(config, strategy_name, val)
 
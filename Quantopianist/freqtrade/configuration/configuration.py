@@ -273,6 +273,13 @@ class Configuration:
         self._args_to_config(config, argname='backtest_cache',
                              logstring='Parameter --cache={} detected ...')
 
+        self._args_to_config(config, argname='backtest_engine',
+                             logstring='Parameter --backtest-engine={} detected ...')
+
+        self._args_to_config(config, argname='export_db_url',
+                             logstring='Storing backtest results in database "{}" ...',
+                             logfun=parse_db_uri_for_logging)
+
         self._args_to_config(config, argname='disableparamexport',
                              logstring='Parameter --disableparamexport detected: {} ...')
 
@@ -320,6 +327,19 @@ class Configuration:
         self._args_to_config(config, argname='hyperopt_jobs',
                              logstring='Parameter -j/--job-workers detected: {}')
 
+        self._args_to_config(config, argname='hyperopt_persistent_workers',
+                             logstring='Parameter --persistent-workers detected ...')
+
+        self._args_to_config(config, argname='hyperopt_async_scheduler',
+                             logstring='Parameter --async-scheduler detected ...')
+
+        self._args_to_config(config, argname='hyperopt_fast_metrics',
+                             logstring='Parameter --fast-metrics detected ...')
+
+        if self.args.get('hyperopt_disable_signal_cache'):
+            config['hyperopt_signal_cache'] = False
+            logger.info('Parameter --disable-signal-cache detected ...')
+
         self._args_to_config(config, argname='hyperopt_random_state',
                              logstring='Parameter --random-state detected: {}')
 
@@ -426,12 +446,17 @@ class Configuration:
         self._args_to_config(config, argname='dataformat_trades',
                              logstring='Using "{}" to store trades data.')
 
+        self._args_to_config(config, argname='dataload_workers',
+                             logstring='Parameter --data-load-workers detected: {}')
+
         self._args_to_config(config, argname='show_timerange',
                              logstring='Detected --show-timerange')
 
     def _process_data_options(self, config: Dict[str, Any]) -> None:
         self._args_to_config(config, argname='new_pairs_days',
                              logstring='Detected --new-pairs-days: {}')
+        self._args_to_config(config, argname='download_concurrency',
+                             logstring='Detected --dl-concurrency: {}')
         self._args_to_config(config, argname='trading_mode',
                              logstring='Detected --trading-mode: {}')
         config['candle_type_def'] = CandleType.get_default(
@@ -32,10 +32,11 @@ AVAILABLE_PAIRLISTS = ['StaticPairList', 'VolumePairList',
                        'PrecisionFilter', 'PriceFilter', 'RangeStabilityFilter',
                        'ShuffleFilter', 'SpreadFilter', 'VolatilityFilter']
 AVAILABLE_PROTECTIONS = ['CooldownPeriod', 'LowProfitPairs', 'MaxDrawdown', 'StoplossGuard']
-AVAILABLE_DATAHANDLERS = ['json', 'jsongz', 'hdf5']
+AVAILABLE_DATAHANDLERS = ['json', 'jsongz', 'hdf5', 'feather', 'parquet']
 BACKTEST_BREAKDOWNS = ['day', 'week', 'month']
 BACKTEST_CACHE_AGE = ['none', 'day', 'week', 'month']
 BACKTEST_CACHE_DEFAULT = 'day'
+BACKTEST_ENGINES = ['default', 'vectorized']
 DRY_RUN_WALLET = 1000
 DATETIME_PRINT_FORMAT = '%Y-%m-%d %H:%M:%S'
 MATH_CLOSE_PREC = 1e-14  # Precision used for float comparisons
@@ -106,6 +107,7 @@ CONF_SCHEMA = {
     'properties': {
         'max_open_trades': {'type': ['integer', 'number'], 'minimum': -1},
         'new_pairs_days': {'type': 'integer', 'default': 30},
+        'download_concurrency': {'type': 'integer', 'minimum': 1, 'default': 1},
         'timeframe': {'type': 'string'},
         'stake_currency': {'type': 'string'},
         'stake_amount': {
@@ -132,6 +134,8 @@ CONF_SCHEMA = {
         'dry_run_wallet': {'type': 'number', 'default': DRY_RUN_WALLET},
         'cancel_open_orders_on_exit': {'type': 'boolean', 'default': False},
         'process_only_new_candles': {'type': 'boolean'},
+        'verify_incremental_indicators': {'type': 'boolean'},
+        'analysis_workers': {'type': 'integer', 'minimum': 1, 'default': 1},
         'minimal_roi': {
             'type': 'object',
             'patternProperties': {
@@ -154,6 +158,8 @@ CONF_SCHEMA = {
             'type': 'array',
             'items': {'type': 'string', 'enum': BACKTEST_BREAKDOWNS}
         },
+        'backtest_engine': {'type': 'string', 'enum': BACKTEST_ENGINES, 'default': 'default'},
+        'export_db_url': {'type': 'string'},
         'bot_name': {'type': 'string'},
         'unfilledtimeout': {
             'type': 'object',
@@ -350,6 +356,7 @@ CONF_SCHEMA = {
         'db_url': {'type': 'string'},
         'export': {'type': 'string', 'enum': EXPORT_OPTIONS, 'default': 'trades'},
         'disableparamexport': {'type': 'boolean'},
+        'hyperopt_signal_cache': {'type': 'boolean', 'default': True},
         'initial_state': {'type': 'string', 'enum': ['running', 'stopped']},
         'forcebuy_enable': {'type': 'boolean'},
         'disable_dataframe_checks': {'type': 'boolean'},
@@ -359,6 +366,11 @@ CONF_SCHEMA = {
             'properties': {
                 'process_throttle_secs': {'type': 'integer'},
                 'interval': {'type': 'integer'},
+                'scheduler': {'type': 'string', 'enum': ['throttle', 'candle']},
+                'candle_offset_secs': {'type': 'number', 'minimum': 0},
+                'order_management_secs': {'type': 'number', 'minimum': 1},
+                'rpc_queue_size': {'type': 'integer', 'minimum': 0},
+                'rpc_queue_drop': {'type': 'string', 'enum': ['oldest', 'newest']},
                 'sd_notify': {'type': 'boolean'},
             }
         },
@@ -372,6 +384,7 @@ CONF_SCHEMA = {
             'enum': AVAILABLE_DATAHANDLERS,
             'default': 'jsongz'
         },
+        'dataload_workers': {'type': 'integer', 'minimum': 1, 'default': 1},
         'position_adjustment_enable': {'type': 'boolean'},
         'max_entry_position_adjustment': {'type': ['integer', 'number'], 'minimum': -1},
     },
@@ -402,6 +415,10 @@ CONF_SCHEMA = {
                 'unknown_fee_rate': {'type': 'number'},
                 'outdated_offset': {'type': 'integer', 'minimum': 1},
                 'markets_refresh_interval': {'type': 'integer'},
+                'stream_market_data': {'type': 'boolean', 'default': False},
+                'stream_url': {'type': 'string'},
+                'stream_max_age': {'type': 'number', 'minimum': 1, 'default': 10},
+                'market_snapshot': {'type': 'boolean', 'default': False},
                 'ccxt_config': {'type': 'object'},
                 'ccxt_async_config': {'type': 'object'}
             },
@@ -9,12 +9,15 @@ from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
 import pandas as pd
+from sqlalchemy import func, select
 
 from freqtrade.constants import LAST_BT_RESULT_FN
 from freqtrade.exceptions import OperationalException
 from freqtrade.misc import json_load
 from freqtrade.optimize.backtest_caching import get_backtest_metadata_filename
 from freqtrade.persistence import LocalTrade, Trade, init_db
+from freqtrade.persistence.backtest_results import (backtest_orders, backtest_runs,
+                                                    backtest_trades, get_backtest_results_engine)
 
 
 logger = logging.getLogger(__name__)
@@ -365,6 +368,90 @@ def load_trades_from_db(db_url: str, strategy: Optional[str] = None) -> pd.DataF
     return trades
 
 
+def load_backtest_runs_from_db(db_url: str, strategy: Optional[str] = None) -> pd.DataFrame:
+    """
+    Load the backtest runs stored in a backtest results database (see --export-db-url)
+    :param db_url: sqlalchemy formatted url to the backtest results database
+    :param strategy: Only load runs of this strategy
+    :return: Dataframe with one row per backtest run and strategy
+    """
+    query = backtest_runs.select().order_by(backtest_runs.c.id)
+    if strategy:
+        query = query.where(backtest_runs.c.strategy == strategy)
+    engine = get_backtest_results_engine(db_url)
+    with engine.connect() as connection:
+        df = pd.read_sql(query, connection)
+    engine.dispose()
+    for col in ('backtest_run_start', 'backtest_start', 'backtest_end'):
+        df[col] = pd.to_datetime(df[col], utc=True)
+    return df
+
+
+def load_backtest_data_from_db(db_url: str, strategy: Optional[str] = None,
+                               run_id: Optional[str] = None,
+                               backtest_run_ids: Optional[List[int]] = None,
+                               latest_only: bool = True) -> pd.DataFrame:
+    """
+    Load backtest trades from a backtest results database (see --export-db-url).
+    :param db_url: sqlalchemy formatted url to the backtest results database
+    :param strategy: Only load trades of this strategy
+    :param run_id: Only load trades of backtests with this run id
+    :param backtest_run_ids: Only load trades of these backtest runs (backtest_runs.id)
+    :param latest_only: Only load the trades of the latest matching backtest run per strategy.
+        Otherwise, trades of all matching runs are loaded -
+        `backtest_run_id` tells them apart.
+    :return: Dataframe with the columns of load_backtest_data() (without orders),
+        as well as `backtest_run_id`, `run_id` and `strategy`.
+    """
+    filters = []
+    if strategy:
+        filters.append(backtest_runs.c.strategy == strategy)
+    if run_id:
+        filters.append(backtest_runs.c.run_id == run_id)
+    if backtest_run_ids is not None:
+        filters.append(backtest_runs.c.id.in_(backtest_run_ids))
+
+    runs = select(backtest_runs.c.id).where(*filters)
+    if latest_only:
+        runs = select(func.max(backtest_runs.c.id)).where(*filters).group_by(
+            backtest_runs.c.strategy)
+    query = backtest_trades.select().where(
+        backtest_trades.c.backtest_run_id.in_(runs)
+    ).order_by(backtest_trades.c.backtest_run_id, backtest_trades.c.trade_number)
+
+    engine = get_backtest_results_engine(db_url)
+    with engine.connect() as connection:
+        df = pd.read_sql(query, connection)
+    engine.dispose()
+    df = df.drop(columns=['id'])
+    df['open_date'] = pd.to_datetime(df['open_date'], utc=True)
+    df['close_date'] = pd.to_datetime(df['close_date'], utc=True)
+    epoch = pd.Timestamp(0, tz='UTC')
+    df['open_timestamp'] = (df['open_date'] - epoch) // pd.Timedelta(milliseconds=1)
+    df['close_timestamp'] = (df['close_date'] - epoch) // pd.Timedelta(milliseconds=1)
+    df['orders'] = None
+    return df
+
+
+def load_backtest_orders_from_db(db_url: str, backtest_run_id: int) -> pd.DataFrame:
+    """
+    Load the orders of one backtest run from a backtest results database.
+    :param db_url: sqlalchemy formatted url to the backtest results database
+    :param backtest_run_id: Backtest run to load (backtest_runs.id)
+    :return: Dataframe with one row per order - `trade_number` matches the trade
+        loaded by load_backtest_data_from_db()
+    """
+    query = backtest_orders.select().where(
+        backtest_orders.c.backtest_run_id == backtest_run_id
+    ).order_by(backtest_orders.c.trade_number, backtest_orders.c.id)
+    engine = get_backtest_results_engine(db_url)
+    with engine.connect() as connection:
+        df = pd.read_sql(query, connection)
+    engine.dispose()
+    df['order_filled_date'] = pd.to_datetime(df['order_filled_date'], utc=True)
+    return df
+
+
 def load_trades(source: str, db_url: str, exportfilename: Path,
                 no_trades: bool = False, strategy: Optional[str] = None) -> pd.DataFrame:
     """
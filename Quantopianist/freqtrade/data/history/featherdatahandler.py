@@ -0,0 +1,213 @@
+import logging
+import re
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow.dataset as ds
+from pyarrow import feather
+
+from freqtrade.configuration import TimeRange
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS, TradeList
+from freqtrade.enums import CandleType
+
+from .idatahandler import IDataHandler
+
+
+logger = logging.getLogger(__name__)
+
+
+class FeatherDataHandler(IDataHandler):
+    """
+    Columnar binary storage (Arrow IPC / feather).
+    Dates are stored as timestamps, so no parsing or conversion is necessary on load.
+    Files are memory-mapped, and only rows within the requested timerange are materialized.
+    """
+
+    _columns = DEFAULT_DATAFRAME_COLUMNS
+    _dataset_format = 'feather'
+
+    @classmethod
+    def ohlcv_get_pairs(cls, datadir: Path, timeframe: str, candle_type: CandleType) -> List[str]:
+        """
+        Returns a list of all pairs with ohlcv data available in this datadir
+        for the specified timeframe
+        :param datadir: Directory to search for ohlcv files
+        :param timeframe: Timeframe to search pairs for
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: List of Pairs
+        """
+        candle = ""
+        if candle_type != CandleType.SPOT:
+            datadir = datadir.joinpath('futures')
+            candle = f"-{candle_type}"
+
+        ext = cls._get_file_extension()
+        _tmp = [re.search(r'^(\S+)(?=\-' + timeframe + candle + '.' + ext + ')', p.name)
+                for p in datadir.glob(f"*{timeframe}{candle}.{ext}")]
+        # Check if regex found something and only return these results
+        return [cls.rebuild_pair_from_filename(match[0]) for match in _tmp if match]
+
+    def ohlcv_store(
+            self, pair: str, timeframe: str, data: pd.DataFrame, candle_type: CandleType) -> None:
+        """
+        Store data in columnar format.
+        :param pair: Pair - used to generate filename
+        :param timeframe: Timeframe - used to generate filename
+        :param data: Dataframe containing OHLCV data
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: None
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        self.create_dir_if_needed(filename)
+
+        self._write_dataframe(data.reset_index(drop=True).loc[:, self._columns], filename)
+
+    def _ohlcv_load(self, pair: str, timeframe: str,
+                    timerange: Optional[TimeRange], candle_type: CandleType
+                    ) -> pd.DataFrame:
+        """
+        Internal method used to load data for one pair from disk.
+        Implements the loading and conversion to a Pandas dataframe.
+        Timerange trimming and dataframe validation happens outside of this method.
+        :param pair: Pair to load data
+        :param timeframe: Timeframe (e.g. "5m")
+        :param timerange: Limit data to be loaded to this timerange.
+                        Optionally implemented by subclasses to avoid loading
+                        all data where possible.
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: DataFrame with ohlcv data, or empty DataFrame
+        """
+        filename = self._pair_data_filename(
+            self._datadir, pair, timeframe, candle_type=candle_type)
+        if not filename.exists():
+            # Fallback mode for 1M files
+            filename = self._pair_data_filename(
+                self._datadir, pair, timeframe, candle_type=candle_type, no_timeframe_modify=True)
+            if not filename.exists():
+                return pd.DataFrame(columns=self._columns)
+
+        where = None
+        if timerange:
+            if timerange.starttype == 'date':
+                where = ds.field('date') >= pd.Timestamp(timerange.startts, unit='s', tz='UTC')
+            if timerange.stoptype == 'date':
+                stop = ds.field('date') <= pd.Timestamp(timerange.stopts, unit='s', tz='UTC')
+                where = stop if where is None else where & stop
+
+        pairdata = self._read_dataframe(filename, where)
+        if list(pairdata.columns) != self._columns:
+            raise ValueError("Wrong dataframe format")
+        pairdata = pairdata.astype(dtype={'open': 'float', 'high': 'float',
+                                          'low': 'float', 'close': 'float', 'volume': 'float'})
+        return pairdata
+
+    def ohlcv_append(
+        self,
+        pair: str,
+        timeframe: str,
+        data: pd.DataFrame,
+        candle_type: CandleType
+    ) -> None:
+        """
+        Append data to existing data structures
+        Columnar files are immutable - the combined data is rewritten.
+        Candles in `data` replace existing candles with the same date.
+        :param pair: Pair
+        :param timeframe: Timeframe this ohlcv data is for
+        :param data: Data to append.
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        """
+        existing = self._ohlcv_load(pair, timeframe, None, candle_type)
+        if not existing.empty:
+            data = pd.concat([existing, data.loc[:, self._columns]], ignore_index=True)
+            data = data.drop_duplicates(subset='date', keep='last').sort_values('date')
+        self.ohlcv_store(pair, timeframe, data, candle_type)
+
+    @classmethod
+    def trades_get_pairs(cls, datadir: Path) -> List[str]:
+        """
+        Returns a list of all pairs for which trade data is available in this
+        :param datadir: Directory to search for ohlcv files
+        :return: List of Pairs
+        """
+        ext = cls._get_file_extension()
+        _tmp = [re.search(r'^(\S+)(?=\-trades.' + ext + ')', p.name)
+                for p in datadir.glob(f"*trades.{ext}")]
+        # Check if regex found something and only return these results to avoid exceptions.
+        return [cls.rebuild_pair_from_filename(match[0]) for match in _tmp if match]
+
+    def trades_store(self, pair: str, data: TradeList) -> None:
+        """
+        Store trades data (list of Dicts) to file
+        :param pair: Pair - used for filename
+        :param data: List of Lists containing trade data,
+                     column sequence as in DEFAULT_TRADES_COLUMNS
+        """
+        filename = self._pair_trades_filename(self._datadir, pair)
+        self.create_dir_if_needed(filename)
+        self._write_dataframe(pd.DataFrame(data, columns=DEFAULT_TRADES_COLUMNS), filename)
+
+    def trades_append(self, pair: str, data: TradeList):
+        """
+        Append data to existing files
+        Columnar files are immutable - the combined data is rewritten.
+        :param pair: Pair - used for filename
+        :param data: List of Lists containing trade data,
+                     column sequence as in DEFAULT_TRADES_COLUMNS
+        """
+        self.trades_store(pair, self._trades_load(pair) + data)
+
+    def _trades_load(self, pair: str, timerange: Optional[TimeRange] = None) -> TradeList:
+        """
+        Load a pair from file.
+        :param pair: Load trades for this pair
+        :param timerange: Timerange to load trades for
+        :return: List of trades
+        """
+        filename = self._pair_trades_filename(self._datadir, pair)
+        if not filename.exists():
+            return []
+
+        where = None
+        if timerange:
+            if timerange.starttype == 'date':
+                where = ds.field('timestamp') >= timerange.startts * 1e3
+            if timerange.stoptype == 'date':
+                stop = ds.field('timestamp') < timerange.stopts * 1e3
+                where = stop if where is None else where & stop
+
+        trades = self._read_dataframe(filename, where)
+        trades[['id', 'type']] = trades[['id', 'type']].replace({np.nan: None})
+        return trades.values.tolist()
+
+    def _write_dataframe(self, data: pd.DataFrame, filename: Path) -> None:
+        feather.write_feather(data, filename, compression='lz4')
+
+    def _read_dataframe(self, filename: Path, where: Optional[ds.Expression]) -> pd.DataFrame:
+        """
+        Read a file, materializing only rows matching `where`.
+        """
+        dataset = ds.dataset(filename, format=self._dataset_format)
+        return dataset.to_table(filter=where).to_pandas()
+
+    @classmethod
+    def _get_file_extension(cls):
+        return "feather"
+
+
+class ParquetDataHandler(FeatherDataHandler):
+    """
+    Columnar binary storage (Parquet).
+    Smaller files than feather - the timerange filter skips row groups outside the timerange.
+    """
+
+    _dataset_format = 'parquet'
+
+    def _write_dataframe(self, data: pd.DataFrame, filename: Path) -> None:
+        data.to_parquet(filename, index=False, compression='zstd')
+
+    @classmethod
+    def _get_file_extension(cls):
+        return "parquet"
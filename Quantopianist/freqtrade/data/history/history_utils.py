@@ -1,6 +1,9 @@
+import asyncio
 import logging
 import operator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -70,6 +73,7 @@ def load_data(datadir: Path,
               data_format: str = 'json',
               candle_type: CandleType = CandleType.SPOT,
               user_futures_funding_rate: int = None,
+              workers: int = 1,
               ) -> Dict[str, DataFrame]:
     """
     Load ohlcv history data for a list of pairs.
@@ -83,6 +87,8 @@ def load_data(datadir: Path,
     :param fail_without_data: Raise OperationalException if no data is found.
     :param data_format: Data format which should be used. Defaults to json
     :param candle_type: Any of the enum CandleType (must match trading mode!)
+    :param workers: Number of processes loading (parsing and cleaning) pairs concurrently.
+                    1 loads all pairs in this process.
     :return: dict(<pair>:<Dataframe>)
     """
     result: Dict[str, DataFrame] = {}
@@ -90,15 +96,21 @@ def load_data(datadir: Path,
         logger.info(f'Using indicator startup period: {startup_candles} ...')
 
     data_handler = get_datahandler(datadir, data_format)
-
-    for pair in pairs:
-        hist = load_pair_history(pair=pair, timeframe=timeframe,
-                                 datadir=datadir, timerange=timerange,
-                                 fill_up_missing=fill_up_missing,
-                                 startup_candles=startup_candles,
-                                 data_handler=data_handler,
-                                 candle_type=candle_type,
-                                 )
+    load_kwargs = dict(timeframe=timeframe, datadir=datadir, timerange=timerange,
+                       fill_up_missing=fill_up_missing, startup_candles=startup_candles,
+                       data_handler=data_handler, candle_type=candle_type)
+
+    if workers > 1 and len(pairs) > 1:
+        workers = min(workers, len(pairs))
+        logger.info(f'Loading data for {len(pairs)} pairs using {workers} workers.')
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            histories = executor.map(partial(load_pair_history, **load_kwargs), pairs)
+            # Results are returned in order of `pairs`
+            loaded = list(zip(pairs, histories))
+    else:
+        loaded = [(pair, load_pair_history(pair=pair, **load_kwargs)) for pair in pairs]
+
+    for pair, hist in loaded:
         if not hist.empty:
             result[pair] = hist
         else:
@@ -211,54 +223,20 @@ def _download_pair_history(pair: str, *,
     data_handler = get_datahandler(datadir, data_handler=data_handler)
 
     try:
-        if erase:
-            if data_handler.ohlcv_purge(pair, timeframe, candle_type=candle_type):
-                logger.info(f'Deleting existing data for pair {pair}, {timeframe}, {candle_type}.')
-
-        data, since_ms, until_ms = _load_cached_data_for_updating(
-            pair, timeframe, timerange,
-            data_handler=data_handler,
-            candle_type=candle_type,
-            prepend=prepend)
-
-        logger.info(f'({process}) - Download history data for "{pair}", {timeframe}, '
-                    f'{candle_type} and store in {datadir}. '
-                    f'From {format_ms_time(since_ms) if since_ms else "start"} to '
-                    f'{format_ms_time(until_ms) if until_ms else "now"}'
-                    )
-
-        logger.debug("Current Start: %s",
-                     f"{data.iloc[0]['date']:%Y-%m-%d %H:%M:%S}" if not data.empty else 'None')
-        logger.debug("Current End: %s",
-                     f"{data.iloc[-1]['date']:%Y-%m-%d %H:%M:%S}" if not data.empty else 'None')
+        data, since_ms, until_ms = _prepare_pair_download(
+            pair, timeframe, candle_type, datadir=datadir, process=process,
+            new_pairs_days=new_pairs_days, data_handler=data_handler, timerange=timerange,
+            erase=erase, prepend=prepend)
 
-        # Default since_ms to 30 days if nothing is given
         new_data = exchange.get_historic_ohlcv(pair=pair,
                                                timeframe=timeframe,
-                                               since_ms=since_ms if since_ms else
-                                               arrow.utcnow().shift(
-                                                   days=-new_pairs_days).int_timestamp * 1000,
+                                               since_ms=since_ms,
                                                is_new_pair=data.empty,
                                                candle_type=candle_type,
-                                               until_ms=until_ms if until_ms else None
+                                               until_ms=until_ms
                                                )
-        # TODO: Maybe move parsing to exchange class (?)
-        new_dataframe = ohlcv_to_dataframe(new_data, timeframe, pair,
-                                           fill_missing=False, drop_incomplete=True)
-        if data.empty:
-            data = new_dataframe
-        else:
-            # Run cleaning again to ensure there were no duplicate candles
-            # Especially between existing and new data.
-            data = clean_ohlcv_dataframe(concat([data, new_dataframe], axis=0), timeframe, pair,
-                                         fill_missing=False, drop_incomplete=False)
-
-        logger.debug("New  Start: %s",
-                     f"{data.iloc[0]['date']:%Y-%m-%d %H:%M:%S}" if not data.empty else 'None')
-        logger.debug("New End: %s",
-                     f"{data.iloc[-1]['date']:%Y-%m-%d %H:%M:%S}" if not data.empty else 'None')
-
-        data_handler.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
+        _store_pair_download(pair, timeframe, candle_type, data, new_data,
+                             data_handler=data_handler)
         return True
 
     except Exception:
@@ -268,37 +246,155 @@ def _download_pair_history(pair: str, *,
         return False
 
 
+def _prepare_pair_download(pair: str, timeframe: str, candle_type: CandleType, *,
+                           datadir: Path,
+                           process: str,
+                           new_pairs_days: int,
+                           data_handler: IDataHandler,
+                           timerange: Optional[TimeRange],
+                           erase: bool,
+                           prepend: bool,
+                           ) -> Tuple[DataFrame, int, Optional[int]]:
+    """
+    Erase or load the stored data, and determine the range to download.
+    :return: Tuple of (stored data, since_ms, until_ms)
+    """
+    if erase:
+        if data_handler.ohlcv_purge(pair, timeframe, candle_type=candle_type):
+            logger.info(f'Deleting existing data for pair {pair}, {timeframe}, {candle_type}.')
+
+    data, since_ms, until_ms = _load_cached_data_for_updating(
+        pair, timeframe, timerange,
+        data_handler=data_handler,
+        candle_type=candle_type,
+        prepend=prepend)
+
+    logger.info(f'({process}) - Download history data for "{pair}", {timeframe}, '
+                f'{candle_type} and store in {datadir}. '
+                f'From {format_ms_time(since_ms) if since_ms else "start"} to '
+                f'{format_ms_time(until_ms) if until_ms else "now"}'
+                )
+
+    logger.debug("Current Start: %s",
+                 f"{data.iloc[0]['date']:%Y-%m-%d %H:%M:%S}" if not data.empty else 'None')
+    logger.debug("Current End: %s",
+                 f"{data.iloc[-1]['date']:%Y-%m-%d %H:%M:%S}" if not data.empty else 'None')
+
+    # Default since_ms to 30 days if nothing is given
+    if not since_ms:
+        since_ms = arrow.utcnow().shift(days=-new_pairs_days).int_timestamp * 1000
+    return data, since_ms, until_ms if until_ms else None
+
+
+def _store_pair_download(pair: str, timeframe: str, candle_type: CandleType,
+                         data: DataFrame, new_data: List, *,
+                         data_handler: IDataHandler) -> None:
+    """
+    Parse downloaded candles, merge them with the stored data and store the result.
+    """
+    # TODO: Maybe move parsing to exchange class (?)
+    new_dataframe = ohlcv_to_dataframe(new_data, timeframe, pair,
+                                       fill_missing=False, drop_incomplete=True)
+    if data.empty:
+        data = new_dataframe
+    else:
+        # Run cleaning again to ensure there were no duplicate candles
+        # Especially between existing and new data.
+        data = clean_ohlcv_dataframe(concat([data, new_dataframe], axis=0), timeframe, pair,
+                                     fill_missing=False, drop_incomplete=False)
+
+    logger.debug("New  Start: %s",
+                 f"{data.iloc[0]['date']:%Y-%m-%d %H:%M:%S}" if not data.empty else 'None')
+    logger.debug("New End: %s",
+                 f"{data.iloc[-1]['date']:%Y-%m-%d %H:%M:%S}" if not data.empty else 'None')
+
+    data_handler.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
+
+
+def _download_pairs_concurrently(jobs: List[Tuple[str, str, CandleType, str]], *,
+                                 datadir: Path,
+                                 exchange: Exchange,
+                                 data_handler: IDataHandler,
+                                 concurrency: int,
+                                 new_pairs_days: int = 30,
+                                 timerange: Optional[TimeRange] = None,
+                                 erase: bool = False,
+                                 prepend: bool = False,
+                                 ) -> None:
+    """
+    Download candles for multiple (pair, timeframe, candle_type) jobs concurrently.
+    Up to `concurrency` jobs download at the same time, sharing the exchange's rate limiter.
+    Loading, parsing and storing data runs in a separate thread, off the event loop.
+    Storage is serialized (one thread), as not all data formats support concurrent writes.
+    :param jobs: List of (pair, timeframe, candle_type, process)
+    :param concurrency: Maximum number of jobs downloading at the same time
+    """
+    loop = exchange.loop
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def download(executor: ThreadPoolExecutor, pair: str, timeframe: str,
+                       candle_type: CandleType, process: str) -> None:
+        async with semaphore:
+            try:
+                data, since_ms, until_ms = await loop.run_in_executor(
+                    executor, partial(
+                        _prepare_pair_download, pair, timeframe, candle_type, datadir=datadir,
+                        process=process, new_pairs_days=new_pairs_days,
+                        data_handler=data_handler, timerange=timerange, erase=erase,
+                        prepend=prepend))
+                _, _, _, new_data = await exchange._async_get_historic_ohlcv(
+                    pair=pair, timeframe=timeframe, since_ms=since_ms, until_ms=until_ms,
+                    is_new_pair=data.empty, candle_type=candle_type)
+                logger.info(f"Downloaded data for {pair}, {timeframe}, {candle_type} "
+                            f"with length {len(new_data)}.")
+            except Exception:
+                logger.exception(f'Failed to download history data for pair: "{pair}", '
+                                 f'timeframe: {timeframe}.')
+                return
+        # Storing happens outside of the semaphore - the next download can start meanwhile.
+        try:
+            await loop.run_in_executor(executor, partial(
+                _store_pair_download, pair, timeframe, candle_type, data, new_data,
+                data_handler=data_handler))
+        except Exception:
+            logger.exception(f'Failed to store history data for pair: "{pair}", '
+                             f'timeframe: {timeframe}.')
+
+    async def download_all() -> None:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            await asyncio.gather(*(download(executor, *job) for job in jobs))
+
+    loop.run_until_complete(download_all())
+
+
 def refresh_backtest_ohlcv_data(exchange: Exchange, pairs: List[str], timeframes: List[str],
                                 datadir: Path, trading_mode: str,
                                 timerange: Optional[TimeRange] = None,
                                 new_pairs_days: int = 30, erase: bool = False,
                                 data_format: str = None,
                                 prepend: bool = False,
+                                concurrency: int = 1,
                                 ) -> List[str]:
     """
     Refresh stored ohlcv data for backtesting and hyperopt operations.
     Used by freqtrade download-data subcommand.
+    :param concurrency: Number of (pair, timeframe, candle type) combinations to download
+                        concurrently. 1 downloads them one after the other.
     :return: List of pairs that are not available.
     """
     pairs_not_available = []
     data_handler = get_datahandler(datadir, data_format)
     candle_type = CandleType.get_default(trading_mode)
-    process = ''
+    # Jobs as (pair, timeframe, candle_type, process)
+    jobs: List[Tuple[str, str, CandleType, str]] = []
     for idx, pair in enumerate(pairs, start=1):
         if pair not in exchange.markets:
             pairs_not_available.append(pair)
             logger.info(f"Skipping pair {pair}...")
             continue
+        process = f'{idx}/{len(pairs)}'
         for timeframe in timeframes:
-
-            logger.info(f'Downloading pair {pair}, interval {timeframe}.')
-            process = f'{idx}/{len(pairs)}'
-            _download_pair_history(pair=pair, process=process,
-                                   datadir=datadir, exchange=exchange,
-                                   timerange=timerange, data_handler=data_handler,
-                                   timeframe=str(timeframe), new_pairs_days=new_pairs_days,
-                                   candle_type=candle_type,
-                                   erase=erase, prepend=prepend)
+            jobs.append((pair, str(timeframe), candle_type, process))
         if trading_mode == 'futures':
             # Predefined candletype (and timeframe) depending on exchange
             # Downloads what is necessary to backtest based on futures data.
@@ -307,12 +403,24 @@ def refresh_backtest_ohlcv_data(exchange: Exchange, pairs: List[str], timeframes
             # All exchanges need FundingRate for futures trading.
             # The timeframe is aligned to the mark-price timeframe.
             for funding_candle_type in (CandleType.FUNDING_RATE, fr_candle_type):
-                _download_pair_history(pair=pair, process=process,
-                                       datadir=datadir, exchange=exchange,
-                                       timerange=timerange, data_handler=data_handler,
-                                       timeframe=str(tf_mark), new_pairs_days=new_pairs_days,
-                                       candle_type=funding_candle_type,
-                                       erase=erase, prepend=prepend)
+                jobs.append((pair, str(tf_mark), funding_candle_type, process))
+
+    if concurrency > 1:
+        logger.info(f'Downloading {len(jobs)} datasets, {concurrency} concurrently.')
+        _download_pairs_concurrently(jobs, datadir=datadir, exchange=exchange,
+                                     data_handler=data_handler, concurrency=concurrency,
+                                     new_pairs_days=new_pairs_days, timerange=timerange,
+                                     erase=erase, prepend=prepend)
+    else:
+        for pair, timeframe, job_candle_type, process in jobs:
+            if job_candle_type == candle_type:
+                logger.info(f'Downloading pair {pair}, interval {timeframe}.')
+            _download_pair_history(pair=pair, process=process,
+                                   datadir=datadir, exchange=exchange,
+                                   timerange=timerange, data_handler=data_handler,
+                                   timeframe=timeframe, new_pairs_days=new_pairs_days,
+                                   candle_type=job_candle_type,
+                                   erase=erase, prepend=prepend)
 
     return pairs_not_available
 
@@ -144,6 +144,7 @@ class Edge:
             startup_candles=self.strategy.startup_candle_count,
             data_format=self.config.get('dataformat_ohlcv', 'json'),
             candle_type=self.config.get('candle_type_def', CandleType.SPOT),
+            workers=self.config.get('dataload_workers', 1),
         )
 
         if not data:
@@ -29,11 +29,13 @@ class Binance(Exchange):
         "trades_pagination": "id",
         "trades_pagination_arg": "fromId",
         "l2_limit_range": [5, 10, 20, 50, 100, 500, 1000],
-        "ccxt_futures_name": "future"
+        "ccxt_futures_name": "future",
+        "ws_url": "wss://stream.binance.com:9443/stream",
     }
     _ft_has_futures: Dict = {
         "stoploss_order_types": {"limit": "stop"},
         "tickers_have_price": False,
+        "ws_url": "wss://fstream.binance.com/stream",
     }
     _supported_trading_mode_margin_pairs: List[Tuple[TradingMode, MarginMode]] = [
         # TradingMode.SPOT always supported and not required in this list
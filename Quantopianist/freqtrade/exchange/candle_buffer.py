@@ -0,0 +1,127 @@
+"""
+Fixed-size candle window, updated incrementally.
+"""
+import logging
+from typing import List
+
+import numpy as np
+from pandas import DataFrame, to_datetime
+
+
+logger = logging.getLogger(__name__)
+
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+
+class CandleBuffer:
+    """
+    The most recent `maxlen` candles of one pair / timeframe.
+    Backed by arrays preallocated to twice the window size: new candles are written behind
+    the window, and the window is only moved back to the start of the arrays once the end
+    is reached - so appending candles neither reallocates nor rebuilds the window.
+    """
+
+    def __init__(self, dataframe: DataFrame, interval_ms: int, maxlen: int) -> None:
+        """
+        :param dataframe: Initial OHLCV dataframe
+        :param interval_ms: Timeframe in milliseconds
+        :param maxlen: Window size - the window grows up to this size if the initial
+            dataframe is shorter (e.g. newly listed pairs)
+        """
+        self._maxlen = max(maxlen, len(dataframe), 1)
+        self._interval_ns = interval_ms * 1_000_000
+        capacity = 2 * self._maxlen
+        self._dates = np.empty(capacity, dtype=np.int64)
+        self._values = np.empty((capacity, len(OHLCV_COLUMNS)), dtype=np.float64)
+        self._start = 0
+        self._end = len(dataframe)
+        self._dates[:self._end] = dataframe['date'].values.astype('datetime64[ns]').view(np.int64)
+        self._values[:self._end] = dataframe[OHLCV_COLUMNS].values
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def last_date_ms(self) -> int:
+        """
+        Date of the last candle in milliseconds, 0 if empty.
+        """
+        return int(self._dates[self._end - 1]) // 1_000_000 if len(self) else 0
+
+    def append(self, ticks: List[List]) -> int:
+        """
+        Append candles to the window. The last candle is updated if it's contained in `ticks`,
+        older candles are ignored. Missing candles are filled up
+        (like ohlcv_fill_up_missing_data - volume 0, prices at the previous close).
+        :param ticks: Candles in ccxt format ([date (ms), open, high, low, close, volume]),
+            in ascending order.
+        :return: Number of appended candles
+        """
+        if not ticks:
+            return 0
+        new = np.array(ticks, dtype=np.float64)
+        dates = new[:, 0].astype(np.int64) * 1_000_000
+        if len(self):
+            last_date = self._dates[self._end - 1]
+            same = dates == last_date
+            if same.any():
+                self._values[self._end - 1] = new[same][-1, 1:]
+            later = dates > last_date
+            new, dates = new[later], dates[later]
+            if not len(new):
+                return 0
+            first = last_date + self._interval_ns
+            prev_close = self._values[self._end - 1, 3]
+        else:
+            first = dates[0]
+            prev_close = new[0, 4]
+
+        count = int((dates[-1] - first) // self._interval_ns) + 1
+        values = new[:, 1:]
+        if count != len(new):
+            values = self._fill_missing(values, ((dates - first) // self._interval_ns), count,
+                                        prev_close)
+            dates = first + np.arange(count, dtype=np.int64) * self._interval_ns
+        self._write(dates, values)
+        return count
+
+    @staticmethod
+    def _fill_missing(values: np.ndarray, positions: np.ndarray, count: int,
+                      prev_close: float) -> np.ndarray:
+        filled = np.full((count, values.shape[1]), np.nan)
+        filled[positions] = values
+        # Forward-fill close, starting from the previous close
+        last_valid = np.where(np.isnan(filled[:, 3]), -1, np.arange(count))
+        last_valid = np.maximum.accumulate(last_valid)
+        close = np.where(last_valid >= 0, filled[np.maximum(last_valid, 0), 3], prev_close)
+        missing = np.isnan(filled[:, 3])
+        filled[missing, 0:4] = close[missing, None]
+        filled[missing, 4] = 0
+        return filled
+
+    def _write(self, dates: np.ndarray, values: np.ndarray) -> None:
+        count = len(dates)
+        if count >= self._maxlen:
+            self._start, self._end = 0, self._maxlen
+            self._dates[:self._maxlen] = dates[-self._maxlen:]
+            self._values[:self._maxlen] = values[-self._maxlen:]
+            return
+        if self._end + count > len(self._dates):
+            # Move the part of the window that's kept to the start of the arrays
+            keep = min(len(self), self._maxlen - count)
+            self._dates[:keep] = self._dates[self._end - keep:self._end].copy()
+            self._values[:keep] = self._values[self._end - keep:self._end].copy()
+            self._start, self._end = 0, keep
+        self._dates[self._end:self._end + count] = dates
+        self._values[self._end:self._end + count] = values
+        self._end += count
+        self._start = max(self._start, self._end - self._maxlen)
+
+    def to_dataframe(self) -> DataFrame:
+        """
+        Current window as OHLCV dataframe.
+        A copy (one memcpy) - buffer memory is reused, while dataframes may be held indefinitely.
+        """
+        df = DataFrame(self._values[self._start:self._end], columns=OHLCV_COLUMNS, copy=True)
+        df.insert(0, 'date', to_datetime(self._dates[self._start:self._end], unit='ns', utc=True))
+        return df
@@ -10,7 +10,7 @@ from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from math import ceil
 from threading import Lock
-from typing import Any, Coroutine, Dict, List, Literal, Optional, Tuple, Union
+from typing import Any, Callable, Coroutine, Dict, List, Literal, Optional, Tuple, Union
 
 import arrow
 import ccxt
@@ -23,14 +23,18 @@ from pandas import DataFrame
 from freqtrade.constants import (DEFAULT_AMOUNT_RESERVE_PERCENT, NON_OPEN_EXCHANGE_STATES, BuySell,
                                  EntryExit, ListPairsWithTimeframes, MakerTaker, PairWithTimeframe)
 from freqtrade.data.converter import ohlcv_to_dataframe, trades_dict_to_list
-from freqtrade.enums import OPTIMIZE_MODES, CandleType, MarginMode, TradingMode
+from freqtrade.enums import OPTIMIZE_MODES, TRADING_MODES, CandleType, MarginMode, TradingMode
 from freqtrade.exceptions import (DDosProtection, ExchangeError, InsufficientFundsError,
                                   InvalidOrderException, OperationalException, PricingError,
                                   RetryableOrderError, TemporaryError)
+from freqtrade.exchange.candle_buffer import CandleBuffer
 from freqtrade.exchange.common import (API_FETCH_ORDER_RETRY_COUNT, BAD_EXCHANGES,
                                        EXCHANGE_HAS_OPTIONAL, EXCHANGE_HAS_REQUIRED,
                                        SUPPORTED_EXCHANGES, remove_credentials, retrier,
                                        retrier_async)
+from freqtrade.exchange.historic_candle_cache import HistoricCandleCache
+from freqtrade.exchange.market_snapshot import MarketSnapshot
+from freqtrade.exchange.market_stream import MarketDataStream
 from freqtrade.misc import (chunks, deep_merge_dicts, file_dump_json, file_load_json,
                             safe_value_fallback2)
 from freqtrade.plugins.pairlist.pairlist_helpers import expand_pairlist
@@ -83,6 +87,7 @@ class Exchange:
         "fee_cost_in_contracts": False,  # Fee cost needs contract conversion
         "needs_trading_fees": False,  # use fetch_trading_fees to cache fees
         "order_props_in_contracts": ['amount', 'cost', 'filled', 'remaining'],
+        "ws_url": None,  # Combined market data stream, see market_stream.py
     }
     _ft_has: Dict = {}
     _ft_has_futures: Dict = {}
@@ -128,6 +133,16 @@ class Exchange:
 
         # Holds candles
         self._klines: Dict[PairWithTimeframe, DataFrame] = {}
+        # Candle windows backing _klines, for incremental refreshes
+        self._candle_buffers: Dict[PairWithTimeframe, CandleBuffer] = {}
+        # Candles downloaded for pairlist filters (see refresh_historic_ohlcv)
+        self._historic_candles = HistoricCandleCache()
+
+        # Tickers and order books of the current bot iteration (see refresh_market_snapshot)
+        self._market_snapshot = MarketSnapshot()
+
+        # Websocket market data - only used in live / dry-run mode (see _init_market_stream)
+        self._market_stream: Optional[MarketDataStream] = None
 
         # Holds all open sell orders for dry_run
         self._dry_run_open_orders: Dict[str, Any] = {}
@@ -193,6 +208,7 @@ class Exchange:
 
         if self.trading_mode != TradingMode.SPOT and load_leverage_tiers:
             self.fill_leverage_tiers()
+        self._init_market_stream(exchange_config)
         self.additional_exchange_init()
 
     def __del__(self):
@@ -203,11 +219,31 @@ class Exchange:
 
     def close(self):
         logger.debug("Exchange object destroyed, closing async loop")
+        if self._market_stream:
+            self._market_stream.stop()
+            self._market_stream = None
         if (self._api_async and inspect.iscoroutinefunction(self._api_async.close)
                 and self._api_async.session):
             logger.info("Closing async ccxt session.")
             self.loop.run_until_complete(self._api_async.close())
 
+    def _init_market_stream(self, exchange_config: Dict[str, Any]) -> None:
+        """
+        Start the websocket market data stream if enabled.
+        Candles, tickers and order books are then served from the stream where possible,
+        with REST calls as fallback (and for resyncs after disconnects).
+        """
+        if (not exchange_config.get('stream_market_data', False)
+                or self._config.get('runmode') not in TRADING_MODES):
+            return
+        url = exchange_config.get('stream_url', self._ft_has['ws_url'])
+        if not url:
+            logger.warning(f"Market data streaming is not supported for {self.name}.")
+            return
+        logger.info(f"Streaming market data from {url}.")
+        self._market_stream = MarketDataStream(url, exchange_config.get('stream_max_age', 10))
+        self._market_stream.start()
+
     def validate_config(self, config):
         # Check if timeframe is available
         self.validate_timeframes(config.get('timeframe'))
@@ -1203,6 +1239,48 @@ class Exchange:
     def fetch_stoploss_order(self, order_id: str, pair: str, params: Dict = {}) -> Dict:
         return self.fetch_order(order_id, pair, params)
 
+    def fetch_orders_concurrently(self, orders: List[Tuple[str, str, bool]]) -> Dict[str, Dict]:
+        """
+        Fetch multiple orders concurrently, using the async client.
+        Orders which couldn't be fetched are omitted - callers fall back to fetch_order()
+        (with its retries) for them. Dry-run orders are local, so nothing is fetched in dry-run.
+        :param orders: List of (order_id, pair, stoploss_order) tuples
+        :return: Dict of order_id -> order
+        """
+        if self._config['dry_run'] or not orders:
+            return {}
+        # Exchanges with a special stoploss order endpoint fetch these one by one.
+        stoploss_supported = (type(self).fetch_stoploss_order
+                              is Exchange.fetch_stoploss_order)
+        input_coroutines = [self._async_fetch_order(order_id, pair)
+                            for order_id, pair, stoploss_order in orders
+                            if stoploss_supported or not stoploss_order]
+
+        async def gather_orders():
+            return await asyncio.gather(*input_coroutines, return_exceptions=True)
+
+        with self._loop_lock:
+            results = self.loop.run_until_complete(gather_orders())
+
+        fetched = {}
+        for res in results:
+            if isinstance(res, Exception):
+                logger.info(f"Could not prefetch order: {repr(res)}")
+                continue
+            order_id, order = res
+            fetched[order_id] = order
+        return fetched
+
+    async def _async_fetch_order(self, order_id: str, pair: str) -> Tuple[str, Dict]:
+        try:
+            order = await self._api_async.fetch_order(order_id, pair)
+            self._log_exchange_response('fetch_order', order)
+            return order_id, self._order_contracts_to_amount(order)
+        except ccxt.BaseError as e:
+            raise TemporaryError(
+                f'Could not get order (pair: {pair} id: {order_id}) due to '
+                f'{e.__class__.__name__}. Message: {e}') from e
+
     def fetch_order_or_stoploss_order(self, order_id: str, pair: str,
                                       stoploss_order: bool = False) -> Dict:
         """
@@ -1472,6 +1550,14 @@ class Exchange:
         Returns a dict in the format
         {'asks': [price, volume], 'bids': [price, volume]}
         """
+        if self._market_stream:
+            order_book = self._market_stream.get_order_book(pair, limit)
+            if order_book:
+                return order_book
+            self._stream_subscribe_prices(pair)
+        order_book = self._market_snapshot.get_order_book(pair, limit)
+        if order_book:
+            return order_book
         limit1 = self.get_next_limit_in_list(limit, self._ft_has['l2_limit_range'],
                                              self._ft_has['l2_limit_range_required'])
         try:
@@ -1489,6 +1575,136 @@ class Exchange:
         except ccxt.BaseError as e:
             raise OperationalException(e) from e
 
+    def set_price_triggers(self, triggers: Dict[str, Tuple[float, float]],
+                           callback: Callable[[str], None]) -> bool:
+        """
+        Call `callback` (from the market data stream thread) once the price of a pair
+        leaves its range - replaces all previous triggers.
+        :param triggers: pair -> (lower price, upper price)
+        :param callback: Called with the pair
+        :return: False if no market data stream is running
+        """
+        if not self._market_stream:
+            return False
+        for pair in triggers:
+            self._stream_subscribe_prices(pair)
+        self._market_stream.set_price_triggers(triggers, callback)
+        return True
+
+    def _stream_subscribe_prices(self, pair: str) -> None:
+        if self._market_stream and pair in self.markets:
+            self._market_stream.subscribe_prices(pair, self.markets[pair]['id'])
+
+    def _fetch_pricing_ticker(self, pair: str) -> dict:
+        """
+        Ticker (bid, ask, last) used for pricing - from the market data stream or the market
+        snapshot if available, fetched from the exchange otherwise.
+        """
+        if self._market_stream:
+            ticker = self._market_stream.get_ticker(pair)
+            if ticker:
+                return ticker
+            self._stream_subscribe_prices(pair)
+        ticker = self._market_snapshot.get_ticker(pair)
+        if ticker:
+            return ticker
+        return self.fetch_ticker(pair)
+
+    def refresh_market_snapshot(self, pairs: List[str], order_book_pairs: List[str],
+                                order_book_limits: Optional[Dict[str, int]] = None) -> None:
+        """
+        Fetch tickers of `pairs` (in one call) and order books of `order_book_pairs`
+        (concurrently) for the current bot iteration.
+        Pricing, dry-run fills and fetch_l2_order_book() use them until the next refresh.
+        :param pairs: Pairs to fetch tickers for
+        :param order_book_pairs: Pairs to fetch order books for
+        :param order_book_limits: pair -> minimum order book depth, for order books needed
+            deeper than pricing requires (fetched in addition to `order_book_pairs`)
+        """
+        entry_pricing = self._config.get('entry_pricing', {})
+        exit_pricing = self._config.get('exit_pricing', {})
+        # Bids / asks (bookTicker) are lighter and more complete than tickers, but have no
+        # last price - which is only needed for price_last_balance.
+        needs_last = (entry_pricing.get('price_last_balance', 0.0)
+                      or exit_pricing.get('price_last_balance', 0.0))
+        ticker_method = None
+        if pairs and not (entry_pricing.get('use_order_book', False)
+                          and exit_pricing.get('use_order_book', False)):
+            if self.exchange_has('fetchBidsAsks') and not needs_last:
+                ticker_method = 'fetch_bids_asks'
+            elif self.exchange_has('fetchTickers'):
+                ticker_method = 'fetch_tickers'
+        order_book_limit = max(
+            entry_pricing.get('order_book_top', 1) if entry_pricing.get('use_order_book') else 1,
+            exit_pricing.get('order_book_top', 1) if exit_pricing.get('use_order_book') else 1,
+            # Dry-run market order fill price
+            20 if self._config['dry_run'] else 1,
+        )
+        limits = {pair: order_book_limit for pair in order_book_pairs}
+        for pair, limit in (order_book_limits or {}).items():
+            limits[pair] = max(limits.get(pair, 0), limit)
+        if not self.exchange_has('fetchL2OrderBook'):
+            limits = {}
+
+        input_coroutines = [self._async_fetch_l2_order_book(pair, limit)
+                            for pair, limit in limits.items()]
+        if ticker_method:
+            input_coroutines.append(self._async_fetch_tickers(ticker_method, pairs))
+
+        async def gather_snapshot():
+            return await asyncio.gather(*input_coroutines, return_exceptions=True)
+
+        with self._loop_lock:
+            results = self.loop.run_until_complete(gather_snapshot())
+
+        tickers: Dict[str, Dict] = {}
+        order_books: Dict[str, Dict] = {}
+        for res in results:
+            if isinstance(res, Exception):
+                logger.warning(f"Could not refresh market snapshot: {repr(res)}")
+            elif 'bids' in res:
+                order_books[res['symbol']] = res
+            else:
+                tickers = res
+        if needs_last:
+            tickers = {pair: t for pair, t in tickers.items() if t.get('last') is not None}
+        self._market_snapshot.update(tickers, order_books,
+                                     {pair: limits.get(pair, 0) for pair in order_books})
+
+    def clear_market_snapshot(self) -> None:
+        self._market_snapshot.clear()
+
+    @retrier_async
+    async def _async_fetch_tickers(self, method: str, pairs: List[str]) -> Dict[str, Dict]:
+        """
+        :param method: 'fetch_tickers' or 'fetch_bids_asks'
+        """
+        try:
+            return await getattr(self._api_async, method)(pairs)
+        except ccxt.DDoSProtection as e:
+            raise DDosProtection(e) from e
+        except (ccxt.NetworkError, ccxt.ExchangeError) as e:
+            raise TemporaryError(
+                f'Could not load tickers due to {e.__class__.__name__}. Message: {e}') from e
+        except ccxt.BaseError as e:
+            raise OperationalException(e) from e
+
+    @retrier_async
+    async def _async_fetch_l2_order_book(self, pair: str, limit: int) -> Dict:
+        limit1 = self.get_next_limit_in_list(limit, self._ft_has['l2_limit_range'],
+                                             self._ft_has['l2_limit_range_required'])
+        try:
+            order_book = await self._api_async.fetch_l2_order_book(pair, limit1)
+            order_book['symbol'] = pair
+            return order_book
+        except ccxt.DDoSProtection as e:
+            raise DDosProtection(e) from e
+        except (ccxt.NetworkError, ccxt.ExchangeError) as e:
+            raise TemporaryError(
+                f'Could not get order book due to {e.__class__.__name__}. Message: {e}') from e
+        except ccxt.BaseError as e:
+            raise OperationalException(e) from e
+
     def _get_price_side(self, side: str, is_short: bool, conf_strategy: Dict) -> str:
         price_side = conf_strategy['price_side']
 
@@ -1558,7 +1774,7 @@ class Exchange:
         else:
             logger.debug(f"Using Last {price_side_word} / Last Price")
             if ticker is None:
-                ticker = self.fetch_ticker(pair)
+                ticker = self._fetch_pricing_ticker(pair)
             ticker_rate = ticker[price_side]
             if ticker['last'] and ticker_rate:
                 if side == 'entry' and ticker_rate > ticker['last']:
@@ -1597,7 +1813,7 @@ class Exchange:
             order_book = self.fetch_l2_order_book(pair, order_book_top)
             entry_rate = self.get_rate(pair, refresh, 'entry', is_short, order_book=order_book)
         elif not entry_rate:
-            ticker = self.fetch_ticker(pair)
+            ticker = self._fetch_pricing_ticker(pair)
             entry_rate = self.get_rate(pair, refresh, 'entry', is_short, ticker=ticker)
         if not exit_rate:
             exit_rate = self.get_rate(pair, refresh, 'exit',
@@ -1861,6 +2077,8 @@ class Exchange:
         Refresh in-memory OHLCV asynchronously and set `_klines` with the result
         Loops asynchronously over pair_list and downloads all pairs async (semi-parallel).
         Only used in the dataprovider.refresh() method.
+        Cached pairs are refreshed incrementally - only candles since the last cached candle
+        are downloaded and appended to the cached window (see CandleBuffer).
         :param pair_list: List of 2 element tuples containing pair, interval to refresh
         :param since_ms: time since when to download, in milliseconds
         :param cache: Assign result to _klines. Usefull for one-off downloads like for pairlists
@@ -1872,6 +2090,8 @@ class Exchange:
         drop_incomplete = self._ohlcv_partial_candle if drop_incomplete is None else drop_incomplete
         input_coroutines = []
         cached_pairs = []
+        incremental = set()
+        results_df = {}
         # Gather coroutines to run
         for pair, timeframe, candle_type in set(pair_list):
             if (timeframe not in self.timeframes
@@ -1883,6 +2103,19 @@ class Exchange:
                 continue
             if ((pair, timeframe, candle_type) not in self._klines or not cache
                     or self._now_is_time_to_refresh(pair, timeframe, candle_type)):
+                if (cache and drop_incomplete
+                        and self._append_streamed_candles(pair, timeframe, candle_type)):
+                    results_df[(pair, timeframe, candle_type)] = self.klines(
+                        (pair, timeframe, candle_type), copy=False)
+                    continue
+                incremental_since = (self._incremental_since_ms(pair, timeframe, candle_type)
+                                     if cache and since_ms is None else None)
+                if incremental_since:
+                    # Only download candles since the last cached candle
+                    incremental.add((pair, timeframe, candle_type))
+                    input_coroutines.append(self._async_get_candle_history(
+                        pair, timeframe, candle_type=candle_type, since_ms=incremental_since))
+                    continue
                 input_coroutines.append(self._build_coroutine(
                     pair, timeframe, candle_type=candle_type, since_ms=since_ms))
 
@@ -1892,7 +2125,6 @@ class Exchange:
                 )
                 cached_pairs.append((pair, timeframe, candle_type))
 
-        results_df = {}
         # Chunk requests into batches of 100 to avoid overwelming ccxt Throttling
         for input_coro in chunks(input_coroutines, 100):
             async def gather_stuff():
@@ -1910,13 +2142,24 @@ class Exchange:
                 # keeping last candle time as last refreshed time of the pair
                 if ticks:
                     self._pairs_last_refresh_time[(pair, timeframe, c_type)] = ticks[-1][0] // 1000
+                if (pair, timeframe, c_type) in incremental:
+                    buffer = self._candle_buffers[(pair, timeframe, c_type)]
+                    buffer.append(ticks[:-1] if drop_incomplete else ticks)
+                    ohlcv_df = buffer.to_dataframe()
+                else:
+                    ohlcv_df = ohlcv_to_dataframe(
+                        ticks, timeframe, pair=pair, fill_missing=True,
+                        drop_incomplete=drop_incomplete)
+                    if cache and not ohlcv_df.empty:
+                        self._candle_buffers[(pair, timeframe, c_type)] = CandleBuffer(
+                            ohlcv_df, timeframe_to_msecs(timeframe),
+                            self.ohlcv_candle_limit(timeframe, c_type)
+                            * self.required_candle_call_count)
                 # keeping parsed dataframe in cache
-                ohlcv_df = ohlcv_to_dataframe(
-                    ticks, timeframe, pair=pair, fill_missing=True,
-                    drop_incomplete=drop_incomplete)
                 results_df[(pair, timeframe, c_type)] = ohlcv_df
                 if cache:
                     self._klines[(pair, timeframe, c_type)] = ohlcv_df
+                    self._stream_subscribe_candles(pair, timeframe, c_type)
         # Return cached klines
         for pair, timeframe, c_type in cached_pairs:
             results_df[(pair, timeframe, c_type)] = self.klines(
@@ -1926,6 +2169,101 @@ class Exchange:
 
         return results_df
 
+    def refresh_historic_ohlcv(self, pair_list: ListPairsWithTimeframes, since_ms: int
+                               ) -> Dict[PairWithTimeframe, DataFrame]:
+        """
+        Candles since `since_ms`, for pairlist filters.
+        Downloads are shared between all filters and whitelist refreshes (see
+        HistoricCandleCache) - only candles which aren't cached yet are downloaded.
+        :param pair_list: List of (pair, timeframe, candle_type) tuples
+        :param since_ms: time since when candles are needed, in milliseconds
+        :return: Dict of [{(pair, timeframe, candle_type): Dataframe}].
+            Pairs which couldn't be downloaded are missing.
+        """
+        now_ms = arrow.utcnow().int_timestamp * 1000
+        input_coroutines = []
+        for pair, timeframe, candle_type in set(pair_list):
+            fetch_since = self._historic_candles.fetch_since(
+                (pair, timeframe, candle_type), since_ms, now_ms)
+            if fetch_since is not None:
+                input_coroutines.append(self._build_coroutine(
+                    pair, timeframe, candle_type=candle_type, since_ms=fetch_since))
+        if input_coroutines:
+            logger.debug(f"Downloading historic candles for {len(input_coroutines)} pairs, "
+                         f"{len(set(pair_list)) - len(input_coroutines)} cached.")
+
+        for input_coro in chunks(input_coroutines, 100):
+            async def gather_stuff():
+                return await asyncio.gather(*input_coro, return_exceptions=True)
+
+            with self._loop_lock:
+                results = self.loop.run_until_complete(gather_stuff())
+
+            for res in results:
+                if isinstance(res, Exception):
+                    logger.warning(f"Async code raised an exception: {repr(res)}")
+                    continue
+                pair, timeframe, c_type, ticks = res
+                self._historic_candles.update((pair, timeframe, c_type), since_ms, ticks,
+                                              self._ohlcv_partial_candle, now_ms)
+
+        results_df = {}
+        for key in pair_list:
+            candles = self._historic_candles.get(key, since_ms)
+            if candles is not None:
+                results_df[key] = candles
+        return results_df
+
+    def _stream_subscribe_candles(self, pair: str, timeframe: str,
+                                  candle_type: CandleType) -> None:
+        if (self._market_stream and pair in self.markets
+                and candle_type in (CandleType.SPOT, CandleType.FUTURES)):
+            self._market_stream.subscribe_candles(pair, self.markets[pair]['id'], timeframe)
+
+    def _append_streamed_candles(self, pair: str, timeframe: str,
+                                 candle_type: CandleType) -> bool:
+        """
+        Append candles closed since the last refresh, as received by the market data stream,
+        to the cached candles.
+        :return: True if the cached candles are up to date,
+            False if they need to be refreshed via REST.
+        """
+        if not self._market_stream or candle_type not in (CandleType.SPOT, CandleType.FUTURES):
+            return False
+        candles = self._market_stream.pop_closed_candles(pair, timeframe)
+        buffer = self._candle_buffers.get((pair, timeframe, candle_type))
+        if not candles or buffer is None:
+            return False
+        interval_ms = timeframe_to_msecs(timeframe)
+        if candles[0][0] > buffer.last_date_ms + interval_ms:
+            # Gap between cached and streamed candles - resync via REST
+            return False
+        buffer.append(candles)
+        self._klines[(pair, timeframe, candle_type)] = buffer.to_dataframe()
+        # Next candle to close opens one interval after the last closed candle
+        self._pairs_last_refresh_time[(pair, timeframe, candle_type)] = (
+            candles[-1][0] + interval_ms) // 1000
+        logger.debug(f"Appended {len(candles)} streamed candles to {pair}, {timeframe}, "
+                     f"{candle_type}.")
+        return True
+
+    def _incremental_since_ms(self, pair: str, timeframe: str,
+                              candle_type: CandleType) -> Optional[int]:
+        """
+        Start date for an incremental refresh of cached candles - the date of the last
+        cached candle, so it's updated as well.
+        :return: since_ms, or None if all candles need to be downloaded
+        """
+        buffer = self._candle_buffers.get((pair, timeframe, candle_type))
+        if buffer is None or not len(buffer) or not self._ft_has['ohlcv_has_history']:
+            return None
+        since_ms = buffer.last_date_ms
+        missing = (arrow.utcnow().int_timestamp * 1000 - since_ms) // timeframe_to_msecs(timeframe)
+        if missing >= self.ohlcv_candle_limit(timeframe, candle_type, since_ms):
+            # Too far behind for one call
+            return None
+        return since_ms
+
     def _now_is_time_to_refresh(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
         # Timeframe in seconds
         interval_in_sec = timeframe_to_seconds(timeframe)
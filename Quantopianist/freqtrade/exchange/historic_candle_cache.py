@@ -0,0 +1,91 @@
+"""
+Historic candles for pairlist filters, shared between filters and whitelist refreshes.
+"""
+import logging
+from typing import Dict, List, Optional
+
+import ccxt
+from pandas import DataFrame, concat, to_datetime
+
+from freqtrade.constants import PairWithTimeframe
+from freqtrade.data.converter import ohlcv_to_dataframe
+
+
+logger = logging.getLogger(__name__)
+
+
+class _CachedCandles:
+    """
+    Candles of one pair / timeframe / candle type, complete from `since_ms` on.
+    """
+    __slots__ = ('dataframe', 'since_ms', 'lookback_ms', 'fetched_ms')
+
+    def __init__(self, dataframe: DataFrame, since_ms: int, lookback_ms: int,
+                 fetched_ms: int) -> None:
+        self.dataframe = dataframe
+        self.since_ms = since_ms
+        self.lookback_ms = lookback_ms
+        self.fetched_ms = fetched_ms
+
+
+class HistoricCandleCache:
+    """
+    Caches the candles downloaded for pairlist filters (AgeFilter, VolatilityFilter, ...).
+    A request is served from the cache if the cached candles reach back far enough -
+    so filters with the same or a shorter lookback don't download again, and later refreshes
+    only download the candles closed since the last one cached (see fetch_since()).
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[PairWithTimeframe, _CachedCandles] = {}
+
+    def fetch_since(self, key: PairWithTimeframe, since_ms: int, now_ms: int) -> Optional[int]:
+        """
+        Date to download candles from, to serve a request for candles since `since_ms`.
+        :return: None if the cache is up to date, the last cached candle's date if only
+            newer candles are missing, or `since_ms` if the cache doesn't reach back far enough.
+        """
+        entry = self._entries.get(key)
+        if entry is None or since_ms < entry.since_ms:
+            return since_ms
+        interval_ms = ccxt.Exchange.parse_timeframe(key[1]) * 1000
+        if entry.dataframe.empty:
+            return since_ms if now_ms >= entry.fetched_ms + interval_ms else None
+        last_ms = int(entry.dataframe['date'].iloc[-1].timestamp() * 1000)
+        # A newer closed candle exists once the candle after the last one closed
+        return last_ms if now_ms >= last_ms + 2 * interval_ms else None
+
+    def update(self, key: PairWithTimeframe, since_ms: int, ticks: List[List],
+               drop_incomplete: bool, now_ms: int) -> None:
+        """
+        Store downloaded candles.
+        :param since_ms: Start date of the request the candles were downloaded for
+        :param ticks: Candles downloaded from the date returned by fetch_since()
+        """
+        pair, timeframe, _ = key
+        new_df = ohlcv_to_dataframe(ticks, timeframe, pair=pair, fill_missing=True,
+                                    drop_incomplete=drop_incomplete)
+        entry = self._entries.get(key)
+        if entry is None or since_ms < entry.since_ms:
+            lookback_ms = max(now_ms - since_ms, entry.lookback_ms if entry else 0)
+            self._entries[key] = _CachedCandles(new_df, since_ms, lookback_ms, now_ms)
+            return
+
+        # Appending the newest candles - the last cached candle is replaced
+        df = concat([entry.dataframe, new_df]).drop_duplicates(subset=['date'], keep='last')
+        # Keep twice the longest lookback requested, so the cache doesn't grow indefinitely
+        entry.since_ms = max(entry.since_ms, now_ms - 2 * entry.lookback_ms)
+        df = df[df['date'] >= to_datetime(entry.since_ms, unit='ms', utc=True)]
+        entry.dataframe = df.reset_index(drop=True)
+        entry.fetched_ms = now_ms
+
+    def get(self, key: PairWithTimeframe, since_ms: int) -> Optional[DataFrame]:
+        """
+        Cached candles since `since_ms`, None if not cached.
+        Returns a copy, filters may add columns.
+        """
+        entry = self._entries.get(key)
+        if entry is None or since_ms < entry.since_ms:
+            return None
+        df = entry.dataframe
+        return df[df['date'] >= to_datetime(since_ms, unit='ms', utc=True)].reset_index(drop=True)
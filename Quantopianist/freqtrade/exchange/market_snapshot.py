@@ -0,0 +1,66 @@
+"""
+Tickers and order books, fetched in batch once per bot iteration.
+"""
+import logging
+import time
+from typing import Dict, Optional
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds after which snapshot data is no longer used
+SNAPSHOT_MAX_AGE = 30
+
+
+class MarketSnapshot:
+    """
+    Holds the tickers and order books of one bot iteration.
+    Contents are replaced as a whole by update(), so readers in other threads (RPC) always
+    see one consistent snapshot.
+    """
+
+    def __init__(self, max_age: float = SNAPSHOT_MAX_AGE) -> None:
+        self._max_age = max_age
+        self._tickers: Dict[str, Dict] = {}
+        self._order_books: Dict[str, Dict] = {}
+        self._order_book_limits: Dict[str, int] = {}
+        self._timestamp = 0.0
+
+    def update(self, tickers: Dict[str, Dict], order_books: Dict[str, Dict],
+               order_book_limits: Dict[str, int]) -> None:
+        """
+        :param tickers: pair -> ticker. Only tickers with bid and ask are kept.
+        :param order_books: pair -> order book
+        :param order_book_limits: pair -> number of levels the order book was fetched with
+        """
+        self._tickers = {pair: ticker for pair, ticker in tickers.items()
+                         if ticker.get('bid') is not None and ticker.get('ask') is not None}
+        self._order_books = order_books
+        self._order_book_limits = order_book_limits
+        self._timestamp = time.time()
+
+    def clear(self) -> None:
+        self._tickers = {}
+        self._order_books = {}
+        self._order_book_limits = {}
+        self._timestamp = 0.0
+
+    def _is_fresh(self) -> bool:
+        return time.time() - self._timestamp <= self._max_age
+
+    def get_ticker(self, pair: str) -> Optional[Dict]:
+        if not self._is_fresh():
+            return None
+        return self._tickers.get(pair)
+
+    def get_order_book(self, pair: str, limit: int) -> Optional[Dict]:
+        """
+        Order book of pair, if it was fetched with at least `limit` levels.
+        """
+        if limit > self._order_book_limits.get(pair, 0) or not self._is_fresh():
+            return None
+        order_book = self._order_books.get(pair)
+        if order_book is None:
+            return None
+        return {**order_book, 'bids': order_book['bids'][:limit],
+                'asks': order_book['asks'][:limit]}
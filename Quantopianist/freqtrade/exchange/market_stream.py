@@ -0,0 +1,265 @@
+"""
+Streaming market data (websocket) for the live bot.
+
+Keeps closed candles, best bid / ask and top order book levels of subscribed pairs
+up to date in a background thread, so the exchange class can serve them without REST calls.
+Stream data is only used while it is fresh - REST calls remain the fallback.
+
+Uses the binance combined stream protocol (`/stream` endpoint, SUBSCRIBE messages).
+"""
+import asyncio
+import json
+import logging
+import time
+from threading import Lock, Thread
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+import aiohttp
+
+
+logger = logging.getLogger(__name__)
+
+# Number of order book levels subscribed to (partial book depth stream)
+ORDER_BOOK_DEPTH = 20
+# Seconds to wait before reconnecting after the connection was lost
+RECONNECT_DELAY = 5
+
+
+class MarketDataStream:
+    """
+    Websocket market data feed, running its own event loop in a daemon thread.
+    Subscriptions are added with `subscribe_*()`, data is read with the getters -
+    all methods are safe to call from any thread.
+    """
+
+    def __init__(self, url: str, max_age: float = 10) -> None:
+        """
+        :param url: Combined stream websocket url
+        :param max_age: Seconds after which tickers and order books are considered stale
+        """
+        self._url = url
+        self._max_age = max_age
+        self._lock = Lock()
+        self._loop = asyncio.new_event_loop()
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._connected = False
+        self._running = False
+        self._thread: Optional[Thread] = None
+        self._request_id = 0
+
+        # Stream name -> pair
+        self._streams: Dict[str, str] = {}
+        # (pair, timeframe) -> closed candles [date (ms), open, high, low, close, volume],
+        # received since the last call to pop_closed_candles()
+        self._candles: Dict[Tuple[str, str], List[List]] = {}
+        # Candle subscriptions which received all closed candles since their subscription
+        self._candles_complete: Set[Tuple[str, str]] = set()
+        # pair -> ticker dict (bid, ask, bidVolume, askVolume, last, timestamp)
+        self._tickers: Dict[str, Dict] = {}
+        # pair -> order book dict (bids, asks, timestamp)
+        self._order_books: Dict[str, Dict] = {}
+        # pair -> (lower, upper) price - see set_price_triggers()
+        self._price_triggers: Dict[str, Tuple[float, float]] = {}
+        self._price_callback: Optional[Callable[[str], None]] = None
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._thread = Thread(target=self._run, name='market-data-stream', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._running = False
+        if self._ws is not None and self._loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._ws.close(), self._loop)
+        if self._thread:
+            self._thread.join(timeout=RECONNECT_DELAY)
+
+    def subscribe_candles(self, pair: str, market_id: str, timeframe: str) -> None:
+        """
+        Subscribe to closed candles of pair / timeframe.
+        Candles are only reported as complete (see pop_closed_candles()) after the
+        first candle closed while subscribed.
+        """
+        stream = f"{market_id.lower()}@kline_{timeframe}"
+        with self._lock:
+            if stream in self._streams:
+                return
+            self._candles.setdefault((pair, timeframe), [])
+        self._subscribe({stream: pair})
+
+    def subscribe_prices(self, pair: str, market_id: str) -> None:
+        """
+        Subscribe to best bid / ask, last price and top order book levels of pair.
+        """
+        symbol = market_id.lower()
+        streams = {f"{symbol}@bookTicker": pair, f"{symbol}@miniTicker": pair,
+                   f"{symbol}@depth{ORDER_BOOK_DEPTH}@100ms": pair}
+        with self._lock:
+            streams = {s: p for s, p in streams.items() if s not in self._streams}
+        if streams:
+            self._subscribe(streams)
+
+    def set_price_triggers(self, triggers: Dict[str, Tuple[float, float]],
+                           callback: Callable[[str], None]) -> None:
+        """
+        Call `callback` with the pair once its bid falls to the lower price
+        or its ask rises to the upper price. Triggers fire once, and replace previous triggers.
+        """
+        with self._lock:
+            self._price_triggers = dict(triggers)
+            self._price_callback = callback
+
+    def pop_closed_candles(self, pair: str, timeframe: str) -> Optional[List[List]]:
+        """
+        Closed candles received since the last call, in ascending order.
+        None if the stream can't guarantee completeness (not connected, or no candle
+        closed since subscribing) - the caller must use REST in that case.
+        """
+        with self._lock:
+            key = (pair, timeframe)
+            if not self._connected or key not in self._candles_complete:
+                return None
+            candles = self._candles[key]
+            self._candles[key] = []
+        return candles
+
+    def get_ticker(self, pair: str) -> Optional[Dict]:
+        """
+        Latest ticker (bid, ask, last) of pair, or None if not available or stale.
+        """
+        with self._lock:
+            ticker = self._tickers.get(pair)
+            if (not self._connected or not ticker or ticker.get('last') is None
+                    or ticker.get('bid') is None or self._is_stale(ticker)):
+                return None
+            return dict(ticker)
+
+    def get_order_book(self, pair: str, limit: int) -> Optional[Dict]:
+        """
+        Latest order book of pair with at least `limit` levels,
+        or None if not available, stale or not deep enough.
+        """
+        if limit > ORDER_BOOK_DEPTH:
+            return None
+        with self._lock:
+            book = self._order_books.get(pair)
+            if not self._connected or not book or self._is_stale(book):
+                return None
+            return {'symbol': pair, 'bids': book['bids'][:limit], 'asks': book['asks'][:limit],
+                    'timestamp': book['timestamp'], 'nonce': None}
+
+    def _is_stale(self, item: Dict) -> bool:
+        return item['timestamp'] < (time.time() - self._max_age) * 1000
+
+    def _subscribe(self, streams: Dict[str, str]) -> None:
+        with self._lock:
+            self._streams.update(streams)
+        if self._connected:
+            asyncio.run_coroutine_threadsafe(self._send_subscribe(list(streams)), self._loop)
+
+    async def _send_subscribe(self, streams: List[str]) -> None:
+        if not streams or self._ws is None:
+            return
+        self._request_id += 1
+        await self._ws.send_str(json.dumps(
+            {'method': 'SUBSCRIBE', 'params': streams, 'id': self._request_id}))
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._connect_loop())
+
+    async def _connect_loop(self) -> None:
+        async with aiohttp.ClientSession() as session:
+            while self._running:
+                try:
+                    async with session.ws_connect(self._url, heartbeat=30) as ws:
+                        self._ws = ws
+                        logger.info(f"Market data stream connected to {self._url}.")
+                        with self._lock:
+                            streams = list(self._streams)
+                        self._connected = True
+                        await self._send_subscribe(streams)
+                        async for msg in ws:
+                            if msg.type == aiohttp.WSMsgType.TEXT:
+                                self._handle_message(json.loads(msg.data))
+                            elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                                break
+                except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                    logger.warning(f"Market data stream error: {e}")
+                finally:
+                    self._on_disconnect()
+                if self._running:
+                    await asyncio.sleep(RECONNECT_DELAY)
+
+    def _on_disconnect(self) -> None:
+        """
+        Candles may have been missed while disconnected - require a REST resync.
+        """
+        with self._lock:
+            if self._connected and self._running:
+                logger.warning("Market data stream disconnected, falling back to REST.")
+            self._connected = False
+            self._ws = None
+            self._candles_complete.clear()
+            for key in self._candles:
+                self._candles[key] = []
+
+    def _handle_message(self, message: Dict) -> None:
+        stream = message.get('stream')
+        data = message.get('data')
+        if not stream or not isinstance(data, dict):
+            # Subscription responses
+            return
+        triggered = None
+        with self._lock:
+            pair = self._streams.get(stream)
+            if pair is None:
+                return
+            kind = stream.split('@', 1)[1]
+            now = int(time.time() * 1000)
+            if kind.startswith('kline_'):
+                self._handle_kline(pair, data['k'])
+            elif kind == 'bookTicker':
+                ticker = self._tickers.setdefault(pair, {'symbol': pair, 'last': None})
+                ticker.update({'bid': float(data['b']), 'bidVolume': float(data['B']),
+                               'ask': float(data['a']), 'askVolume': float(data['A']),
+                               'timestamp': now})
+                if self._check_price_trigger(pair, ticker['bid'], ticker['ask']):
+                    triggered = pair
+            elif kind == 'miniTicker':
+                ticker = self._tickers.setdefault(pair, {'symbol': pair, 'bid': None,
+                                                         'ask': None})
+                ticker.update({'last': float(data['c']), 'timestamp': now})
+            elif kind.startswith('depth'):
+                # Spot uses bids / asks, futures b / a
+                self._order_books[pair] = {
+                    'bids': [[float(p), float(a)] for p, a in data.get('bids', data.get('b', []))],
+                    'asks': [[float(p), float(a)] for p, a in data.get('asks', data.get('a', []))],
+                    'timestamp': now,
+                }
+        if triggered and self._price_callback:
+            self._price_callback(triggered)
+
+    def _check_price_trigger(self, pair: str, bid: float, ask: float) -> bool:
+        trigger = self._price_triggers.get(pair)
+        if trigger is None or trigger[0] < bid and ask < trigger[1]:
+            return False
+        del self._price_triggers[pair]
+        return True
+
+    def _handle_kline(self, pair: str, kline: Dict) -> None:
+        if not kline['x']:
+            # Candle not closed yet
+            return
+        key = (pair, kline['i'])
+        if key not in self._candles:
+            return
+        self._candles[key].append([kline['t'], float(kline['o']), float(kline['h']),
+                                   float(kline['l']), float(kline['c']), float(kline['v'])])
+        self._candles_complete.add(key)
@@ -6,7 +6,7 @@ import logging
 import traceback
 from datetime import datetime, time, timedelta, timezone
 from math import isclose
-from threading import Lock
+from threading import Event, Lock
 from typing import Any, Dict, List, Optional, Tuple
 
 from schedule import Scheduler
@@ -25,7 +25,7 @@ from freqtrade.exchange import timeframe_to_minutes, timeframe_to_seconds
 from freqtrade.exchange.exchange import timeframe_to_next_date
 from freqtrade.misc import safe_value_fallback, safe_value_fallback2
 from freqtrade.mixins import LoggingMixin
-from freqtrade.persistence import Order, PairLocks, Trade, init_db
+from freqtrade.persistence import IterationSnapshot, Order, PairLocks, Trade, init_db
 from freqtrade.plugins.pairlistmanager import PairListManager
 from freqtrade.plugins.protectionmanager import ProtectionManager
 from freqtrade.resolvers import ExchangeResolver, StrategyResolver
@@ -38,6 +38,9 @@ from freqtrade.wallets import Wallets
 
 logger = logging.getLogger(__name__)
 
+# Order book depth used for the depth of market check
+DEPTH_OF_MARKET_LIMIT = 1000
+
 
 class FreqtradeBot(LoggingMixin):
     """
@@ -103,6 +106,9 @@ class FreqtradeBot(LoggingMixin):
 
         # Protect exit-logic from forcesell and vice versa
         self._exit_lock = Lock()
+        # Event-driven scheduler (see Worker): wakes the worker early on market data events
+        self.wakeup = Event()
+        self.analysis_requested = False
         LoggingMixin.__init__(self, logger, timeframe_to_seconds(self.strategy.timeframe))
 
         self.trading_mode: TradingMode = self.config.get('trading_mode', TradingMode.SPOT)
@@ -150,6 +156,7 @@ class FreqtradeBot(LoggingMixin):
         self.check_for_open_trades()
 
         self.rpc.cleanup()
+        self.strategy.ft_bot_cleanup()
         Trade.commit()
         self.exchange.close()
 
@@ -175,50 +182,139 @@ class FreqtradeBot(LoggingMixin):
         otherwise a new trade is created.
         :return: True if one or more trades has been created or closed, False otherwise
         """
+        IterationSnapshot.begin()
+        try:
+            # Check whether markets have to be reloaded and reload them when it's needed
+            self.exchange.reload_markets()
 
-        # Check whether markets have to be reloaded and reload them when it's needed
-        self.exchange.reload_markets()
+            self.update_closed_trades_without_assigned_fees()
 
-        self.update_closed_trades_without_assigned_fees()
+            # Query trades from persistence layer
+            trades = Trade.get_open_trades()
 
-        # Query trades from persistence layer
-        trades = Trade.get_open_trades()
+            self.active_pair_whitelist = self._refresh_active_whitelist(trades)
 
-        self.active_pair_whitelist = self._refresh_active_whitelist(trades)
+            # Refreshing candles
+            self.dataprovider.refresh(self.pairlists.create_pair_list(self.active_pair_whitelist),
+                                      self.strategy.gather_informative_pairs())
 
-        # Refreshing candles
-        self.dataprovider.refresh(self.pairlists.create_pair_list(self.active_pair_whitelist),
-                                  self.strategy.gather_informative_pairs())
+            strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)()
 
-        strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)()
+            self.strategy.analyze(self.active_pair_whitelist)
 
-        self.strategy.analyze(self.active_pair_whitelist)
+            if self.config['exchange'].get('market_snapshot', False):
+                self._refresh_market_snapshot(trades)
 
-        with self._exit_lock:
-            # Check for exchange cancelations, timeouts and user requested replace
-            self.manage_open_orders()
+            with self._exit_lock:
+                # Check for exchange cancelations, timeouts and user requested replace
+                self.manage_open_orders()
 
-        # Protect from collisions with force_exit.
-        # Without this, freqtrade my try to recreate stoploss_on_exchange orders
-        # while exiting is in process, since telegram messages arrive in an different thread.
-        with self._exit_lock:
-            trades = Trade.get_open_trades()
-            # First process current opened trades (positions)
-            self.exit_positions(trades)
+            # Protect from collisions with force_exit.
+            # Without this, freqtrade my try to recreate stoploss_on_exchange orders
+            # while exiting is in process, since telegram messages arrive in an different thread.
+            with self._exit_lock:
+                # Not from the iteration snapshot - force_exit may have closed trades since
+                trades = Trade.get_trades_proxy(is_open=True)
+                # First process current opened trades (positions)
+                self.exit_positions(trades)
+
+            # Check if we need to adjust our current positions before attempting to buy new trades.
+            if self.strategy.position_adjustment_enable:
+                with self._exit_lock:
+                    self.process_open_trade_positions()
+
+            # Then looking for buy opportunities
+            if self.get_free_open_trades():
+                self.enter_positions()
+            if self.trading_mode == TradingMode.FUTURES:
+                self._schedule.run_pending()
+            Trade.commit()
+            self.exchange.clear_market_snapshot()
+            self.rpc.process_msg_queue(self.dataprovider._msg_queue)
+            self.last_process = datetime.now(timezone.utc)
+        finally:
+            IterationSnapshot.end()
+
+    def process_orders(self) -> None:
+        """
+        Order management between candles, used by the event-driven scheduler.
+        Checks open orders and exits of open trades (based on the last analysis),
+        without refreshing candles or entering new trades.
+        """
+        IterationSnapshot.begin()
+        try:
+            with self._exit_lock:
+                self.manage_open_orders()
 
-        # Check if we need to adjust our current positions before attempting to buy new trades.
-        if self.strategy.position_adjustment_enable:
             with self._exit_lock:
-                self.process_open_trade_positions()
+                # Not from the iteration snapshot - force_exit may have closed trades since
+                trades = Trade.get_trades_proxy(is_open=True)
+                self.exit_positions(trades)
+            Trade.commit()
+            self.rpc.process_msg_queue(self.dataprovider._msg_queue)
+        finally:
+            IterationSnapshot.end()
 
-        # Then looking for buy opportunities
-        if self.get_free_open_trades():
-            self.enter_positions()
-        if self.trading_mode == TradingMode.FUTURES:
-            self._schedule.run_pending()
-        Trade.commit()
-        self.rpc.process_msg_queue(self.dataprovider._msg_queue)
-        self.last_process = datetime.now(timezone.utc)
+    def request_wakeup(self, analysis: bool = False) -> None:
+        """
+        Wake up the event-driven scheduler.
+        :param analysis: Run a full iteration, instead of order management only
+        """
+        if analysis:
+            self.analysis_requested = True
+        self.wakeup.set()
+
+    def update_price_triggers(self) -> None:
+        """
+        Wake up the event-driven scheduler when the price of an open trade crosses its stoploss
+        (requires the market data stream).
+        """
+        triggers: Dict[str, Tuple[float, float]] = {}
+        for trade in Trade.get_open_trades():
+            if not trade.stop_loss:
+                continue
+            if trade.is_short:
+                triggers[trade.pair] = (-float('inf'), trade.stop_loss)
+            else:
+                triggers[trade.pair] = (trade.stop_loss, float('inf'))
+        self.exchange.set_price_triggers(triggers, lambda pair: self.request_wakeup())
+
+    def _refresh_market_snapshot(self, trades: List[Trade]) -> None:
+        """
+        Fetch tickers of all whitelisted and traded pairs in one call, and order books of
+        traded pairs (exit pricing, dry-run fills) and of pairs with an entry signal
+        (depth of market check) concurrently - instead of one call per pair and price check.
+        """
+        trade_pairs = [trade.pair for trade in trades]
+        pairs = list(dict.fromkeys(self.active_pair_whitelist + trade_pairs))
+        order_book_pairs = []
+        if self.config['exit_pricing'].get('use_order_book', False) or self.config['dry_run']:
+            order_book_pairs = trade_pairs
+        order_book_limits = {pair: DEPTH_OF_MARKET_LIMIT
+                             for pair in self._depth_of_market_pairs(trade_pairs)}
+        self.exchange.refresh_market_snapshot(pairs, order_book_pairs, order_book_limits)
+
+    def _depth_of_market_pairs(self, trade_pairs: List[str]) -> List[str]:
+        """
+        Whitelisted pairs without open trade which have an entry signal - and will therefore
+        be checked by _check_depth_of_market() in this iteration.
+        """
+        bid_check_dom = self.config.get('entry_pricing', {}).get('check_depth_of_market', {})
+        if (not bid_check_dom.get('enabled', False)
+                or bid_check_dom.get('bids_to_ask_delta', 0) <= 0
+                or not self.get_free_open_trades()):
+            return []
+        dom_pairs = []
+        for pair in self.active_pair_whitelist:
+            if pair in trade_pairs:
+                continue
+            analyzed_df, _ = self.dataprovider.get_analyzed_dataframe(pair,
+                                                                      self.strategy.timeframe)
+            signal, _ = self.strategy.get_entry_signal(pair, self.strategy.timeframe,
+                                                       analyzed_df)
+            if signal:
+                dom_pairs.append(pair)
+        return dom_pairs
 
     def process_stopped(self) -> None:
         """
@@ -602,7 +698,7 @@ class FreqtradeBot(LoggingMixin):
         """
         conf_bids_to_ask_delta = conf.get('bids_to_ask_delta', 0)
         logger.info(f"Checking depth of market for {pair} ...")
-        order_book = self.exchange.fetch_l2_order_book(pair, 1000)
+        order_book = self.exchange.fetch_l2_order_book(pair, DEPTH_OF_MARKET_LIMIT)
         order_book_data_frame = order_book_to_dataframe(order_book['bids'], order_book['asks'])
         order_book_bids = order_book_data_frame['b_size'].sum()
         order_book_asks = order_book_data_frame['a_size'].sum()
@@ -957,11 +1053,18 @@ class FreqtradeBot(LoggingMixin):
         Tries to execute exit orders for open trades (positions)
         """
         trades_closed = 0
+        stoploss_orders: Dict[str, Dict] = {}
+        if self.strategy.order_types.get('stoploss_on_exchange'):
+            # Query all stoploss orders concurrently - they are handled one by one below.
+            stoploss_orders = self.exchange.fetch_orders_concurrently(
+                [(trade.stoploss_order_id, trade.pair, True)
+                 for trade in trades if trade.stoploss_order_id])
         for trade in trades:
             try:
 
                 if (self.strategy.order_types.get('stoploss_on_exchange') and
-                        self.handle_stoploss_on_exchange(trade)):
+                        self.handle_stoploss_on_exchange(
+                            trade, stoploss_orders.get(trade.stoploss_order_id))):
                     trades_closed += 1
                     Trade.commit()
                     continue
@@ -1074,23 +1177,24 @@ class FreqtradeBot(LoggingMixin):
             logger.exception('Unable to place a stoploss order on exchange.')
         return False
 
-    def handle_stoploss_on_exchange(self, trade: Trade) -> bool:
+    def handle_stoploss_on_exchange(self, trade: Trade,
+                                    stoploss_order: Optional[Dict] = None) -> bool:
         """
         Check if trade is fulfilled in which case the stoploss
         on exchange should be added immediately if stoploss on exchange
         is enabled.
         # TODO: liquidation price always on exchange, even without stoploss_on_exchange
         # Therefore fetching account liquidations for open pairs may make sense.
+        :param stoploss_order: Already fetched stoploss order of this trade (optional)
         """
 
         logger.debug('Handling stoploss on exchange %s ...', trade)
 
-        stoploss_order = None
-
         try:
             # First we check if there is already a stoploss on exchange
-            stoploss_order = self.exchange.fetch_stoploss_order(
-                trade.stoploss_order_id, trade.pair) if trade.stoploss_order_id else None
+            if stoploss_order is None and trade.stoploss_order_id:
+                stoploss_order = self.exchange.fetch_stoploss_order(
+                    trade.stoploss_order_id, trade.pair)
         except InvalidOrderException as exception:
             logger.warning('Unable to fetch stoploss order: %s', exception)
 
@@ -1194,12 +1298,17 @@ class FreqtradeBot(LoggingMixin):
         :return: None
         """
 
-        for trade in Trade.get_open_order_trades():
+        trades = Trade.get_open_order_trades()
+        # Query all orders concurrently - state changes are applied one by one below.
+        orders = self.exchange.fetch_orders_concurrently(
+            [(trade.open_order_id, trade.pair, False) for trade in trades if trade.open_order_id])
+        for trade in trades:
             if not trade.open_order_id:
                 continue
 
             try:
-                order = self.exchange.fetch_order(trade.open_order_id, trade.pair)
+                order = orders.get(trade.open_order_id) or self.exchange.fetch_order(
+                    trade.open_order_id, trade.pair)
             except ExchangeError:
                 logger.info(f'Cannot query order for {trade} due to {traceback.format_exc()}')
                 continue
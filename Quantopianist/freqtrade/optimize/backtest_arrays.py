@@ -0,0 +1,193 @@
+"""
+Columnar (numpy) representation of analyzed backtest data.
+Used by the vectorized backtesting engine.
+"""
+import logging
+from typing import Dict, List, Tuple
+
+import numpy as np
+from pandas import DataFrame, Timestamp
+
+
+logger = logging.getLogger(__name__)
+
+# Safety margin applied to ROI thresholds when searching for exit candidates.
+# Candidates are re-evaluated with the regular (exact) logic, so this only has to be
+# conservative, not precise.
+ROI_CANDIDATE_MARGIN = 1e-3
+
+
+class PairArrays:
+    """
+    OHLCV, signal and tag columns of one analyzed (and shifted) pair as contiguous numpy arrays.
+    """
+    __slots__ = ('dates', 'dates_s', 'buy', 'open', 'close', 'sell', 'low', 'high',
+                 'buy_tag', 'exit_tag', 'steps')
+
+    def __init__(self, dataframe: DataFrame) -> None:
+        self.dates: np.ndarray = dataframe['date'].values.astype('datetime64[ns]').view(np.int64)
+        self.dates_s: np.ndarray = self.dates // 1_000_000_000
+        self.buy: np.ndarray = np.ascontiguousarray(dataframe['buy'].values, dtype=np.float64)
+        self.open: np.ndarray = np.ascontiguousarray(dataframe['open'].values, dtype=np.float64)
+        self.close: np.ndarray = np.ascontiguousarray(dataframe['close'].values, dtype=np.float64)
+        self.sell: np.ndarray = np.ascontiguousarray(dataframe['sell'].values, dtype=np.float64)
+        self.low: np.ndarray = np.ascontiguousarray(dataframe['low'].values, dtype=np.float64)
+        self.high: np.ndarray = np.ascontiguousarray(dataframe['high'].values, dtype=np.float64)
+        self.buy_tag: np.ndarray = dataframe['buy_tag'].values.astype(object)
+        self.exit_tag: np.ndarray = dataframe['exit_tag'].values.astype(object)
+        # Backtest loop step at which each row is processed - set by `assign_steps()`.
+        self.steps: np.ndarray = np.empty(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def row(self, idx: int) -> Tuple:
+        """
+        Build a backtest row tuple for row `idx`.
+        Layout matches the lists generated by `Backtesting._get_ohlcv_as_lists()`.
+        """
+        return (Timestamp(int(self.dates[idx]), tz='UTC'), float(self.buy[idx]),
+                float(self.open[idx]), float(self.close[idx]), float(self.sell[idx]),
+                float(self.low[idx]), float(self.high[idx]),
+                self.buy_tag[idx], self.exit_tag[idx])
+
+    def assign_steps(self, start_ns: int, step_ns: int) -> None:
+        """
+        Calculate the backtest loop step for every row. See calculate_row_steps().
+        """
+        self.steps = calculate_row_steps(self.dates, start_ns, step_ns)
+
+    def entry_candidates(self, last_step: int) -> np.ndarray:
+        """
+        Row indexes with a buy signal (and no sell signal) which are processed
+        within the backtest range.
+        """
+        return np.flatnonzero((self.buy == 1) & (self.sell != 1) & (self.steps <= last_step))
+
+    def last_row_at(self, step: int) -> int:
+        """
+        Index of the last row processed at or before `step`. -1 if no row was processed yet.
+        """
+        return int(np.searchsorted(self.steps, step, side='right')) - 1
+
+
+class DetailArrays:
+    """
+    Detail timeframe candles of one pair, pre-converted to lists once,
+    with the rows belonging to every candle of the strategy timeframe (see index_candles()).
+    """
+    __slots__ = ('rows', 'dates', 'timeframe_ns', 'offsets')
+
+    def __init__(self, dataframe: DataFrame, timeframe_ns: int) -> None:
+        """
+        :param dataframe: Detail timeframe candles
+        :param timeframe_ns: Strategy timeframe (nanoseconds) - length of the last candle
+        """
+        # Rows as [date, open, close, low, high]
+        self.rows: List[List] = dataframe[['date', 'open', 'close', 'low', 'high']
+                                          ].values.tolist()
+        self.dates = dataframe['date'].values.astype('datetime64[ns]').view(np.int64)
+        self.timeframe_ns = timeframe_ns
+        # Candle open time (nanoseconds) -> (first row, last row + 1)
+        self.offsets: Dict[int, Tuple[int, int]] = {}
+
+    def index_candles(self, candle_dates: np.ndarray) -> None:
+        """
+        Map the strategy candles to their detail rows - every candle spans the detail rows
+        up to the next candle's date. Uses the actual candle dates, as not all timeframes
+        are aligned to the epoch (1w candles open on monday, 1M has no fixed length).
+        :param candle_dates: Strategy candle dates of this pair (int64 nanoseconds, ascending)
+        """
+        self.offsets = {}
+        if len(self.rows) == 0 or len(candle_dates) == 0:
+            return
+        candle_ends = np.append(candle_dates[1:], candle_dates[-1] + self.timeframe_ns)
+        starts = np.searchsorted(self.dates, candle_dates, side='left')
+        ends = np.searchsorted(self.dates, candle_ends, side='left')
+        found = starts < ends
+        self.offsets = dict(zip(candle_dates[found].tolist(),
+                                zip(starts[found].tolist(), ends[found].tolist())))
+
+    def candle_rows(self, candle_ns: int) -> List[List]:
+        """
+        Detail rows within the strategy candle starting at `candle_ns`.
+        Empty list if no detail data is available for this candle.
+        """
+        bounds = self.offsets.get(candle_ns)
+        if bounds is None:
+            return []
+        return self.rows[bounds[0]:bounds[1]]
+
+
+def calculate_row_steps(dates: np.ndarray, start_ns: int, step_ns: int) -> np.ndarray:
+    """
+    Calculate the backtest loop step at which every row of a pair is processed.
+    Step `n` corresponds to `start + n * step`. A row is processed at the first step
+    where its date has been reached, but never more than one row per step.
+    :param dates: Candle dates of one pair (int64 nanoseconds, ascending)
+    :param start_ns: Time of step 0 (nanoseconds)
+    :param step_ns: Duration of one step (nanoseconds)
+    :return: int64 array with the step of every row
+    """
+    earliest = np.maximum(-(-(dates - start_ns) // step_ns), 0)
+    offsets = np.arange(len(earliest), dtype=np.int64)
+    return offsets + np.maximum.accumulate(earliest - offsets)
+
+
+def build_row_index(pair_steps: List[np.ndarray], n_steps: int) -> np.ndarray:
+    """
+    Build the master index of the backtest loop.
+    :param pair_steps: Result of calculate_row_steps() for every pair
+    :param n_steps: Number of steps of the backtest loop
+    :return: int32 matrix of shape (n_steps, pairs) containing the row to process
+        for each step and pair, -1 where the pair has no candle
+    """
+    index = np.full((n_steps, len(pair_steps)), -1, dtype=np.int32)
+    for pair_idx, steps in enumerate(pair_steps):
+        rows = np.flatnonzero(steps < n_steps)
+        index[steps[rows], pair_idx] = rows
+    return index
+
+
+def roi_thresholds(minimal_roi: Dict[int, float], open_rate: float, fee_open: float,
+                   fee_close: float, leverage: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert a minimal_roi table into (sorted durations, rates) - where rate is a
+    conservative lower bound for the candle high required to reach that ROI.
+    """
+    if not minimal_roi:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+    keys = np.array(sorted(minimal_roi.keys()), dtype=np.int64)
+    roi = np.array([minimal_roi[k] for k in keys], dtype=np.float64)
+    rates = open_rate * (1 + roi / leverage) * (1 + fee_open) / (1 - fee_close)
+    return keys, rates * (1 - ROI_CANDIDATE_MARGIN)
+
+
+def find_exit_candidate(arrays: PairArrays, start: int, stop_loss: float, open_date_s: int,
+                        roi_keys: np.ndarray, roi_rates: np.ndarray,
+                        use_sell_signal: bool) -> int:
+    """
+    Find the first row at or after `start` where a trade without open orders may exit.
+    Considers stoploss (candle low), ROI (candle high) and sell signals.
+    Returns len(arrays) if no candidate was found.
+    The search expands in chunks, as exits are usually close to the trade entry.
+    """
+    length = len(arrays)
+    idx = start
+    chunk = 64
+    while idx < length:
+        end = min(idx + chunk, length)
+        mask = arrays.low[idx:end] <= stop_loss
+        if use_sell_signal:
+            mask |= arrays.sell[idx:end] == 1
+        if len(roi_keys):
+            trade_dur = (arrays.dates_s[idx:end] - open_date_s) // 60
+            pos = np.searchsorted(roi_keys, trade_dur, side='right') - 1
+            threshold = np.where(pos >= 0, roi_rates[np.maximum(pos, 0)], np.inf)
+            mask |= arrays.high[idx:end] >= threshold
+        hits = np.flatnonzero(mask)
+        if len(hits):
+            return idx + int(hits[0])
+        idx = end
+        chunk *= 4
+    return length
@@ -7,9 +7,10 @@ import logging
 from collections import defaultdict
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from pandas import DataFrame
+import numpy as np
+from pandas import DataFrame, Timestamp
 
 from freqtrade import constants
 from freqtrade.configuration import TimeRange, validate_config_consistency
@@ -23,10 +24,15 @@ from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.exchange import timeframe_to_minutes, timeframe_to_seconds
 from freqtrade.misc import get_strategy_run_id
 from freqtrade.mixins import LoggingMixin
+from freqtrade.optimize.backtest_arrays import (DetailArrays, PairArrays, build_row_index,
+                                               calculate_row_steps, find_exit_candidate,
+                                               roi_thresholds)
 from freqtrade.optimize.bt_progress import BTProgress
 from freqtrade.optimize.optimize_reports import (generate_backtest_stats, show_backtest_results,
                                                  store_backtest_stats)
+from freqtrade.optimize.signal_cache import SignalCache
 from freqtrade.persistence import LocalTrade, Order, PairLocks, Trade
+from freqtrade.persistence.backtest_results import store_backtest_results
 from freqtrade.plugins.pairlistmanager import PairListManager
 from freqtrade.plugins.protectionmanager import ProtectionManager
 from freqtrade.resolvers import ExchangeResolver, StrategyResolver
@@ -37,6 +43,10 @@ from freqtrade.wallets import Wallets
 
 logger = logging.getLogger(__name__)
 
+# Every change to this headers list must evaluate further usages of the resulting tuple
+# and eventually change the constants for indexes below
+BT_HEADERS = ['date', 'buy', 'open', 'close', 'sell', 'low', 'high', 'buy_tag', 'exit_tag']
+
 # Indexes for backtest tuples
 DATE_IDX = 0
 BUY_IDX = 1
@@ -70,6 +80,8 @@ class Backtesting:
         self.run_ids: Dict[str, str] = {}
         self.strategylist: List[IStrategy] = []
         self.all_results: Dict[str, Dict] = {}
+        # Populated signals cache - enabled by hyperopt
+        self.signal_cache: Optional[SignalCache] = None
 
         self.exchange = ExchangeResolver.load_exchange(self.config['exchange']['name'], self.config)
         self.dataprovider = DataProvider(self.config, self.exchange)
@@ -145,7 +157,7 @@ class Backtesting:
 
         else:
             self.timeframe_detail_min = 0
-        self.detail_data: Dict[str, DataFrame] = {}
+        self.detail_data: Dict[str, DetailArrays] = {}
 
     def init_backtest(self):
 
@@ -192,6 +204,7 @@ class Backtesting:
             startup_candles=self.required_startup,
             fail_without_data=True,
             data_format=self.config.get('dataformat_ohlcv', 'json'),
+            workers=self.config.get('dataload_workers', 1),
         )
 
         min_date, max_date = history.get_timerange(data)
@@ -210,9 +223,11 @@ class Backtesting:
     def load_bt_data_detail(self) -> None:
         """
         Loads backtest detail data (smaller timeframe) if necessary.
+        Detail candles are converted once and indexed by strategy candle when signals
+        are populated (see _advise_and_shift()), so lookups during backtesting are a slice.
         """
         if self.timeframe_detail:
-            self.detail_data = history.load_data(
+            detail_data = history.load_data(
                 datadir=self.config['datadir'],
                 pairs=self.pairlists.whitelist,
                 timeframe=self.timeframe_detail,
@@ -220,7 +235,11 @@ class Backtesting:
                 startup_candles=0,
                 fail_without_data=True,
                 data_format=self.config.get('dataformat_ohlcv', 'json'),
+                workers=self.config.get('dataload_workers', 1),
             )
+            timeframe_ns = self.timeframe_min * 60 * 1_000_000_000
+            self.detail_data = {pair: DetailArrays(df, timeframe_ns)
+                                for pair, df in detail_data.items()}
         else:
             self.detail_data = {}
 
@@ -258,10 +277,30 @@ class Backtesting:
         :param processed: a processed dictionary with format {pair, data}, which gets cleared to
         optimize memory usage!
         """
-        # Every change to this headers list must evaluate further usages of the resulting tuple
-        # and eventually change the constants for indexes at the top
-        headers = ['date', 'buy', 'open', 'close', 'sell', 'low', 'high', 'buy_tag', 'exit_tag']
         data: Dict = {}
+        for pair, df_analyzed in self._advise_and_shift(processed):
+            # Convert from Pandas to list for performance reasons
+            # (Looping Pandas is slow.)
+            data[pair] = df_analyzed[BT_HEADERS].values.tolist()
+        return data
+
+    def _get_ohlcv_as_arrays(self, processed: Dict[str, DataFrame]) -> Dict[str, PairArrays]:
+        """
+        Columnar alternative to _get_ohlcv_as_lists(), used by the vectorized engine.
+        :param processed: a processed dictionary with format {pair, data}, which gets cleared to
+        optimize memory usage!
+        """
+        return {pair: PairArrays(df_analyzed)
+                for pair, df_analyzed in self._advise_and_shift(processed)}
+
+    def _advise_and_shift(self, processed: Dict[str, DataFrame]
+                          ) -> Iterator[Tuple[str, DataFrame]]:
+        """
+        Populate buy / sell signals for every pair, trim the startup period
+        and shift signals by one candle.
+        :param processed: a processed dictionary with format {pair, data}, which gets cleared to
+        optimize memory usage!
+        """
         self.progress.init_step(BacktestState.CONVERT, len(processed))
 
         # Create dict with data
@@ -275,13 +314,15 @@ class Backtesting:
                 pair_data.loc[:, 'buy_tag'] = None  # cleanup if buy_tag is exist
                 pair_data.loc[:, 'exit_tag'] = None  # cleanup if exit_tag is exist
 
-            df_analyzed = self.strategy.advise_sell(
-                self.strategy.advise_buy(pair_data, {'pair': pair}), {'pair': pair}).copy()
+            df_analyzed = self._populate_signals(pair, pair_data)
             # Trim startup period from analyzed dataframe
             df_analyzed = processed[pair] = pair_data = trim_dataframe(
                 df_analyzed, self.timerange, startup_candles=self.required_startup)
             # Update dataprovider cache
             self.dataprovider._set_cached_df(pair, self.timeframe, df_analyzed)
+            if pair in self.detail_data:
+                self.detail_data[pair].index_candles(
+                    df_analyzed['date'].values.astype('datetime64[ns]').view(np.int64))
 
             # Create a copy of the dataframe before shifting, that way the buy signal/tag
             # remains on the correct candle for callbacks.
@@ -296,10 +337,31 @@ class Backtesting:
 
             df_analyzed = df_analyzed.drop(df_analyzed.head(1).index)
 
-            # Convert from Pandas to list for performance reasons
-            # (Looping Pandas is slow.)
-            data[pair] = df_analyzed[headers].values.tolist()
-        return data
+            yield pair, df_analyzed
+
+    def _populate_signals(self, pair: str, pair_data: DataFrame) -> DataFrame:
+        """
+        Populate buy / sell signals for one pair.
+        Uses the signal cache (if enabled) to skip advise_buy() / advise_sell() for
+        buy / sell parameter values that were already evaluated.
+        :return: Copy of the analyzed dataframe
+        """
+        cache = self.signal_cache
+        if cache is None or pair_data.empty or not cache.is_cacheable(pair):
+            return self.strategy.advise_sell(
+                self.strategy.advise_buy(pair_data, {'pair': pair}), {'pair': pair}).copy()
+
+        key = (self.strategy.get_strategy_name(), cache.data_key(pair, pair_data),
+               cache.parameter_key(self.strategy))
+        signals = cache.get(key)
+        if signals is not None:
+            return signals.apply(pair_data.copy())
+
+        columns = pair_data.columns
+        df_analyzed = self.strategy.advise_sell(
+            self.strategy.advise_buy(pair_data, {'pair': pair}), {'pair': pair}).copy()
+        cache.store(key, pair, columns, df_analyzed)
+        return df_analyzed
 
     def _get_close_rate(self, sell_row: Tuple, trade: LocalTrade, sell: SellCheckTuple,
                         trade_dur: int) -> float:
@@ -495,23 +557,22 @@ class Backtesting:
 
     def _get_sell_trade_entry(self, trade: LocalTrade, sell_row: Tuple) -> Optional[LocalTrade]:
         if self.timeframe_detail and trade.pair in self.detail_data:
-            sell_candle_time = sell_row[DATE_IDX].to_pydatetime()
-            sell_candle_end = sell_candle_time + timedelta(minutes=self.timeframe_min)
-
-            detail_data = self.detail_data[trade.pair]
-            detail_data = detail_data.loc[
-                (detail_data['date'] >= sell_candle_time) &
-                (detail_data['date'] < sell_candle_end)
-            ].copy()
-            if len(detail_data) == 0:
+            detail_rows = self.detail_data[trade.pair].candle_rows(sell_row[DATE_IDX].value)
+            if not detail_rows:
                 # Fall back to "regular" data if no detail data was found for this candle
                 return self._get_sell_trade_entry_for_candle(trade, sell_row)
-            detail_data.loc[:, 'buy'] = sell_row[BUY_IDX]
-            detail_data.loc[:, 'sell'] = sell_row[SELL_IDX]
-            detail_data.loc[:, 'buy_tag'] = sell_row[BUY_TAG_IDX]
-            detail_data.loc[:, 'exit_tag'] = sell_row[EXIT_TAG_IDX]
-            headers = ['date', 'buy', 'open', 'close', 'sell', 'low', 'high', 'buy_tag', 'exit_tag']
-            for det_row in detail_data[headers].values.tolist():
+            for det_date, det_open, det_close, det_low, det_high in detail_rows:
+                # Detail candles use the signals of the candle they belong to.
+                det_row = [None] * len(BT_HEADERS)
+                det_row[DATE_IDX] = det_date
+                det_row[BUY_IDX] = sell_row[BUY_IDX]
+                det_row[OPEN_IDX] = det_open
+                det_row[CLOSE_IDX] = det_close
+                det_row[SELL_IDX] = sell_row[SELL_IDX]
+                det_row[LOW_IDX] = det_low
+                det_row[HIGH_IDX] = det_high
+                det_row[BUY_TAG_IDX] = sell_row[BUY_TAG_IDX]
+                det_row[EXIT_TAG_IDX] = sell_row[EXIT_TAG_IDX]
                 res = self._get_sell_trade_entry_for_candle(trade, det_row)
                 if res:
                     return res
@@ -699,22 +760,6 @@ class Backtesting:
 
         return False
 
-    def validate_row(
-            self, data: Dict, pair: str, row_index: int, current_time: datetime) -> Optional[Tuple]:
-        try:
-            # Row is treated as "current incomplete candle".
-            # Buy / sell signals are shifted by 1 to compensate for this.
-            row = data[pair][row_index]
-        except IndexError:
-            # missing Data for one pair at the end.
-            # Warnings for this are shown during data loading
-            return None
-
-        # Waits until the time-counter reaches the start of the data for this pair.
-        if row[DATE_IDX] > current_time:
-            return None
-        return row
-
     def backtest(self, processed: Dict,
                  start_date: datetime, end_date: datetime,
                  max_open_trades: int = 0, position_stacking: bool = False,
@@ -735,17 +780,97 @@ class Backtesting:
         :param enable_protections: Should protections be enabled?
         :return: DataFrame with trades (results of backtesting)
         """
-        trades: List[LocalTrade] = []
         self.prepare_backtest(enable_protections)
         # Ensure wallets are uptodate (important for --strategy-list)
         self.wallets.update()
-        # Use dict of lists with data for performance
-        # (looping lists is a lot faster than pandas DataFrames)
-        data: Dict = self._get_ohlcv_as_lists(processed)
 
-        # Indexes per pair, so some pairs are allowed to have a missing start.
-        indexes: Dict = defaultdict(int)
+        if self.config.get('backtest_engine', 'default') == 'vectorized':
+            trades = self._backtest_vectorized(processed, start_date, end_date, max_open_trades,
+                                               position_stacking, enable_protections)
+        else:
+            trades = self._backtest_loop(processed, start_date, end_date, max_open_trades,
+                                         position_stacking, enable_protections)
+        self.wallets.update()
+
+        results = trade_list_to_dataframe(trades)
+        return {
+            'results': results,
+            'config': self.strategy.config,
+            'locks': PairLocks.get_all_locks(),
+            'rejected_signals': self.rejected_trades,
+            'timedout_entry_orders': self.timedout_entry_orders,
+            'timedout_exit_orders': self.timedout_exit_orders,
+            'final_balance': self.wallets.get_total(self.strategy.config['stake_currency']),
+        }
+
+    def _process_trade_candle(self, trade: LocalTrade, row: Tuple, current_time: datetime,
+                              enable_protections: bool) -> Optional[bool]:
+        """
+        Process orders of one open trade for one candle.
+        :return: True if the trade was closed, False if it was removed due to an
+            entry timeout, None if the trade remains open.
+        """
+        result = None
+        # 2. Process buy orders.
+        order = trade.select_order('buy', is_open=True)
+        if order and self._get_order_filled(order.price, row):
+            order.close_bt_order(current_time)
+            trade.open_order_id = None
+            LocalTrade.add_bt_trade(trade)
+            self.wallets.update()
+
+        # 3. Create sell orders (if any)
+        if not trade.open_order_id:
+            self._get_sell_trade_entry(trade, row)  # Place sell order if necessary
+
+        # 4. Process sell orders.
+        order = trade.select_order('sell', is_open=True)
+        if order and self._get_order_filled(order.price, row):
+            trade.open_order_id = None
+            trade.close_date = current_time
+            trade.close(order.price, show_msg=False)
+
+            # logger.debug(f"{pair} - Backtesting sell {trade}")
+            LocalTrade.close_bt_trade(trade)
+            self.wallets.update()
+            self.run_protections(enable_protections, trade.pair, current_time)
+            result = True
+
+        # 5. Cancel expired buy/sell orders.
+        if self.check_order_cancel(trade, current_time):
+            # Close trade due to buy timeout expiration.
+            self.wallets.update()
+            result = False
+        return result
+
+    def _backtest_loop(self, processed: Dict, start_date: datetime, end_date: datetime,
+                       max_open_trades: int, position_stacking: bool,
+                       enable_protections: bool) -> List[LocalTrade]:
+        """
+        Regular backtest loop - visits every candle of every pair.
+        :return: List of closed trades (including trades force-closed at the end)
+        """
+        trades: List[LocalTrade] = []
         current_time = start_date + timedelta(minutes=self.timeframe_min)
+        step_delta = timedelta(minutes=self.timeframe_min)
+        start_ns = Timestamp(current_time).value
+        step_ns = self.timeframe_min * 60 * 1_000_000_000
+
+        # Use dict of lists with data for performance
+        # (looping lists is a lot faster than pandas DataFrames)
+        data: Dict = {}
+        pair_steps: List[np.ndarray] = []
+        for pair, df_analyzed in self._advise_and_shift(processed):
+            data[pair] = df_analyzed[BT_HEADERS].values.tolist()
+            pair_steps.append(calculate_row_steps(
+                df_analyzed['date'].values.astype('datetime64[ns]').view(np.int64),
+                start_ns, step_ns))
+        pairs = list(data.keys())
+
+        # Master index - row of every pair for every step, -1 where a pair has no candle.
+        # Pairs with a missing start (or missing data at the end) are skipped at no cost.
+        n_steps = max(int((end_date - current_time) // step_delta) + 1, 0)
+        row_indexes = build_row_index(pair_steps, n_steps)
 
         open_trades: Dict[str, List[LocalTrade]] = defaultdict(list)
         open_trade_count = 0
@@ -754,17 +879,18 @@ class Backtesting:
             (end_date - start_date) / timedelta(minutes=self.timeframe_min)))
 
         # Loop timerange and get candle for each pair at that point in time
-        while current_time <= end_date:
+        for step in range(n_steps):
             open_trade_count_start = open_trade_count
             self.check_abort()
-            for i, pair in enumerate(data):
-                row_index = indexes[pair]
-                row = self.validate_row(data, pair, row_index, current_time)
-                if not row:
-                    continue
+            step_rows = row_indexes[step]
+            for pair_idx in np.flatnonzero(step_rows >= 0):
+                pair = pairs[pair_idx]
+                # Row is treated as "current incomplete candle".
+                # Buy / sell signals are shifted by 1 to compensate for this.
+                row_index = int(step_rows[pair_idx])
+                row = data[pair][row_index]
 
                 row_index += 1
-                indexes[pair] = row_index
                 self.dataprovider._set_dataframe_max_index(row_index)
 
                 # 1. Process buys.
@@ -790,57 +916,193 @@ class Backtesting:
                         open_trades[pair].append(trade)
 
                 for trade in list(open_trades[pair]):
-                    # 2. Process buy orders.
-                    order = trade.select_order('buy', is_open=True)
-                    if order and self._get_order_filled(order.price, row):
-                        order.close_bt_order(current_time)
-                        trade.open_order_id = None
-                        LocalTrade.add_bt_trade(trade)
-                        self.wallets.update()
-
-                    # 3. Create sell orders (if any)
-                    if not trade.open_order_id:
-                        self._get_sell_trade_entry(trade, row)  # Place sell order if necessary
-
-                    # 4. Process sell orders.
-                    order = trade.select_order('sell', is_open=True)
-                    if order and self._get_order_filled(order.price, row):
-                        trade.open_order_id = None
-                        trade.close_date = current_time
-                        trade.close(order.price, show_msg=False)
-
-                        # logger.debug(f"{pair} - Backtesting sell {trade}")
-                        open_trade_count -= 1
-                        open_trades[pair].remove(trade)
-                        LocalTrade.close_bt_trade(trade)
-                        trades.append(trade)
-                        self.wallets.update()
-                        self.run_protections(enable_protections, pair, current_time)
-
-                    # 5. Cancel expired buy/sell orders.
-                    if self.check_order_cancel(trade, current_time):
-                        # Close trade due to buy timeout expiration.
+                    closed = self._process_trade_candle(trade, row, current_time,
+                                                        enable_protections)
+                    if closed is not None:
                         open_trade_count -= 1
                         open_trades[pair].remove(trade)
-                        self.wallets.update()
+                        if closed:
+                            trades.append(trade)
 
             # Move time one configured time_interval ahead.
             self.progress.increment()
-            current_time += timedelta(minutes=self.timeframe_min)
+            current_time += step_delta
 
         trades += self.handle_left_open(open_trades, data=data)
-        self.wallets.update()
+        return trades
 
-        results = trade_list_to_dataframe(trades)
-        return {
-            'results': results,
-            'config': self.strategy.config,
-            'locks': PairLocks.get_all_locks(),
-            'rejected_signals': self.rejected_trades,
-            'timedout_entry_orders': self.timedout_entry_orders,
-            'timedout_exit_orders': self.timedout_exit_orders,
-            'final_balance': self.wallets.get_total(self.strategy.config['stake_currency']),
-        }
+    def _vectorized_per_candle(self) -> bool:
+        """
+        Open trades must be evaluated on every candle if exits depend on more than
+        the candle data (trailing / custom stoploss, custom_sell, position adjustment)
+        or if intra-candle (detail) data is used.
+        """
+        return bool(
+            self.timeframe_detail
+            or self.strategy.trailing_stop
+            or self.strategy.use_custom_stoploss
+            or self.strategy.position_adjustment_enable
+            or (self.strategy.use_sell_signal
+                and type(self.strategy).custom_sell is not IStrategy.custom_sell)
+        )
+
+    def _vectorized_next_row(self, trade: LocalTrade, arrays: PairArrays, start: int,
+                             per_candle: bool) -> int:
+        """
+        Next row at which the vectorized engine has to evaluate this trade.
+        """
+        if per_candle or any(o.ft_is_open for o in trade.orders):
+            return start
+        roi_keys, roi_rates = roi_thresholds(self.strategy.minimal_roi, trade.open_rate,
+                                             trade.fee_open, trade.fee_close,
+                                             trade.leverage or 1.0)
+        return find_exit_candidate(arrays, start, trade.stop_loss,
+                                   int(trade.open_date_utc.timestamp()),
+                                   roi_keys, roi_rates, self.strategy.use_sell_signal)
+
+    @staticmethod
+    def _vectorized_skip_rows(trade: LocalTrade, arrays: PairArrays, start: int, end: int):
+        """
+        Apply min / max rates of skipped candles - which the regular loop
+        would have applied as part of should_sell().
+        """
+        if start < end:
+            trade.adjust_min_max_rates(float(arrays.high[start:end].max()),
+                                       float(arrays.low[start:end].min()))
+
+    def _backtest_vectorized(self, processed: Dict, start_date: datetime, end_date: datetime,
+                             max_open_trades: int, position_stacking: bool,
+                             enable_protections: bool) -> List[LocalTrade]:
+        """
+        Event driven backtest loop working on numpy arrays.
+        Entry candidates and possible exits (stoploss / ROI / sell signal) are located with
+        vectorized searches - only these candles are processed in python.
+        Produces the same trades as _backtest_loop().
+        Rejected signals are only counted for candles with an entry signal.
+        :return: List of closed trades (including trades force-closed at the end)
+        """
+        trades: List[LocalTrade] = []
+        data: Dict[str, PairArrays] = self._get_ohlcv_as_arrays(processed)
+        pairs = list(data.keys())
+        pair_indexes = {pair: idx for idx, pair in enumerate(pairs)}
+        per_candle = self._vectorized_per_candle()
+
+        step_delta = timedelta(minutes=self.timeframe_min)
+        first_time = start_date + step_delta
+        last_step = (end_date - first_time) // step_delta
+        start_ns = Timestamp(first_time).value
+        step_ns = self.timeframe_min * 60 * 1_000_000_000
+
+        # Entry candidates of all pairs, sorted by step and pair order
+        cand_steps, cand_pairs, cand_rows = [], [], []
+        for pair_idx, pair in enumerate(pairs):
+            arrays = data[pair]
+            arrays.assign_steps(start_ns, step_ns)
+            rows = arrays.entry_candidates(last_step)
+            cand_rows.append(rows)
+            cand_steps.append(arrays.steps[rows])
+            cand_pairs.append(np.full(len(rows), pair_idx, dtype=np.int64))
+        if pairs:
+            all_steps = np.concatenate(cand_steps)
+            all_pairs = np.concatenate(cand_pairs)
+            order = np.lexsort((all_pairs, all_steps))
+            candidates = list(zip(all_steps[order].tolist(), all_pairs[order].tolist(),
+                                  np.concatenate(cand_rows)[order].tolist()))
+        else:
+            candidates = []
+        cand_idx = 0
+
+        open_trades: Dict[str, List[LocalTrade]] = defaultdict(list)
+        open_trade_count = 0
+        # Per open trade (by id): next row to evaluate, last row already accounted for.
+        next_rows: Dict[int, int] = {}
+        seen_rows: Dict[int, int] = {}
+
+        self.progress.init_step(BacktestState.BACKTEST, int(
+            (end_date - start_date) / timedelta(minutes=self.timeframe_min)))
+
+        while True:
+            step = candidates[cand_idx][0] if cand_idx < len(candidates) else last_step + 1
+            for pair, pair_trades in open_trades.items():
+                for trade in pair_trades:
+                    if next_rows[trade.id] < len(data[pair]):
+                        step = min(step, int(data[pair].steps[next_rows[trade.id]]))
+            if step > last_step:
+                break
+
+            self.check_abort()
+            self.progress.set_new_value(step)
+            current_time = first_time + step_delta * step
+            open_trade_count_start = open_trade_count
+
+            # Pairs to process in this step, with the row to use.
+            due: Dict[int, int] = {}
+            entry_pairs = set()
+            while cand_idx < len(candidates) and candidates[cand_idx][0] == step:
+                _, pair_idx, row_index = candidates[cand_idx]
+                due[pair_idx] = row_index
+                entry_pairs.add(pair_idx)
+                cand_idx += 1
+            for pair, pair_trades in open_trades.items():
+                for trade in pair_trades:
+                    row_index = next_rows[trade.id]
+                    if row_index < len(data[pair]) and data[pair].steps[row_index] == step:
+                        due[pair_indexes[pair]] = row_index
+
+            for pair_idx in sorted(due):
+                pair = pairs[pair_idx]
+                arrays = data[pair]
+                row_index = due[pair_idx]
+                row = arrays.row(row_index)
+                self.dataprovider._set_dataframe_max_index(row_index + 1)
+
+                # 1. Process buys - same rules as the regular loop.
+                if (
+                    pair_idx in entry_pairs
+                    and (position_stacking or len(open_trades[pair]) == 0)
+                    and self.trade_slot_available(max_open_trades, open_trade_count_start)
+                    and current_time != end_date
+                    and not PairLocks.is_pair_locked(pair, row[DATE_IDX])
+                ):
+                    trade = self._enter_trade(pair, row)
+                    if trade:
+                        open_trade_count_start += 1
+                        open_trade_count += 1
+                        open_trades[pair].append(trade)
+                        next_rows[trade.id] = row_index
+                        seen_rows[trade.id] = row_index - 1
+
+                for trade in list(open_trades[pair]):
+                    if next_rows[trade.id] != row_index:
+                        continue
+                    self._vectorized_skip_rows(trade, arrays, seen_rows[trade.id] + 1, row_index)
+                    closed = self._process_trade_candle(trade, row, current_time,
+                                                        enable_protections)
+                    if closed is not None:
+                        open_trade_count -= 1
+                        open_trades[pair].remove(trade)
+                        del next_rows[trade.id]
+                        del seen_rows[trade.id]
+                        if closed:
+                            trades.append(trade)
+                    else:
+                        seen_rows[trade.id] = row_index
+                        next_rows[trade.id] = self._vectorized_next_row(
+                            trade, arrays, row_index + 1, per_candle)
+
+        # Account for candles skipped until the end of the backtest.
+        left_open_data: Dict[str, List[Tuple]] = {}
+        for pair, pair_trades in open_trades.items():
+            if not pair_trades:
+                continue
+            arrays = data[pair]
+            last_row = arrays.last_row_at(last_step)
+            for trade in pair_trades:
+                self._vectorized_skip_rows(trade, arrays, seen_rows[trade.id] + 1, last_row + 1)
+            left_open_data[pair] = [arrays.row(len(arrays) - 1)]
+
+        trades += self.handle_left_open(open_trades, data=left_open_data)
+        return trades
 
     def backtest_one_strategy(self, strat: IStrategy, data: Dict[str, DataFrame],
                               timerange: TimeRange):
@@ -954,6 +1216,10 @@ class Backtesting:
             else:
                 self.results = results
 
+            if self.config.get('export_db_url'):
+                # Only newly backtested strategies - reused results are not stored again.
+                store_backtest_results(self.config['export_db_url'], results)
+
             if self.config.get('export', 'none') == 'trades':
                 store_backtest_stats(self.config['exportfilename'], self.results)
 
@@ -7,16 +7,19 @@ This module contains the hyperopt logic
 import logging
 import random
 import warnings
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from datetime import datetime, timezone
 from math import ceil
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import progressbar
 import rapidjson
 from colorama import Fore, Style
 from colorama import init as colorama_init
-from joblib import Parallel, cpu_count, delayed, dump, load, wrap_non_picklable_objects
+from joblib import (Parallel, cpu_count, delayed, dump, effective_n_jobs, load,
+                    wrap_non_picklable_objects)
+from joblib.externals.loky import get_reusable_executor
 from pandas import DataFrame
 
 from freqtrade.constants import DATETIME_PRINT_FORMAT, FTHYPT_FILEVERSION, LAST_BT_RESULT_FN
@@ -27,10 +30,14 @@ from freqtrade.misc import deep_merge_dicts, file_dump_json, plural
 from freqtrade.optimize.backtesting import Backtesting
 # Import IHyperOpt and IHyperOptLoss to allow unpickling classes from these modules
 from freqtrade.optimize.hyperopt_auto import HyperOptAuto
+from freqtrade.optimize.hyperopt_datastore import (attach_hyperopt_data, clear_hyperopt_data,
+                                                   store_hyperopt_data)
 from freqtrade.optimize.hyperopt_interface import IHyperOpt  # noqa: F401
 from freqtrade.optimize.hyperopt_loss_interface import IHyperOptLoss  # noqa: F401
 from freqtrade.optimize.hyperopt_tools import HyperoptTools, hyperopt_serializer
-from freqtrade.optimize.optimize_reports import generate_strategy_stats
+from freqtrade.optimize.optimize_reports import (generate_hyperopt_metrics,
+                                                 generate_strategy_stats)
+from freqtrade.optimize.signal_cache import get_signal_cache
 from freqtrade.resolvers.hyperopt_resolver import HyperOptLossResolver
 
 
@@ -96,6 +103,15 @@ class Hyperopt:
                                    f'strategy_{strategy}_{time_now}.fthypt')
         self.data_pickle_file = (self.config['user_data_dir'] /
                                  'hyperopt_results' / 'hyperopt_tickerdata.pkl')
+        self.data_store_dir = (self.config['user_data_dir'] /
+                               'hyperopt_results' / 'hyperopt_tickerdata')
+        # Workers keep the (memory-mapped) data store attached across epochs
+        self.persistent_workers = self.config.get('hyperopt_persistent_workers', False)
+        self.async_scheduler = self.config.get('hyperopt_async_scheduler', False)
+        # Calculate summary metrics only, full statistics for best epochs
+        self.fast_metrics = self.config.get('hyperopt_fast_metrics', False)
+        # Reuse populated signals across epochs with identical buy / sell parameters
+        self.signal_cache_enabled = self.config.get('hyperopt_signal_cache', True)
         self.total_epochs = config.get('epochs', 0)
 
         self.current_best_loss = 100
@@ -138,8 +154,10 @@ class Hyperopt:
             if p.is_file():
                 logger.info(f"Removing `{p}`.")
                 p.unlink()
+        clear_hyperopt_data(self.data_store_dir)
 
-def _get_params_dict(self, dimensions: List[Dimension], raw_params: List[Any]) -> Dict[str, Any]:
+    def _get_params_dict(self, dimensions: List[Dimension], raw_params: List[Any]
+                         ) -> Dict[str, Any]:
         """
         Maps each dimension name to its corresponding parameter.
 
@@ -153,7 +171,6 @@ def _get_params_dict(self, dimensions: List[Dimension], raw_params: List[Any]) -
 
         return {dimension.name: value for dimension, value in zip(dimensions, raw_params)}
 
-
     def _save_result(self, epoch: Dict) -> None:
         """
         Save hyperopt results to file
@@ -311,8 +328,15 @@ def _get_params_dict(self, dimensions: List[Dimension], raw_params: List[Any]) -
             self.backtesting.strategy.trailing_only_offset_is_reached = \
                 d['trailing_only_offset_is_reached']
 
-        with self.data_pickle_file.open('rb') as f:
-            processed = load(f, mmap_mode='r')
+        # Signals only change with buy / sell parameters - reuse them across epochs.
+        self.backtesting.signal_cache = (get_signal_cache() if self.signal_cache_enabled
+                                         else None)
+
+        if self.persistent_workers:
+            processed = attach_hyperopt_data(self.data_store_dir)
+        else:
+            with self.data_pickle_file.open('rb') as f:
+                processed = load(f, mmap_mode='r')
         bt_results = self.backtesting.backtest(
             processed=processed,
             start_date=self.min_date,
@@ -336,10 +360,15 @@ def _get_params_dict(self, dimensions: List[Dimension], raw_params: List[Any]) -
                           ) -> Dict[str, Any]:
         params_details = self._get_params_details(params_dict)
 
-        strat_stats = generate_strategy_stats(
-            self.pairlist, self.backtesting.strategy.get_strategy_name(),
-            backtesting_results, min_date, max_date, market_change=0
-        )
+        if self.fast_metrics:
+            strat_stats = generate_hyperopt_metrics(
+                self.backtesting.strategy.get_strategy_name(), backtesting_results,
+                min_date, max_date)
+        else:
+            strat_stats = generate_strategy_stats(
+                self.pairlist, self.backtesting.strategy.get_strategy_name(),
+                backtesting_results, min_date, max_date, market_change=0
+            )
         results_explanation = HyperoptTools.format_results_explanation_string(
             strat_stats, self.config['stake_currency'])
 
@@ -360,7 +389,7 @@ def _get_params_dict(self, dimensions: List[Dimension], raw_params: List[Any]) -
                                        min_date=min_date, max_date=max_date,
                                        config=self.config, processed=processed,
                                        backtest_stats=strat_stats)
-        return {
+        result = {
             'loss': loss,
             'params_dict': params_dict,
             'params_details': params_details,
@@ -369,6 +398,11 @@ def _get_params_dict(self, dimensions: List[Dimension], raw_params: List[Any]) -
             'results_explanation': results_explanation,
             'total_profit': total_profit,
         }
+        if self.fast_metrics and loss < self.current_best_loss:
+            # Possibly a new best epoch - keep the raw results to generate full statistics.
+            # Losses not better than the best loss known when this epoch was started can't be.
+            result['backtest_results'] = backtesting_results
+        return result
 
     def get_optimizer(self, dimensions: List[Dimension], cpu_count) -> Optimizer:
         estimator = self.custom_hyperopt.generate_estimator(dimensions=dimensions)
@@ -395,6 +429,107 @@ def _get_params_dict(self, dimensions: List[Dimension], raw_params: List[Any]) -
         return parallel(delayed(
                         wrap_non_picklable_objects(self.generate_optimizer))(v, i) for v in asked)
 
+    def run_optimizer_async(self, jobs: int, pbar: progressbar.ProgressBar) -> None:
+        """
+        Evaluate epochs without batch barriers: a new point is asked for and submitted
+        as soon as any worker finishes, so a slow epoch doesn't stall the other workers.
+        Results are numbered, saved and compared to the best result in order of completion.
+        """
+        executor = get_reusable_executor(max_workers=jobs)
+        optimize_func = wrap_non_picklable_objects(self.generate_optimizer)
+        # future -> (asked point, 1-based ask index)
+        pending: Dict[Future, Tuple[List[Any], int]] = {}
+        asked_count = 0
+        current = 0
+        try:
+            while current < self.total_epochs:
+                while len(pending) < jobs and asked_count < self.total_epochs:
+                    asked = self._ask_with_pending([x for x, _ in pending.values()])
+                    asked_count += 1
+                    pending[executor.submit(optimize_func, asked, asked_count)] = (
+                        asked, asked_count)
+
+                done, _ = wait(pending.keys(), return_when=FIRST_COMPLETED)
+                finished = [(pending.pop(future), future.result()) for future in done]
+                self.opt.tell([x for (x, _), _ in finished], [v['loss'] for _, v in finished])
+
+                for (_, ask_index), val in finished:
+                    current += 1
+                    self._evaluate_epoch_result(val, current, ask_index <= INITIAL_POINTS)
+                    pbar.update(current)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _ask_with_pending(self, pending: List[List[Any]]) -> List[Any]:
+        """
+        Ask the optimizer for one point, taking points still being evaluated into account.
+        Pending points are told to a copy of the optimizer with the best loss seen so far
+        ("constant liar"), so the same point is not suggested twice.
+        """
+        if not pending:
+            return self.opt.ask()
+        opt = self.opt.copy(random_state=self.opt.rng.randint(0, 2**31 - 1))
+        liar = min(self.opt.yi) if self.opt.yi else 0.0
+        opt.tell(pending, [liar] * len(pending))
+        return opt.ask()
+
+    def _evaluate_epoch_result(self, val: Dict[str, Any], current: int,
+                               is_initial_point: bool) -> None:
+        """
+        Number, print and save the result of one epoch, and update the best result.
+        """
+        val['current_epoch'] = current
+        val['is_initial_point'] = is_initial_point
+
+        logger.debug(f"Optimizer epoch evaluated: {val}")
+
+        is_best = HyperoptTools.is_best_loss(val, self.current_best_loss)
+        # This value is assigned here and not in the optimization method
+        # to keep proper order in the list of results. That's because
+        # evaluations can take different time. Here they are aligned in the
+        # order they will be shown to the user.
+        val['is_best'] = is_best
+        backtesting_results = val.pop('backtest_results', None)
+        if is_best and backtesting_results is not None:
+            val['results_metrics'] = generate_strategy_stats(
+                self.pairlist, self.backtesting.strategy.get_strategy_name(),
+                backtesting_results, self.min_date, self.max_date, market_change=0
+            )
+        self.print_results(val)
+
+        if is_best:
+            self.current_best_loss = val['loss']
+            self.current_best_epoch = val
+
+        self._save_result(val)
+
+    def _get_progressbar(self) -> progressbar.ProgressBar:
+        if self.print_colorized:
+            widgets = [
+                ' [Epoch ', progressbar.Counter(), ' of ', str(self.total_epochs),
+                ' (', progressbar.Percentage(), ')] ',
+                progressbar.Bar(marker=progressbar.AnimatedMarker(
+                    fill='\N{FULL BLOCK}',
+                    fill_wrap=Fore.GREEN + '{}' + Fore.RESET,
+                    marker_wrap=Style.BRIGHT + '{}' + Style.RESET_ALL,
+                )),
+                ' [', progressbar.ETA(), ', ', progressbar.Timer(), ']',
+            ]
+        else:
+            widgets = [
+                ' [Epoch ', progressbar.Counter(), ' of ', str(self.total_epochs),
+                ' (', progressbar.Percentage(), ')] ',
+                progressbar.Bar(marker=progressbar.AnimatedMarker(
+                    fill='\N{FULL BLOCK}',
+                )),
+                ' [', progressbar.ETA(), ', ', progressbar.Timer(), ']',
+            ]
+        return progressbar.ProgressBar(
+            max_value=self.total_epochs, redirect_stdout=False, redirect_stderr=False,
+            widgets=widgets
+        )
+
     def _set_random_state(self, random_state: Optional[int]) -> int:
         return random_state or random.randint(1, 2**16 - 1)
 
@@ -412,7 +547,10 @@ def _get_params_dict(self, dimensions: List[Dimension], raw_params: List[Any]) -
                     f'up to {self.max_date.strftime(DATETIME_PRINT_FORMAT)} '
                     f'({(self.max_date - self.min_date).days} days)..')
         # Store non-trimmed data - will be trimmed after signal generation.
-        dump(preprocessed, self.data_pickle_file)
+        if self.persistent_workers:
+            store_hyperopt_data(preprocessed, self.data_store_dir)
+        else:
+            dump(preprocessed, self.data_pickle_file)
 
     def start(self) -> None:
         self.random_state = self._set_random_state(self.config.get('hyperopt_random_state', None))
@@ -442,70 +580,34 @@ def _get_params_dict(self, dimensions: List[Dimension], raw_params: List[Any]) -
             colorama_init(autoreset=True)
 
         try:
-            with Parallel(n_jobs=config_jobs) as parallel:
-                jobs = parallel._effective_n_jobs()
+            if self.async_scheduler:
+                jobs = effective_n_jobs(config_jobs)
                 logger.info(f'Effective number of parallel workers used: {jobs}')
-
-                # Define progressbar
-                if self.print_colorized:
-                    widgets = [
-                        ' [Epoch ', progressbar.Counter(), ' of ', str(self.total_epochs),
-                        ' (', progressbar.Percentage(), ')] ',
-                        progressbar.Bar(marker=progressbar.AnimatedMarker(
-                            fill='\N{FULL BLOCK}',
-                            fill_wrap=Fore.GREEN + '{}' + Fore.RESET,
-                            marker_wrap=Style.BRIGHT + '{}' + Style.RESET_ALL,
-                        )),
-                        ' [', progressbar.ETA(), ', ', progressbar.Timer(), ']',
-                    ]
-                else:
-                    widgets = [
-                        ' [Epoch ', progressbar.Counter(), ' of ', str(self.total_epochs),
-                        ' (', progressbar.Percentage(), ')] ',
-                        progressbar.Bar(marker=progressbar.AnimatedMarker(
-                            fill='\N{FULL BLOCK}',
-                        )),
-                        ' [', progressbar.ETA(), ', ', progressbar.Timer(), ']',
-                    ]
-                with progressbar.ProgressBar(
-                    max_value=self.total_epochs, redirect_stdout=False, redirect_stderr=False,
-                    widgets=widgets
-                ) as pbar:
-                    EVALS = ceil(self.total_epochs / jobs)
-                    for i in range(EVALS):
-                        # Correct the number of epochs to be processed for the last
-                        # iteration (should not exceed self.total_epochs in total)
-                        n_rest = (i + 1) * jobs - self.total_epochs
-                        current_jobs = jobs - n_rest if n_rest > 0 else jobs
-
-                        asked = self.opt.ask(n_points=current_jobs)
-                        f_val = self.run_optimizer_parallel(parallel, asked, i)
-                        self.opt.tell(asked, [v['loss'] for v in f_val])
-
-                        # Calculate progressbar outputs
-                        for j, val in enumerate(f_val):
-                            # Use human-friendly indexes here (starting from 1)
-                            current = i * jobs + j + 1
-                            val['current_epoch'] = current
-                            val['is_initial_point'] = current <= INITIAL_POINTS
-
-                            logger.debug(f"Optimizer epoch evaluated: {val}")
-
-                            is_best = HyperoptTools.is_best_loss(val, self.current_best_loss)
-                            # This value is assigned here and not in the optimization method
-                            # to keep proper order in the list of results. That's because
-                            # evaluations can take different time. Here they are aligned in the
-                            # order they will be shown to the user.
-                            val['is_best'] = is_best
-                            self.print_results(val)
-
-                            if is_best:
-                                self.current_best_loss = val['loss']
-                                self.current_best_epoch = val
-
-                            self._save_result(val)
-
-                            pbar.update(current)
+                with self._get_progressbar() as pbar:
+                    self.run_optimizer_async(jobs, pbar)
+            else:
+                with Parallel(n_jobs=config_jobs) as parallel:
+                    jobs = parallel._effective_n_jobs()
+                    logger.info(f'Effective number of parallel workers used: {jobs}')
+                    with self._get_progressbar() as pbar:
+                        EVALS = ceil(self.total_epochs / jobs)
+                        for i in range(EVALS):
+                            # Correct the number of epochs to be processed for the last
+                            # iteration (should not exceed self.total_epochs in total)
+                            n_rest = (i + 1) * jobs - self.total_epochs
+                            current_jobs = jobs - n_rest if n_rest > 0 else jobs
+
+                            asked = self.opt.ask(n_points=current_jobs)
+                            f_val = self.run_optimizer_parallel(parallel, asked, i)
+                            self.opt.tell(asked, [v['loss'] for v in f_val])
+
+                            # Calculate progressbar outputs
+                            for j, val in enumerate(f_val):
+                                # Use human-friendly indexes here (starting from 1)
+                                current = i * jobs + j + 1
+                                self._evaluate_epoch_result(val, current,
+                                                            current <= INITIAL_POINTS)
+                                pbar.update(current)
 
         except KeyboardInterrupt:
             print('User interrupted..')
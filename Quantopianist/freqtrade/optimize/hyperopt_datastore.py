@@ -0,0 +1,89 @@
+"""
+Columnar, memory-mapped store for preprocessed hyperopt data.
+
+Float columns of every pair are stored as one .npy matrix (one contiguous array per column),
+all remaining columns (date, integer, bool and object columns) as joblib pickle.
+Worker processes map the store read-only once and keep it for all following epochs -
+the operating system shares the mapped pages between all workers.
+"""
+import logging
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import numpy as np
+import pandas as pd
+from joblib import dump, load
+from pandas import DataFrame
+
+
+logger = logging.getLogger(__name__)
+
+METADATA_FILE = 'metadata.pkl'
+
+# Data attached by this (worker) process, keyed by store directory and store version.
+_attached_store: Dict[Tuple[str, int], Dict[str, DataFrame]] = {}
+
+
+def store_hyperopt_data(data: Dict[str, DataFrame], directory: Path) -> None:
+    """
+    Write preprocessed data to a columnar store.
+    :param data: Dict of pair -> preprocessed dataframe
+    :param directory: Store directory. Existing content is replaced.
+    """
+    clear_hyperopt_data(directory)
+    directory.mkdir(parents=True)
+    metadata: Dict[str, Dict[str, Any]] = {}
+    for idx, (pair, df) in enumerate(data.items()):
+        float_columns = [col for col, dtype in df.dtypes.items() if dtype == np.float64]
+        other_columns = [col for col in df.columns if col not in float_columns]
+        # Transposed, so every column is contiguous - matching pandas' internal block layout.
+        np.save(directory / f'{idx}_floats.npy',
+                np.ascontiguousarray(df[float_columns].values.T))
+        dump(df[other_columns], directory / f'{idx}_other.pkl')
+        metadata[pair] = {'index': idx, 'float_columns': float_columns}
+    # Metadata is written last - it marks the store as complete.
+    dump(metadata, directory / METADATA_FILE)
+
+
+def load_hyperopt_data(directory: Path) -> Dict[str, DataFrame]:
+    """
+    Load the store as memory-mapped, read-only dataframes.
+    Float columns are placed after all other columns.
+    :param directory: Store directory
+    :return: Dict of pair -> dataframe
+    """
+    metadata = load(directory / METADATA_FILE)
+    data: Dict[str, DataFrame] = {}
+    for pair, meta in metadata.items():
+        floats = np.load(directory / f"{meta['index']}_floats.npy", mmap_mode='r')
+        other = load(directory / f"{meta['index']}_other.pkl", mmap_mode='r')
+        data[pair] = pd.concat([
+            other,
+            DataFrame(floats.T, columns=meta['float_columns'], index=other.index, copy=False)
+        ], axis=1, copy=False)
+    return data
+
+
+def attach_hyperopt_data(directory: Path) -> Dict[str, DataFrame]:
+    """
+    Attach to the store once per process, and keep it for subsequent calls.
+    Returns shallow copies, so columns added during an epoch don't leak into the next one.
+    :param directory: Store directory
+    :return: Dict of pair -> dataframe
+    """
+    key = (str(directory), (directory / METADATA_FILE).stat().st_mtime_ns)
+    if key not in _attached_store:
+        _attached_store.clear()
+        logger.debug(f"Attaching hyperopt data store {directory}.")
+        _attached_store[key] = load_hyperopt_data(directory)
+    return {pair: df.copy(deep=False) for pair, df in _attached_store[key].items()}
+
+
+def clear_hyperopt_data(directory: Path) -> None:
+    """
+    Remove the store from disk.
+    """
+    if directory.is_dir():
+        logger.info(f"Removing `{directory}`.")
+        shutil.rmtree(directory)
@@ -4,6 +4,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Union
 
+import numpy as np
 from numpy import int64
 from pandas import DataFrame, to_datetime
 from tabulate import tabulate
@@ -505,6 +506,69 @@ def generate_strategy_stats(pairlist: List[str],
     return strat_stats
 
 
+def generate_hyperopt_metrics(strategy: str, content: Dict[str, Any],
+                              min_date: datetime, max_date: datetime) -> Dict[str, Any]:
+    """
+    Lightweight alternative to generate_strategy_stats() for hyperopt epochs.
+    Only calculates the metrics shown in the hyperopt results table, the epoch explanation
+    and used by the builtin loss functions - using numpy on the trade columns.
+    :param strategy: Strategy name
+    :param content: Backtest result data in the format:
+                    {'results: results, 'config: config}}.
+    :param min_date: Backtest start date
+    :param max_date: Backtest end date
+    :return: Dictionary containing the summary metrics
+    """
+    results: DataFrame = content['results']
+    starting_balance = content['config']['dry_run_wallet']
+    backtest_days = (max_date - min_date).days or 1
+    total_trades = len(results)
+
+    profit_ratio = results['profit_ratio'].to_numpy(dtype=float)
+    profit_abs = results['profit_abs'].to_numpy(dtype=float)
+    holding_avg = (timedelta(minutes=round(float(results['trade_duration'].mean())))
+                   if total_trades else timedelta())
+
+    metrics = {
+        'strategy_name': strategy,
+        'stake_currency': content['config']['stake_currency'],
+        'total_trades': total_trades,
+        'wins': int((profit_ratio > 0).sum()),
+        'draws': int((profit_ratio == 0).sum()),
+        'losses': int((profit_ratio < 0).sum()),
+        'profit_mean': float(profit_ratio.mean()) if total_trades else 0,
+        'profit_median': float(np.median(profit_ratio)) if total_trades else 0,
+        'profit_total': float(profit_abs.sum()) / starting_balance,
+        'profit_total_abs': float(profit_abs.sum()),
+        'holding_avg': holding_avg,
+        'holding_avg_s': holding_avg.total_seconds(),
+        'backtest_days': backtest_days,
+        'trades_per_day': round(total_trades / backtest_days, 2),
+        'starting_balance': starting_balance,
+        'final_balance': content['final_balance'],
+        'max_drawdown': 0.0,
+        'max_drawdown_account': 0.0,
+        'max_drawdown_abs': 0.0,
+    }
+    if total_trades:
+        # Same drawdown definitions as calculate_max_drawdown(), on trades sorted by close date
+        order = np.argsort(results['close_date'].to_numpy(), kind='stable')
+        cumulative = np.cumsum(profit_ratio[order])
+        drawdown = cumulative - np.maximum.accumulate(cumulative)
+        if np.argmin(drawdown) > 0:
+            metrics['max_drawdown'] = float(-drawdown.min())
+
+        cumulative = np.cumsum(profit_abs[order])
+        high_value = np.maximum.accumulate(cumulative)
+        drawdown = cumulative - high_value
+        idx = int(np.argmin(drawdown))
+        if idx > 0:
+            metrics['max_drawdown_abs'] = float(-drawdown[idx])
+            metrics['max_drawdown_account'] = float(
+                -drawdown[idx] / (starting_balance + high_value[idx]))
+    return metrics
+
+
 def generate_backtest_stats(btdata: Dict[str, DataFrame],
                             all_results: Dict[str, Dict[str, Union[DataFrame, Dict]]],
                             min_date: datetime, max_date: datetime
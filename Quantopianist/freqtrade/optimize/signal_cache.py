@@ -0,0 +1,154 @@
+"""
+Cache for populated buy / sell signals.
+
+Hyperopt calls advise_buy() / advise_sell() for every pair in every epoch - even when only
+roi, stoploss or trailing spaces are optimized, or when sampled buy / sell parameters repeat.
+Signals only depend on the (unchanged) analyzed data and the buy / sell parameter values,
+so they are cached per pair and parameter set, in compact form.
+"""
+import logging
+from typing import Any, Hashable, Optional, Tuple
+
+import numpy as np
+from cachetools import LRUCache
+from pandas import DataFrame
+
+
+logger = logging.getLogger(__name__)
+
+SIGNAL_COLUMNS = ['buy', 'sell', 'buy_tag', 'exit_tag']
+
+# Maximum size of the cached signals (in bytes) per process
+SIGNAL_CACHE_MAX_SIZE = 256 * 1024 * 1024
+
+# Signals of this (worker) process - see get_signal_cache().
+_signal_cache: Optional['SignalCache'] = None
+
+
+class CachedSignals:
+    """
+    Populated signals of one pair. Signals are stored as int8, tags only if set.
+    """
+    __slots__ = ('buy', 'sell', 'buy_tag', 'exit_tag')
+
+    def __init__(self, buy: np.ndarray, sell: np.ndarray,
+                 buy_tag: Optional[np.ndarray], exit_tag: Optional[np.ndarray]) -> None:
+        self.buy = buy
+        self.sell = sell
+        self.buy_tag = buy_tag
+        self.exit_tag = exit_tag
+
+    @property
+    def nbytes(self) -> int:
+        size = self.buy.nbytes + self.sell.nbytes
+        for tags in (self.buy_tag, self.exit_tag):
+            if tags is not None:
+                size += tags.nbytes
+        return size
+
+    @classmethod
+    def from_dataframe(cls, dataframe: DataFrame) -> Optional['CachedSignals']:
+        """
+        Extract signals from an analyzed dataframe.
+        Returns None if signals can't be represented in compact form (values other than 0 / 1).
+        """
+        signals = []
+        for col in ('buy', 'sell'):
+            values = dataframe[col].values
+            if not np.isin(values, (0, 1)).all():
+                return None
+            signals.append(values.astype(np.int8))
+        tags = []
+        for col in ('buy_tag', 'exit_tag'):
+            values = dataframe[col].values
+            tags.append(values.astype(object) if dataframe[col].notna().any() else None)
+        return cls(signals[0], signals[1], tags[0], tags[1])
+
+    def apply(self, dataframe: DataFrame) -> DataFrame:
+        """
+        Assign the cached signals to `dataframe` (in place).
+        """
+        dataframe.loc[:, 'buy'] = self.buy
+        dataframe.loc[:, 'sell'] = self.sell
+        dataframe.loc[:, 'buy_tag'] = self.buy_tag if self.buy_tag is not None else None
+        dataframe.loc[:, 'exit_tag'] = self.exit_tag if self.exit_tag is not None else None
+        return dataframe
+
+
+class SignalCache:
+    """
+    LRU cache of populated signals, keyed by pair, data and buy / sell parameter values.
+    """
+
+    def __init__(self, maxsize: int = SIGNAL_CACHE_MAX_SIZE) -> None:
+        self._cache: LRUCache = LRUCache(maxsize=maxsize, getsizeof=lambda s: s.nbytes)
+        # Pairs where advise_buy() / advise_sell() add columns besides the signals.
+        # Their results can't be restored from signals alone.
+        self._uncacheable: set = set()
+
+    @staticmethod
+    def parameter_key(strategy: Any) -> Tuple:
+        """
+        Current values of all buy / sell parameters of `strategy` -
+        these are the only parameters the signal population depends on.
+        """
+        return tuple((name, _hashable(param.value))
+                     for category in ('buy', 'sell')
+                     for name, param in strategy.enumerate_parameters(category))
+
+    @staticmethod
+    def data_key(pair: str, dataframe: DataFrame) -> Tuple:
+        """
+        Identify the data signals were populated on.
+        """
+        if dataframe.empty:
+            return (pair, 0)
+        return (pair, len(dataframe), dataframe['date'].iloc[0].value,
+                dataframe['date'].iloc[-1].value)
+
+    def is_cacheable(self, pair: str) -> bool:
+        return pair not in self._uncacheable
+
+    def get(self, key: Hashable) -> Optional[CachedSignals]:
+        return self._cache.get(key)
+
+    def store(self, key: Hashable, pair: str, columns_before: Any,
+              dataframe: DataFrame) -> None:
+        """
+        Store signals of `dataframe` - unless signal population added other columns,
+        or the signals can't be stored in compact form.
+        :param columns_before: Columns of the dataframe before signals were populated
+        """
+        if set(dataframe.columns) - set(columns_before) - set(SIGNAL_COLUMNS):
+            logger.info(f"Not caching signals for {pair}, as signal population adds columns.")
+            self._uncacheable.add(pair)
+            return
+        signals = CachedSignals.from_dataframe(dataframe)
+        if signals is None:
+            self._uncacheable.add(pair)
+            return
+        if signals.nbytes <= self._cache.maxsize:
+            self._cache[key] = signals
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self._uncacheable.clear()
+
+
+def get_signal_cache() -> SignalCache:
+    """
+    Signal cache of this process. Kept for the lifetime of the (worker) process,
+    so cached signals are shared by all epochs evaluated by this process.
+    """
+    global _signal_cache
+    if _signal_cache is None:
+        _signal_cache = SignalCache()
+    return _signal_cache
+
+
+def _hashable(value: Any) -> Hashable:
+    if isinstance(value, list):
+        return tuple(_hashable(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _hashable(v)) for k, v in value.items()))
+    return value
@@ -1,5 +1,6 @@
 # flake8: noqa: F401
                      
+from freqtrade.persistence.iteration_snapshot import IterationSnapshot
 from freqtrade.persistence.models import init_db                              
 from freqtrade.persistence.pairlock_middleware import PairLocks
 from freqtrade.persistence.trade_model import LocalTrade, Order, Trade
@@ -0,0 +1,222 @@
+"""
+Results store for backtesting - trades and orders of many backtest runs in one database,
+so they can be analyzed with SQL instead of loading the json exports.
+Separate from the trade database of the bot (own tables / metadata).
+"""
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+from sqlalchemy import (Boolean, Column, DateTime, Float, ForeignKey, ForeignKeyConstraint, Index,
+                        Integer, MetaData, String, Table, UniqueConstraint, create_engine, insert)
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import NoSuchModuleError
+from sqlalchemy.pool import StaticPool
+
+from freqtrade.exceptions import OperationalException
+
+
+logger = logging.getLogger(__name__)
+
+_SQL_DOCS_URL = 'http://docs.sqlalchemy.org/en/latest/core/engines.html#database-urls'
+# Rows per executemany call
+BATCH_SIZE = 10000
+
+_METADATA = MetaData()
+
+backtest_runs = Table(
+    'backtest_runs', _METADATA,
+    Column('id', Integer, primary_key=True),
+    Column('run_id', String(255), nullable=False),
+    Column('strategy', String(255), nullable=False),
+    Column('backtest_run_start', DateTime, nullable=False),
+    Column('backtest_start', DateTime),
+    Column('backtest_end', DateTime),
+    Column('timeframe', String(25)),
+    Column('stake_currency', String(25)),
+    Column('starting_balance', Float),
+    Column('final_balance', Float),
+    Column('total_trades', Integer),
+    Column('profit_total', Float),
+    Column('profit_total_abs', Float),
+    Index('ix_backtest_runs_strategy_run_id', 'strategy', 'run_id'),
+)
+
+backtest_trades = Table(
+    'backtest_trades', _METADATA,
+    Column('id', Integer, primary_key=True),
+    Column('backtest_run_id', Integer, ForeignKey('backtest_runs.id'), nullable=False),
+    # Position of the trade in the backtest result - identifies the trade within the run
+    Column('trade_number', Integer, nullable=False),
+    # Denormalized from backtest_runs, to filter without joins
+    Column('run_id', String(255), nullable=False),
+    Column('strategy', String(255), nullable=False),
+    Column('pair', String(25), nullable=False),
+    Column('is_short', Boolean, nullable=False, default=False),
+    Column('is_open', Boolean, nullable=False, default=False),
+    Column('stake_amount', Float),
+    Column('amount', Float),
+    Column('open_date', DateTime, nullable=False),
+    Column('close_date', DateTime),
+    Column('open_rate', Float),
+    Column('close_rate', Float),
+    Column('fee_open', Float),
+    Column('fee_close', Float),
+    Column('trade_duration', Integer),
+    Column('profit_ratio', Float),
+    Column('profit_abs', Float),
+    Column('exit_reason', String(100)),
+    Column('enter_tag', String(100)),
+    Column('initial_stop_loss_abs', Float),
+    Column('initial_stop_loss_ratio', Float),
+    Column('stop_loss_abs', Float),
+    Column('stop_loss_ratio', Float),
+    Column('min_rate', Float),
+    Column('max_rate', Float),
+    UniqueConstraint('backtest_run_id', 'trade_number',
+                     name='uq_backtest_trades_run_trade_number'),
+    Index('ix_backtest_trades_strategy_pair', 'strategy', 'pair'),
+)
+
+backtest_orders = Table(
+    'backtest_orders', _METADATA,
+    Column('id', Integer, primary_key=True),
+    Column('backtest_run_id', Integer, nullable=False),
+    Column('trade_number', Integer, nullable=False),
+    Column('pair', String(25), nullable=False),
+    Column('ft_order_side', String(25), nullable=False),
+    Column('ft_is_entry', Boolean, nullable=False),
+    Column('amount', Float),
+    Column('safe_price', Float),
+    Column('order_filled_date', DateTime),
+    ForeignKeyConstraint(['backtest_run_id', 'trade_number'],
+                         ['backtest_trades.backtest_run_id', 'backtest_trades.trade_number']),
+    Index('ix_backtest_orders_run_trade_number', 'backtest_run_id', 'trade_number'),
+)
+
+# Trade columns taken from the backtest result (besides the run / position columns)
+_TRADE_COLUMNS = [column.name for column in backtest_trades.columns
+                  if column.name not in ('id', 'backtest_run_id', 'trade_number',
+                                         'run_id', 'strategy')]
+
+
+def get_backtest_results_engine(db_url: str) -> Engine:
+    """
+    Engine for the backtest results store. Creates missing tables.
+    :param db_url: Database to use (sqlalchemy url)
+    """
+    kwargs: Dict[str, Any] = {}
+    if db_url == 'sqlite://':
+        kwargs.update({
+            'poolclass': StaticPool,
+        })
+    if db_url.startswith('sqlite://'):
+        kwargs.update({
+            'connect_args': {'check_same_thread': False},
+        })
+    try:
+        engine = create_engine(db_url, future=True, **kwargs)
+    except NoSuchModuleError:
+        raise OperationalException(f"Given value for export_db_url: '{db_url}' "
+                                   f"is no valid database URL! (See {_SQL_DOCS_URL})")
+    _METADATA.create_all(engine)
+    return engine
+
+
+def _ms_to_datetime(timestamp_ms: Optional[int]) -> Optional[datetime]:
+    if timestamp_ms is None:
+        return None
+    return datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc).replace(tzinfo=None)
+
+
+def _trade_rows(trades: List[Dict[str, Any]], backtest_run_id: int, run_id: str,
+                strategy: str) -> List[Dict[str, Any]]:
+    df = pd.DataFrame(trades)
+    if 'enter_tag' not in df.columns and 'buy_tag' in df.columns:
+        df['enter_tag'] = df['buy_tag']
+    df = df.reindex(columns=_TRADE_COLUMNS)
+    for col in ('open_date', 'close_date'):
+        # Dates are stored as naive utc, like in the trade database
+        df[col] = pd.to_datetime(df[col], utc=True).dt.tz_localize(None)
+    df['is_short'] = df['is_short'].fillna(False).astype(bool)
+    df['is_open'] = df['is_open'].fillna(False).astype(bool)
+    df = df.astype(object).where(df.notna(), None)
+    df.insert(0, 'backtest_run_id', backtest_run_id)
+    df.insert(1, 'trade_number', range(len(df)))
+    df.insert(2, 'run_id', run_id)
+    df.insert(3, 'strategy', strategy)
+    rows = df.to_dict(orient='records')
+    for row in rows:
+        for col in ('open_date', 'close_date'):
+            if row[col] is not None:
+                row[col] = row[col].to_pydatetime()
+        if row['trade_duration'] is not None:
+            row['trade_duration'] = int(row['trade_duration'])
+    return rows
+
+
+def _order_rows(trades: List[Dict[str, Any]], backtest_run_id: int) -> List[Dict[str, Any]]:
+    return [{
+        'backtest_run_id': backtest_run_id,
+        'trade_number': trade_number,
+        'pair': trade['pair'],
+        'ft_order_side': order['ft_order_side'],
+        'ft_is_entry': order['ft_is_entry'],
+        'amount': order['amount'],
+        'safe_price': order['safe_price'],
+        'order_filled_date': _ms_to_datetime(order['order_filled_timestamp']),
+    } for trade_number, trade in enumerate(trades) for order in trade.get('orders') or []]
+
+
+def _insert_batched(connection: Connection, table: Table, rows: List[Dict[str, Any]],
+                    batch_size: int) -> None:
+    for start in range(0, len(rows), batch_size):
+        connection.execute(insert(table), rows[start:start + batch_size])
+
+
+def store_backtest_results(db_url: str, stats: Dict[str, Any],
+                           batch_size: int = BATCH_SIZE) -> Dict[str, int]:
+    """
+    Stores trades and orders of backtest results (as generated by generate_backtest_stats())
+    in the results store - one backtest run per strategy, each in its own transaction.
+    :param db_url: Database to use (sqlalchemy url)
+    :param stats: Backtest results, including metadata
+    :param batch_size: Rows inserted per executemany call
+    :return: Dict of strategy name -> id of the stored backtest run (backtest_runs.id)
+    """
+    engine = get_backtest_results_engine(db_url)
+    metadata = stats['metadata']
+    stored = {}
+    for strategy, strat_stats in stats['strategy'].items():
+        run_metadata = metadata.get(strategy, {})
+        run_id = run_metadata.get('run_id', '')
+        trades = strat_stats['trades']
+        with engine.begin() as connection:
+            result = connection.execute(insert(backtest_runs).values(
+                run_id=run_id,
+                strategy=strategy,
+                backtest_run_start=datetime.fromtimestamp(
+                    strat_stats['backtest_run_start_ts'], tz=timezone.utc).replace(tzinfo=None),
+                backtest_start=_ms_to_datetime(strat_stats['backtest_start_ts']),
+                backtest_end=_ms_to_datetime(strat_stats['backtest_end_ts']),
+                timeframe=strat_stats['timeframe'],
+                stake_currency=strat_stats['stake_currency'],
+                starting_balance=strat_stats['starting_balance'],
+                final_balance=strat_stats['final_balance'],
+                total_trades=strat_stats['total_trades'],
+                profit_total=strat_stats['profit_total'],
+                profit_total_abs=strat_stats['profit_total_abs'],
+            ))
+            backtest_run_id = result.inserted_primary_key[0]
+            if trades:
+                _insert_batched(connection, backtest_trades,
+                                _trade_rows(trades, backtest_run_id, run_id, strategy),
+                                batch_size)
+                _insert_batched(connection, backtest_orders,
+                                _order_rows(trades, backtest_run_id), batch_size)
+        logger.info(f"Stored {len(trades)} trades of {strategy} in the backtest results "
+                    f"database (backtest run {backtest_run_id}).")
+        stored[strategy] = backtest_run_id
+    engine.dispose()
+    return stored
@@ -0,0 +1,72 @@
+"""
+Per-iteration cache of frequently read persistence data (open trades, closed profit, locks).
+"""
+import threading
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+
+T = TypeVar('T')
+
+_local = threading.local()
+# Bumped on every commit / rollback in any thread - snapshots loaded before are outdated
+_generation = 0
+_generation_lock = threading.Lock()
+
+
+class IterationSnapshot:
+    """
+    Caches database reads for one bot iteration - between begin() and end(), and only in the
+    thread which called begin(). Other threads (RPC) always read from the database.
+    The cache is dropped on every commit / rollback - in any thread, so writes from RPC
+    (force exit, force entry, unlock, ...) are seen by the next read of the iteration.
+    """
+
+    @staticmethod
+    def begin() -> None:
+        _local.values = {}
+        _local.generation = _generation
+        _local.started = datetime.now(timezone.utc)
+
+    @staticmethod
+    def end() -> None:
+        _local.values = None
+        _local.started = None
+
+    @staticmethod
+    def active() -> bool:
+        return getattr(_local, 'values', None) is not None
+
+    @staticmethod
+    def started() -> Optional[datetime]:
+        """
+        Start of the current iteration, None if no snapshot is active.
+        """
+        return getattr(_local, 'started', None)
+
+    @staticmethod
+    def invalidate() -> None:
+        """
+        Drop the cached values of all threads.
+        """
+        global _generation
+        with _generation_lock:
+            _generation += 1
+
+    @staticmethod
+    def get(key: str, loader: Callable[[], T]) -> T:
+        """
+        Cached value for `key` - loaded via `loader` on first access after begin() or
+        the last invalidation. Without active snapshot, `loader` is called every time.
+        """
+        values: Optional[Dict[str, Any]] = getattr(_local, 'values', None)
+        if values is None:
+            return loader()
+        # Read before loading - a write during the load outdates the loaded value
+        generation = _generation
+        if _local.generation != generation:
+            values.clear()
+            _local.generation = generation
+        if key not in values:
+            values[key] = loader()
+        return values[key]
@@ -1,7 +1,7 @@
 import logging
 from typing import List
 
-from sqlalchemy import inspect, select, text, tuple_, update
+from sqlalchemy import Index, inspect, select, text, tuple_, update
 
 from freqtrade.exceptions import OperationalException
 from freqtrade.persistence.trade_model import Order, Trade
@@ -288,6 +288,30 @@ def fix_old_dry_orders(engine):
         connection.execute(stmt)
 
 
+def add_pairlock_indexes(decl_base) -> None:
+    """
+    Index for active locks by end time (PairLocks.get_pair_locks()), queried on every iteration.
+    """
+    table = decl_base.metadata.tables['pairlocks']
+    if 'ix_pairlocks_active_lock_end_time' not in {index.name for index in table.indexes}:
+        Index('ix_pairlocks_active_lock_end_time', table.c.active, table.c.lock_end_time)
+
+
+def create_missing_indexes(engine, decl_base) -> None:
+    """
+    Create indexes defined on the models which are missing in the database.
+    create_all() only creates indexes together with new tables.
+    """
+    add_pairlock_indexes(decl_base)
+    inspector = inspect(engine)
+    for table in decl_base.metadata.sorted_tables:
+        existing = {index['name'] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                logger.info(f"Creating index {index.name} on {table.name}.")
+                index.create(bind=engine)
+
+
 def check_migrate(engine, decl_base, previous_tables) -> None:
     """
     Checks if migration is necessary and migrates if necessary
@@ -333,6 +357,7 @@ def check_migrate(engine, decl_base, previous_tables) -> None:
 
     set_sqlite_to_wal(engine)
     fix_old_dry_orders(engine)
+    create_missing_indexes(engine, decl_base)
 
     if migrating:
         logger.info("Database migration finished.")
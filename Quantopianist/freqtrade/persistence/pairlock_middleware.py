@@ -3,6 +3,7 @@ from datetime import datetime, timezone
 from typing import List, Optional
 
 from freqtrade.exchange import timeframe_to_next_date
+from freqtrade.persistence.iteration_snapshot import IterationSnapshot
 from freqtrade.persistence.models import PairLock
 
 
@@ -53,6 +54,7 @@ class PairLocks():
         if PairLocks.use_db:
             PairLock.query.session.add(lock)
             PairLock.query.session.commit()
+            IterationSnapshot.invalidate()
         else:
             PairLocks.locks.append(lock)
         return lock
@@ -69,6 +71,16 @@ class PairLocks():
         if not now:
             now = datetime.now(timezone.utc)
 
+        started = IterationSnapshot.started()
+        if PairLocks.use_db and started and now >= started:
+            # Locks active at the start of the iteration, loaded once per iteration
+            locks = IterationSnapshot.get('pair_locks', lambda: PairLock.query.filter(
+                PairLock.lock_end_time > started, PairLock.active.is_(True)).all())
+            return [lock for lock in locks if (
+                PairLocks._lock_end_time(lock) > now
+                and (not pair or lock.pair == pair)
+                and (lock.side == side or (side != '*' and lock.side == '*'))
+            )]
         if PairLocks.use_db:
             return PairLock.query_pair_locks(pair, now, side).all()
         else:
@@ -80,6 +92,12 @@ class PairLocks():
             )]
             return locks
 
+    @staticmethod
+    def _lock_end_time(lock: PairLock) -> datetime:
+        # Dates loaded from the database are naive (UTC)
+        end = lock.lock_end_time
+        return end if end.tzinfo else end.replace(tzinfo=timezone.utc)
+
     @staticmethod
     def get_pair_longest_lock(
             pair: str, now: Optional[datetime] = None, side: str = '*') -> Optional[PairLock]:
@@ -107,6 +125,7 @@ class PairLocks():
             lock.active = False
         if PairLocks.use_db:
             PairLock.query.session.commit()
+            IterationSnapshot.invalidate()
 
     @staticmethod
     def unlock_reason(reason: str, now: Optional[datetime] = None) -> None:
@@ -131,6 +150,7 @@ class PairLocks():
                 logger.info(f"Releasing lock for {lock.pair} with reason '{reason}'.")
                 lock.active = False
             PairLock.query.session.commit()
+            IterationSnapshot.invalidate()
         else:
             # used in backtesting mode; don't show log messages for speed
             locks = PairLocks.get_pair_locks(None)
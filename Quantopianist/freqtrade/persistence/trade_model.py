@@ -2,12 +2,12 @@
 This module contains the class to persist trades into SQLite
 """
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from math import isclose
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import (Boolean, Column, DateTime, Enum, Float, ForeignKey, Integer, String,
-                        UniqueConstraint, desc, func)
+from sqlalchemy import (Boolean, Column, DateTime, Enum, Float, ForeignKey, Index, Integer, String,
+                        UniqueConstraint, desc, func, text)
 from sqlalchemy.orm import Query, lazyload, relationship
 
 from freqtrade.constants import (DATETIME_PRINT_FORMAT, MATH_CLOSE_PREC, NON_OPEN_EXCHANGE_STATES,
@@ -18,6 +18,7 @@ from freqtrade.exchange import amount_to_precision, price_to_precision
 from freqtrade.exchange.exchange import amount_to_contracts, contracts_to_amount
 from freqtrade.leverage import interest
 from freqtrade.persistence.base import _DECL_BASE
+from freqtrade.persistence.iteration_snapshot import IterationSnapshot
 from freqtrade.util import FtPrecise
 
 
@@ -38,7 +39,11 @@ class Order(_DECL_BASE):
     __tablename__ = 'orders'
     # Uniqueness should be ensured over pair, order_id
     # its likely that order_id is unique per Pair on some exchanges.
-    __table_args__ = (UniqueConstraint('ft_pair', 'order_id', name="_order_pair_order_id"),)
+    __table_args__ = (
+        UniqueConstraint('ft_pair', 'order_id', name="_order_pair_order_id"),
+        # Trading volume (filled orders since a date)
+        Index('ix_orders_status_order_filled_date', 'status', 'order_filled_date'),
+    )
 
     id = Column(Integer, primary_key=True)
     ft_trade_id = Column(Integer, ForeignKey('trades.id'), index=True)
@@ -1047,7 +1052,12 @@ class LocalTrade():
     def get_open_trades() -> List[Any]:
         """
         Query trades from persistence layer
+        Served from the iteration snapshot if one is active (see IterationSnapshot).
         """
+        if IterationSnapshot.active():
+            trades = IterationSnapshot.get(
+                'open_trades', lambda: Trade.get_trades_proxy(is_open=True))
+            return [trade for trade in trades if trade.is_open]
         return Trade.get_trades_proxy(is_open=True)
 
     @staticmethod
@@ -1055,6 +1065,8 @@ class LocalTrade():
         """
         get open trade count
         """
+        if IterationSnapshot.active():
+            return len(Trade.get_open_trades())
         if Trade.use_db:
             return Trade.query.filter(Trade.is_open.is_(True)).count()
         else:
@@ -1089,6 +1101,18 @@ class Trade(_DECL_BASE, LocalTrade):
     Note: Fields must be aligned with LocalTrade class
     """
     __tablename__ = 'trades'
+    # Indexes for the queries run on every bot iteration / rpc call.
+    # Added to existing databases by migrations.create_missing_indexes().
+    __table_args__ = (
+        # Open / closed trades of one pair
+        Index('ix_trades_pair_is_open', 'pair', 'is_open'),
+        # Closed trades by close date (profit statistics)
+        Index('ix_trades_is_open_close_date', 'is_open', 'close_date'),
+        # Trades with open orders - partial index, most trades have none
+        Index('ix_trades_open_order_id', 'open_order_id',
+              sqlite_where=text('open_order_id IS NOT NULL'),
+              postgresql_where=text('open_order_id IS NOT NULL')),
+    )
 
     use_db: bool = True
 
@@ -1177,10 +1201,12 @@ class Trade(_DECL_BASE, LocalTrade):
     @staticmethod
     def commit():
         Trade.query.session.commit()
+        IterationSnapshot.invalidate()
 
     @staticmethod
     def rollback():
         Trade.query.session.rollback()
+        IterationSnapshot.invalidate()
 
     @staticmethod
     def get_trades_proxy(*, pair: str = None, is_open: bool = None,
@@ -1273,8 +1299,8 @@ class Trade(_DECL_BASE, LocalTrade):
         Retrieves total realized profit
         """
         if Trade.use_db:
-            total_profit = Trade.query.with_entities(
-                func.sum(Trade.close_profit_abs)).filter(Trade.is_open.is_(False)).scalar()
+            total_profit = IterationSnapshot.get('closed_profit', lambda: Trade.query.with_entities(
+                func.sum(Trade.close_profit_abs)).filter(Trade.is_open.is_(False)).scalar())
         else:
             total_profit = sum(
                 t.close_profit_abs for t in LocalTrade.get_trades_proxy(is_open=False))
@@ -1286,7 +1312,9 @@ class Trade(_DECL_BASE, LocalTrade):
         Calculates total invested amount in open trades
         in stake currency
         """
-        if Trade.use_db:
+        if IterationSnapshot.active():
+            total_open_stake_amount = sum(t.stake_amount for t in Trade.get_open_trades())
+        elif Trade.use_db:
             total_open_stake_amount = Trade.query.with_entities(
                 func.sum(Trade.stake_amount)).filter(Trade.is_open.is_(True)).scalar()
         else:
@@ -1470,3 +1498,55 @@ class Trade(_DECL_BASE, LocalTrade):
             Order.status == 'closed'
         ).scalar()
         return trading_volume
+
+    @staticmethod
+    def get_profit_per_period(timeunit: str, start_date: datetime, end_date: datetime
+                              ) -> Dict[date, Tuple[float, int]]:
+        """
+        Realized profit and number of closed trades per day, week or month - aggregated
+        in one query, grouped by the database.
+        NOTE: Not supported in Backtesting.
+        :param timeunit: 'days', 'weeks' (starting monday) or 'months'
+        :param start_date: Include trades closed at or after this date (naive UTC)
+        :param end_date: Include trades closed before this date (naive UTC)
+        :return: Dict of period start date -> (profit_abs, trade count).
+            Periods without closed trades are missing.
+        """
+        filters = [Trade.is_open.is_(False), Trade.close_date >= start_date,
+                   Trade.close_date < end_date]
+        dialect = Trade.query.session.get_bind().dialect.name
+        if dialect == 'sqlite':
+            period = {
+                'days': func.date(Trade.close_date),
+                # Next sunday (or the same day if sunday), 6 days back
+                'weeks': func.date(Trade.close_date, 'weekday 0', '-6 days'),
+                'months': func.strftime('%Y-%m-01', Trade.close_date),
+            }[timeunit]
+        elif dialect == 'postgresql':
+            period = func.date(func.date_trunc(
+                {'days': 'day', 'weeks': 'week', 'months': 'month'}[timeunit],
+                Trade.close_date))
+        else:
+            # Aggregate in python - still with a single query
+            result: Dict[date, Tuple[float, int]] = {}
+            for close_date, profit_abs in Trade.query.session.query(
+                    Trade.close_date, Trade.close_profit_abs).filter(*filters):
+                key = close_date.date()
+                if timeunit == 'weeks':
+                    key -= timedelta(days=key.weekday())
+                elif timeunit == 'months':
+                    key = key.replace(day=1)
+                profit, count = result.get(key, (0.0, 0))
+                result[key] = (profit + (profit_abs or 0), count + 1)
+            return result
+
+        period = period.label('period')
+        rows = Trade.query.session.query(
+            period,
+            func.sum(Trade.close_profit_abs),
+            func.count(Trade.id)
+        ).filter(*filters).group_by(period).all()
+        return {
+            (date.fromisoformat(key) if isinstance(key, str) else key): (profit or 0.0, count)
+            for key, profit, count in rows
+        }
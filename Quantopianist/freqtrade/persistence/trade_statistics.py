@@ -0,0 +1,269 @@
+"""
+Running statistics of closed trades, for the /profit and /stats rpc endpoints.
+"""
+import logging
+from copy import copy, deepcopy
+from datetime import datetime
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from freqtrade.persistence.trade_model import Order, Trade
+
+
+logger = logging.getLogger(__name__)
+
+# Changes to already accumulated data - bumped once the change is committed.
+# 'trades': closed trades changed / deleted / reopened, 'orders': closed orders changed / deleted
+_changes = {'trades': 0, 'orders': 0}
+_changes_lock = Lock()
+_PENDING_KEY = 'trade_statistics_pending'
+
+# Attributes which don't affect the statistics once a trade / an order is closed
+_TRADE_ATTRIBUTES = ('pair', 'is_open', 'open_date', 'close_date', 'close_profit',
+                     'close_profit_abs', 'exit_reason')
+_ORDER_ATTRIBUTES = ('status', 'cost', 'order_filled_date')
+
+
+def _committed_value(target: Any, attribute: str) -> Any:
+    history = inspect(target).attrs[attribute].history
+    committed = history.deleted or history.unchanged
+    if committed:
+        return committed[0]
+    # Not loaded - unless changed, the current value is the committed one
+    return None if history.added else getattr(target, attribute)
+
+
+def _mark_pending(target: Any, kind: str) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_KEY, set()).add(kind)
+
+
+def _trade_attribute_set(target: Trade, value: Any, oldvalue: Any, initiator: Any) -> None:
+    # Trades closed in the database were accumulated already
+    if value != oldvalue and _committed_value(target, 'is_open') is False:
+        _mark_pending(target, 'trades')
+
+
+def _order_attribute_set(target: Order, value: Any, oldvalue: Any, initiator: Any) -> None:
+    if value != oldvalue and _committed_value(target, 'status') == 'closed':
+        _mark_pending(target, 'orders')
+
+
+def _trade_deleted(mapper: Any, connection: Any, target: Trade) -> None:
+    _mark_pending(target, 'trades')
+
+
+def _order_deleted(mapper: Any, connection: Any, target: Order) -> None:
+    _mark_pending(target, 'orders')
+
+
+def _after_commit(session: Session) -> None:
+    for kind in session.info.pop(_PENDING_KEY, ()):
+        with _changes_lock:
+            _changes[kind] += 1
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+for _attribute in _TRADE_ATTRIBUTES:
+    event.listen(getattr(Trade, _attribute), 'set', _trade_attribute_set, active_history=True)
+for _attribute in _ORDER_ATTRIBUTES:
+    event.listen(getattr(Order, _attribute), 'set', _order_attribute_set, active_history=True)
+event.listen(Trade, 'after_delete', _trade_deleted)
+event.listen(Order, 'after_delete', _order_deleted)
+event.listen(Session, 'after_commit', _after_commit)
+event.listen(Session, 'after_rollback', _after_rollback)
+
+
+class TradeStatistics:
+    """
+    Statistics of the closed trades, accumulated trade by trade in close order,
+    and the trading volume of closed orders.
+    update() only loads trades closed (orders filled) since the last update - and rebuilds
+    the statistics from scratch once changes to already accumulated trades or orders
+    are committed (deleted trades, fee / profit corrections, reopened trades).
+    Changes made directly in the database, bypassing the bot, are not detected.
+    NOTE: Not supported in Backtesting.
+    """
+
+    def __init__(self, start_date: Optional[datetime] = None) -> None:
+        """
+        :param start_date: Only include trades closed at or after this date
+        """
+        self._start_date = start_date
+        self._lock = Lock()
+        self._changes: Dict[str, int] = {}
+        self._reset()
+        self._reset_orders()
+
+    def _reset_orders(self) -> None:
+        # (order_filled_date, id) of the last order added
+        self._last_filled: Optional[Tuple[datetime, int]] = None
+        self.trading_volume = 0.0
+
+    def _reset(self) -> None:
+        # (close_date, id) of the last trade added
+        self._last_closed: Optional[Tuple[datetime, int]] = None
+        self.trade_count = 0
+        self.profit_abs_sum = 0.0
+        self.profit_ratio_sum = 0.0
+        # Winning / losing trades as reported by /profit (break-even trades count as winning)
+        self.winning_trades = 0
+        self.losing_trades = 0
+        self.winning_profit = 0.0
+        self.losing_profit = 0.0
+        self.duration_sum = 0.0
+        self.duration_count = 0
+        # (id, open_date) of the trades with the lowest and highest id
+        self.first_trade: Optional[Tuple[int, datetime]] = None
+        self.last_trade: Optional[Tuple[int, datetime]] = None
+        # Sum of profit ratios per pair - for the best pair
+        self.pair_profits: Dict[str, float] = {}
+        # Wins / losses / draws per exit reason and their durations, as reported by /stats
+        self.exit_reasons: Dict[str, Dict[str, int]] = {}
+        self.result_durations: Dict[str, List[float]] = {
+            'wins': [0.0, 0], 'draws': [0.0, 0], 'losses': [0.0, 0]}
+        # Drawdown state - cumulative profit, its high, and both at the max drawdown
+        self._cumulative = 0.0
+        self._high_value: Optional[float] = None
+        self._max_drawdown: Optional[Tuple[float, float]] = None
+
+    def update(self) -> 'TradeStatistics':
+        """
+        Add trades closed since the last update.
+        :return: Consistent copy of the statistics, safe to read while other threads update
+        """
+        with self._lock:
+            # Read before loading - changes committed during the load cause another rebuild
+            with _changes_lock:
+                changes = dict(_changes)
+            if self._changes and changes['trades'] != self._changes['trades']:
+                logger.info("Closed trades changed, rebuilding trade statistics.")
+                self._reset()
+            if self._changes and changes['orders'] != self._changes['orders']:
+                self._reset_orders()
+            self._changes = changes
+            self._add_trades(self._query_closed_trades(self._last_closed))
+            self._add_orders(self._query_closed_orders(self._last_filled))
+            result = copy(self)
+            result.exit_reasons = deepcopy(self.exit_reasons)
+            result.result_durations = deepcopy(self.result_durations)
+            result.pair_profits = dict(self.pair_profits)
+        return result
+
+    def _filters(self) -> List:
+        filters = [Trade.is_open.is_(False)]
+        if self._start_date:
+            filters.append(Trade.close_date >= self._start_date)
+        return filters
+
+    def _query_closed_trades(self, after: Optional[Tuple[datetime, int]]) -> List:
+        filters = self._filters()
+        if after:
+            filters.append((Trade.close_date > after[0])
+                           | ((Trade.close_date == after[0]) & (Trade.id > after[1])))
+        # Only query necessary columns for performance reasons.
+        return Trade.query.session.query(
+            Trade.id, Trade.pair, Trade.open_date, Trade.close_date, Trade.close_profit,
+            Trade.close_profit_abs, Trade.exit_reason
+        ).filter(*filters).order_by(Trade.close_date, Trade.id).all()
+
+    def _query_closed_orders(self, after: Optional[Tuple[datetime, int]]) -> List:
+        filters = [Order.status == 'closed', Order.order_filled_date.isnot(None)]
+        if self._start_date:
+            filters.append(Order.order_filled_date >= self._start_date)
+        if after:
+            filters.append((Order.order_filled_date > after[0])
+                           | ((Order.order_filled_date == after[0]) & (Order.id > after[1])))
+        return Trade.query.session.query(
+            Order.id, Order.order_filled_date, Order.cost
+        ).filter(*filters).order_by(Order.order_filled_date, Order.id).all()
+
+    def _add_orders(self, orders: List) -> None:
+        for order in orders:
+            self.trading_volume += order.cost or 0.0
+            self._last_filled = (order.order_filled_date, order.id)
+
+    def _add_trades(self, trades: List) -> None:
+        for trade in trades:
+            profit_abs = trade.close_profit_abs or 0.0
+            profit_ratio = trade.close_profit or 0.0
+            self.trade_count += 1
+            self.profit_abs_sum += profit_abs
+            self.profit_ratio_sum += profit_ratio
+            if profit_ratio >= 0:
+                self.winning_trades += 1
+                self.winning_profit += profit_abs
+            else:
+                self.losing_trades += 1
+                self.losing_profit += profit_abs
+
+            duration = None
+            if trade.close_date is not None and trade.open_date is not None:
+                duration = (trade.close_date - trade.open_date).total_seconds()
+                self.duration_sum += duration
+                self.duration_count += 1
+
+            if self.first_trade is None or trade.id < self.first_trade[0]:
+                self.first_trade = (trade.id, trade.open_date)
+            if self.last_trade is None or trade.id > self.last_trade[0]:
+                self.last_trade = (trade.id, trade.open_date)
+            if trade.close_profit is not None:
+                self.pair_profits[trade.pair] = (
+                    self.pair_profits.get(trade.pair, 0.0) + trade.close_profit)
+
+            result = 'wins' if profit_ratio > 0 else 'losses' if profit_ratio < 0 else 'draws'
+            reason = self.exit_reasons.setdefault(
+                trade.exit_reason, {'wins': 0, 'losses': 0, 'draws': 0})
+            reason[result] += 1
+            if duration is not None:
+                self.result_durations[result][0] += duration
+                self.result_durations[result][1] += 1
+
+            self._cumulative += profit_abs
+            if self._high_value is None or self._cumulative > self._high_value:
+                self._high_value = self._cumulative
+            drawdown = self._cumulative - self._high_value
+            if drawdown < 0 and (self._max_drawdown is None
+                                 or drawdown < self._max_drawdown[1] - self._max_drawdown[0]):
+                self._max_drawdown = (self._high_value, self._cumulative)
+            self._last_closed = (trade.close_date, trade.id)
+
+    def best_pair(self) -> Optional[Tuple[str, float]]:
+        """
+        Pair with the highest sum of profit ratios (like Trade.get_best_pair()).
+        :return: Tuple containing (pair, profit_sum), None without closed trades
+        """
+        if not self.pair_profits:
+            return None
+        return max(self.pair_profits.items(), key=lambda item: item[1])
+
+    def max_drawdown(self, starting_balance: float) -> Tuple[float, float]:
+        """
+        Maximum drawdown of the closed trades (like calculate_max_drawdown()).
+        :param starting_balance: Portfolio starting balance, for the relative drawdown
+        :return: Tuple of absolute and relative max drawdown. 0 if there was no drawdown.
+        """
+        if self._max_drawdown is None:
+            return 0.0, 0.0
+        high_value, low_value = self._max_drawdown
+        if starting_balance:
+            max_balance = starting_balance + high_value
+            relative = (max_balance - (starting_balance + low_value)) / max_balance
+        else:
+            # NOTE: Not accurate without starting balance (like calculate_max_drawdown())
+            relative = (high_value - low_value) / high_value if high_value else 0.0
+        return high_value - low_value, relative
+
+    def result_duration_means(self) -> Dict[str, Optional[float]]:
+        """
+        Mean duration (seconds) of winning, losing and break-even trades, as reported by /stats
+        """
+        return {result: total / count if count else None
+                for result, (total, count) in self.result_durations.items()}
@@ -87,7 +87,7 @@ class AgeFilter(IPairList):
                        .floor('day')
                        .shift(days=since_days)
                        .float_timestamp) * 1000
-        candles = self._exchange.refresh_latest_ohlcv(needed_pairs, since_ms=since_ms, cache=False)
+        candles = self._exchange.refresh_historic_ohlcv(needed_pairs, since_ms)
         if self._enabled:
             for p in deepcopy(pairlist):
                 daily_candles = candles[(p, '1d', self._config['candle_type_def'])] if (
@@ -6,6 +6,8 @@ from abc import ABC, abstractmethod, abstractproperty
 from copy import deepcopy
 from typing import Any, Dict, List
 
+from pandas import DataFrame
+
 from freqtrade.exceptions import OperationalException
 from freqtrade.exchange import Exchange, market_is_active
 from freqtrade.mixins import LoggingMixin
@@ -73,6 +75,30 @@ class IPairList(LoggingMixin, ABC):
         """
         raise NotImplementedError()
 
+    def filter_frame(self, frame: DataFrame) -> DataFrame:
+        """
+        Vectorized alternative to _validate_pair() - checks all pairs at once.
+        Used by the generic filter_pairlist() if implemented by the Pairlist Handler.
+
+        :param frame: Tickers and market data of the pairs to check, indexed by pair
+            (see pairlist_helpers.build_pairlist_frame())
+        :return: frame, reduced to the pairs that can stay
+        """
+        raise NotImplementedError()
+
+    @property
+    def _has_filter_frame(self) -> bool:
+        return type(self).filter_frame is not IPairList.filter_frame
+
+    def _log_removed_pairs(self, pairs: List[str], reason: str) -> None:
+        """
+        Log pairs removed by filter_frame() - one message per check instead of one per pair,
+        which would dominate the runtime on large markets.
+        """
+        if pairs:
+            self.log_once(f"Removed {len(pairs)} pairs from whitelist, because {reason}: "
+                          f"{', '.join(pairs)}", logger.info)
+
     def gen_pairlist(self, tickers: Dict) -> List[str]:
         """
         Generate the pairlist.
@@ -95,8 +121,8 @@ class IPairList(LoggingMixin, ABC):
         Filters and sorts pairlist and returns the whitelist again.
 
         Called on each bot iteration - please use internal caching if necessary
-        This generic implementation calls self._validate_pair() for each pair
-        in the pairlist.
+        This generic implementation calls self.filter_frame() with all pairs if
+        implemented, and self._validate_pair() for each pair in the pairlist otherwise.
 
         Some Pairlist Handlers override this generic implementation and employ
         own filtration.
@@ -105,6 +131,9 @@ class IPairList(LoggingMixin, ABC):
         :param tickers: Tickers (from exchange.get_tickers()). May be cached.
         :return: new whitelist
         """
+        if self._enabled and self._has_filter_frame:
+            frame = self._pairlistmanager.get_pairlist_frame(tickers)
+            return list(self.filter_frame(frame.reindex(pairlist)).index)
         if self._enabled:
             # Copy list since we're modifying this list
             for p in deepcopy(pairlist):
@@ -4,6 +4,9 @@ Price pair list filter
 import logging
 from typing import Any, Dict
 
+from ccxt import TICK_SIZE
+from pandas import DataFrame
+
 from freqtrade.exceptions import OperationalException
 from freqtrade.plugins.pairlist.IPairList import IPairList
 
@@ -124,4 +127,55 @@ class PriceFilter(IPairList):
                               f"because last price > {self._max_price:.8f}", logger.info)
                 return False
 
-        return True
\ No newline at end of file
+        return True
+
+    def filter_frame(self, frame: DataFrame) -> DataFrame:
+        """
+        Vectorized _validate_pair() - same checks, for all pairs at once.
+        :param frame: Tickers and market data of the pairs to check, indexed by pair
+        :return: frame, reduced to the pairs that can stay
+        """
+        last = frame['last']
+        keep = last.notna() & (last != 0)
+        self._log_removed_pairs(list(frame.index[~keep]), "ticker['last'] is empty "
+                                "(Usually no trade in the last 24h)")
+
+        # Perform low_price_ratio check.
+        if self._low_price_ratio != 0:
+            precision = frame['price_precision']
+            pip = precision if self._exchange.precisionMode == TICK_SIZE else 1 / 10 ** precision
+            changeperc = pip / last
+            removed = keep & (changeperc > self._low_price_ratio)
+            self._log_removed_pairs(
+                [f"{pair} ({perc:.3%})" for pair, perc in changeperc[removed].items()],
+                f"1 unit is above {self._low_price_ratio:.3%}")
+            keep &= ~removed
+
+        # Perform low_amount check
+        if self._max_value != 0:
+            min_amount = frame['amount_min']
+            min_precision = frame['amount_precision']
+            if self._exchange.precisionMode != TICK_SIZE:
+                min_precision = 0.1 ** min_precision
+            diff = (min_amount + min_precision) * last - min_amount * last
+            removed = keep & (diff > self._max_value)
+            self._log_removed_pairs(
+                [f"{pair} ({value})" for pair, value in diff[removed].items()],
+                f"min value change > {self._max_value}")
+            keep &= ~removed
+
+        # Perform min_price check.
+        if self._min_price != 0:
+            removed = keep & (last < self._min_price)
+            self._log_removed_pairs(list(frame.index[removed]),
+                                    f"last price < {self._min_price:.8f}")
+            keep &= ~removed
+
+        # Perform max_price check.
+        if self._max_price != 0:
+            removed = keep & (last > self._max_price)
+            self._log_removed_pairs(list(frame.index[removed]),
+                                    f"last price > {self._max_price:.8f}")
+            keep &= ~removed
+
+        return frame[keep]
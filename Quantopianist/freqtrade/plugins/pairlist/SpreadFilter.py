@@ -4,6 +4,8 @@ Spread pair list filter
 import logging
 from typing import Any, Dict
 
+from pandas import DataFrame
+
 from freqtrade.exceptions import OperationalException
 from freqtrade.plugins.pairlist.IPairList import IPairList
 
@@ -62,3 +64,19 @@ class SpreadFilter(IPairList):
         self.log_once(f"Removed {pair} from whitelist due to invalid ticker data: {ticker}",
                       logger.info)
         return False
+
+    def filter_frame(self, frame: DataFrame) -> DataFrame:
+        """
+        Vectorized _validate_pair() - same checks, for all pairs at once.
+        :param frame: Tickers and market data of the pairs to check, indexed by pair
+        :return: frame, reduced to the pairs that can stay
+        """
+        bid, ask = frame['bid'], frame['ask']
+        valid = bid.notna() & ask.notna() & (bid != 0) & (ask != 0)
+        self._log_removed_pairs(list(frame.index[~valid]), "of invalid ticker data")
+        spread = 1 - bid / ask
+        removed = valid & (spread > self._max_spread_ratio)
+        self._log_removed_pairs(
+            [f"{pair} ({pair_spread:.3%})" for pair, pair_spread in spread[removed].items()],
+            f"spread > {self._max_spread_ratio:.3%}")
+        return frame[valid & ~removed]
@@ -79,8 +79,7 @@ class VolatilityFilter(IPairList):
         # Get all candles
         candles = {}
         if needed_pairs:
-            candles = self._exchange.refresh_latest_ohlcv(needed_pairs, since_ms=since_ms,
-                                                          cache=False)
+            candles = self._exchange.refresh_historic_ohlcv(needed_pairs, since_ms)
 
         if self._enabled:
             for p in deepcopy(pairlist):
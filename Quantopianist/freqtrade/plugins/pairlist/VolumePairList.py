@@ -182,9 +182,7 @@ class VolumePairList(IPairList):
             # Get all candles
             candles = {}
             if needed_pairs:
-                candles = self._exchange.refresh_latest_ohlcv(
-                    needed_pairs, since_ms=since_ms, cache=False
-                )
+                candles = self._exchange.refresh_historic_ohlcv(needed_pairs, since_ms)
             for i, p in enumerate(filtered_tickers):
                 pair_candles = candles[
                     (p['symbol'], self._lookback_timeframe, self._def_candletype)
@@ -1,6 +1,9 @@
 import re
 from typing import Any, Dict, List
 
+import numpy as np
+from pandas import DataFrame
+
 
 def expand_pairlist(wildcardpl: List[str], available_pairs: List[str],
                     keep_invalid: bool = False) -> List[str]:
@@ -50,3 +53,30 @@ def dynamic_expand_pairlist(config: Dict[str, Any], markets: List[str]) -> List[
                            if pair not in config['pairs']]
 
     return expanded_pairs
+
+
+def build_pairlist_frame(tickers: Dict[str, Dict], markets: Dict[str, Dict]) -> DataFrame:
+    """
+    Tickers and market metadata of all pairs in one DataFrame, indexed by pair -
+    for vectorized pairlist filtering (see IPairList.filter_frame()).
+    Missing values (no ticker, unknown market, None in ccxt structures) are NaN.
+    :param tickers: Tickers (from exchange.get_tickers())
+    :param markets: Exchange markets
+    :return: DataFrame with the columns last, bid, ask, quoteVolume (ticker),
+        quote, active, amount_min, amount_precision, price_precision (market)
+    """
+    pairs = list(dict.fromkeys([*markets, *tickers]))
+    frame_tickers = [tickers.get(pair, {}) for pair in pairs]
+    frame_markets = [markets.get(pair, {}) for pair in pairs]
+    data: Dict[str, Any] = {
+        column: np.array([t.get(column) for t in frame_tickers], dtype=float)
+        for column in ('last', 'bid', 'ask', 'quoteVolume')
+    }
+    data['quote'] = [m.get('quote') for m in frame_markets]
+    data['active'] = [m.get('active', True) is not False for m in frame_markets]
+    data['amount_min'] = np.array(
+        [m.get('limits', {}).get('amount', {}).get('min') for m in frame_markets], dtype=float)
+    for column in ('amount', 'price'):
+        data[f'{column}_precision'] = np.array(
+            [m.get('precision', {}).get(column) for m in frame_markets], dtype=float)
+    return DataFrame(data, index=pairs)
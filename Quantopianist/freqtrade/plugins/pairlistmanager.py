@@ -3,16 +3,17 @@ PairList manager class
 """
 import logging
 from functools import partial
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from cachetools import TTLCache, cached
+from pandas import DataFrame
 
 from freqtrade.constants import ListPairsWithTimeframes
 from freqtrade.enums import CandleType
 from freqtrade.exceptions import OperationalException
 from freqtrade.mixins import LoggingMixin
 from freqtrade.plugins.pairlist.IPairList import IPairList
-from freqtrade.plugins.pairlist.pairlist_helpers import expand_pairlist
+from freqtrade.plugins.pairlist.pairlist_helpers import build_pairlist_frame, expand_pairlist
 from freqtrade.resolvers import PairListResolver
 
 
@@ -28,6 +29,9 @@ class PairListManager(LoggingMixin):
         self._blacklist = self._config['exchange'].get('pair_blacklist', [])
         self._pairlist_handlers: List[IPairList] = []
         self._tickers_needed = False
+        # Pairlist frame (see get_pairlist_frame()) and the tickers / markets it was built from
+        self._pairlist_frame: Optional[DataFrame] = None
+        self._pairlist_frame_source: Tuple[Optional[Dict], Optional[Dict]] = (None, None)
         for pairlist_handler_config in self._config.get('pairlists', []):
             pairlist_handler = PairListResolver.load_pairlist(
                 pairlist_handler_config['method'],
@@ -77,6 +81,20 @@ class PairListManager(LoggingMixin):
     def _get_cached_tickers(self):
         return self._exchange.get_tickers()
 
+    def get_pairlist_frame(self, tickers: Dict) -> DataFrame:
+        """
+        Tickers and market data of all pairs as DataFrame, for vectorized pairlist filters.
+        Built once and shared by all Pairlist Handlers, until tickers or markets change.
+        :param tickers: Tickers (from exchange.get_tickers()). May be cached.
+        """
+        markets = self._exchange.markets
+        source_tickers, source_markets = self._pairlist_frame_source
+        if (self._pairlist_frame is None or source_tickers is not tickers
+                or source_markets is not markets):
+            self._pairlist_frame = build_pairlist_frame(tickers, markets)
+            self._pairlist_frame_source = (tickers, markets)
+        return self._pairlist_frame
+
     def refresh_pairlist(self) -> None:
         """Run pairlist through all configured Pairlist Handlers."""
         # Tickers should be cached to avoid calling the exchange on each call.
@@ -75,6 +75,7 @@ class StrategyResolver(IResolver):
                       ("ignore_buying_expired_candle_after",  0),
                       ("position_adjustment_enable",      False),
                       ("max_entry_position_adjustment",      -1),
+                      ("verify_incremental_indicators",   False),
                       ]
         for attribute, default in attributes:
             StrategyResolver._override_attribute_helper(strategy, config,
@@ -447,3 +447,5 @@ class SysInfo(BaseModel):
 class Health(BaseModel):
     last_process: datetime
     last_process_ts: int
+    # Delivery statistics of the rpc message queues, per rpc module
+    rpc_queues: Dict[str, Dict[str, Any]] = {}
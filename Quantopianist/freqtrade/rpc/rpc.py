@@ -11,14 +11,13 @@ import arrow
 import psutil
 from dateutil.relativedelta import relativedelta
 from dateutil.tz import tzlocal
-from numpy import NAN, inf, int64, mean
+from numpy import NAN, inf, int64
 from pandas import DataFrame, NaT
 
 from freqtrade import __version__
 from freqtrade.configuration.timerange import TimeRange
 from freqtrade.constants import CANCEL_REASON, DATETIME_PRINT_FORMAT
 from freqtrade.data.history import load_data
-from freqtrade.data.metrics import calculate_max_drawdown
 from freqtrade.enums import (CandleType, ExitCheckTuple, ExitType, SignalDirection, State,
                              TradingMode)
 from freqtrade.exceptions import ExchangeError, PricingError
@@ -27,6 +26,7 @@ from freqtrade.loggers import bufferHandler
 from freqtrade.misc import decimals_per_coin, shorten_date
 from freqtrade.persistence import PairLocks, Trade
 from freqtrade.persistence.models import PairLock
+from freqtrade.persistence.trade_statistics import TradeStatistics
 from freqtrade.plugins.pairlist.pairlist_helpers import expand_pairlist
 from freqtrade.rpc.fiat_convert import CryptoToFiatConverter
 from freqtrade.wallets import PositionWallet, Wallet
@@ -57,6 +57,8 @@ class RPCException(Exception):
 
 
 class RPCHandler:
+    # send_msg() does network calls - messages are delivered from a background queue
+    blocking_send = False
 
     def __init__(self, rpc: 'RPC', config: Dict[str, Any]) -> None:
         """
@@ -97,6 +99,8 @@ class RPC:
         """
         self._freqtrade = freqtrade
         self._config: Dict[str, Any] = freqtrade.config
+        # Statistics of all closed trades, updated incrementally by /profit and /stats
+        self._trade_statistics = TradeStatistics()
         if self._config.get('fiat_display_currency'):
             self._fiat_converter = CryptoToFiatConverter()
 
@@ -314,24 +318,21 @@ class RPC:
         profit_units: Dict[date, Dict] = {}
         daily_stake = self._freqtrade.wallets.get_total_stake_amount()
 
+        first_date = start_date - time_offset(timescale - 1)
+        period_profits = Trade.get_profit_per_period(
+            timeunit, datetime.combine(first_date, datetime.min.time()),
+            datetime.combine(start_date + time_offset(1), datetime.min.time()))
+
         for day in range(0, timescale):
             profitday = start_date - time_offset(day)
-            # Only query for necessary columns for performance reasons.
-            trades = Trade.query.session.query(Trade.close_profit_abs).filter(
-                Trade.is_open.is_(False),
-                Trade.close_date >= profitday,
-                Trade.close_date < (profitday + time_offset(1))
-            ).order_by(Trade.close_date).all()
-
-            curdayprofit = sum(
-                trade.close_profit_abs for trade in trades if trade.close_profit_abs is not None)
+            curdayprofit, trade_count = period_profits.get(profitday, (0.0, 0))
             # Calculate this periods starting balance
             daily_stake = daily_stake - curdayprofit
             profit_units[profitday] = {
                 'amount': curdayprofit,
                 'daily_stake': daily_stake,
                 'rel_profit': round(curdayprofit / daily_stake, 8) if daily_stake > 0 else 0,
-                'trades': len(trades),
+                'trades': trade_count,
             }
 
         data = [
@@ -378,96 +379,58 @@ class RPC:
         """
         Generate generic stats for trades in database
         """
-        def trade_win_loss(trade):
-            if trade.close_profit > 0:
-                return 'wins'
-            elif trade.close_profit < 0:
-                return 'losses'
-            else:
-                return 'draws'
-        trades: List[Trade] = Trade.get_trades([Trade.is_open.is_(False)], include_orders=False)
-        # Sell reason
-        exit_reasons = {}
-        for trade in trades:
-            if trade.exit_reason not in exit_reasons:
-                exit_reasons[trade.exit_reason] = {'wins': 0, 'losses': 0, 'draws': 0}
-            exit_reasons[trade.exit_reason][trade_win_loss(trade)] += 1
-
-        # Duration
-        dur: Dict[str, List[int]] = {'wins': [], 'draws': [], 'losses': []}
-        for trade in trades:
-            if trade.close_date is not None and trade.open_date is not None:
-                trade_dur = (trade.close_date - trade.open_date).total_seconds()
-                dur[trade_win_loss(trade)].append(trade_dur)
-
-        wins_dur = sum(dur['wins']) / len(dur['wins']) if len(dur['wins']) > 0 else None
-        draws_dur = sum(dur['draws']) / len(dur['draws']) if len(dur['draws']) > 0 else None
-        losses_dur = sum(dur['losses']) / len(dur['losses']) if len(dur['losses']) > 0 else None
-
-        durations = {'wins': wins_dur, 'draws': draws_dur, 'losses': losses_dur}
-        return {'exit_reasons': exit_reasons, 'durations': durations}
+        stats = self._trade_statistics.update()
+        return {'exit_reasons': stats.exit_reasons, 'durations': stats.result_duration_means()}
 
     def _rpc_trade_statistics(
             self, stake_currency: str, fiat_display_currency: str,
             start_date: datetime = datetime.fromtimestamp(0)) -> Dict[str, Any]:
         """ Returns cumulative profit statistics """
-        trade_filter = ((Trade.is_open.is_(False) & (Trade.close_date >= start_date)) |
-                        Trade.is_open.is_(True))
+        # Closed trades are accumulated incrementally - only open trades are loaded.
+        if start_date <= datetime.fromtimestamp(0):
+            stats = self._trade_statistics.update()
+        else:
+            stats = TradeStatistics(start_date).update()
         trades: List[Trade] = Trade.get_trades(
-            trade_filter, include_orders=False).order_by(Trade.id).all()
+            Trade.is_open.is_(True), include_orders=False).order_by(Trade.id).all()
 
         profit_all_coin = []
         profit_all_ratio = []
-        profit_closed_coin = []
-        profit_closed_ratio = []
-        durations = []
-        winning_trades = 0
-        losing_trades = 0
-        winning_profit = 0.0
-        losing_profit = 0.0
+        durations_sum = stats.duration_sum
+        durations_count = stats.duration_count
 
         for trade in trades:
             current_rate: float = 0.0
 
             if trade.close_date:
-                durations.append((trade.close_date - trade.open_date).total_seconds())
-
-            if not trade.is_open:
-                profit_ratio = trade.close_profit
-                profit_abs = trade.close_profit_abs
-                profit_closed_coin.append(profit_abs)
-                profit_closed_ratio.append(profit_ratio)
-                if trade.close_profit >= 0:
-                    winning_trades += 1
-                    winning_profit += profit_abs
-                else:
-                    losing_trades += 1
-                    losing_profit += profit_abs
+                durations_sum += (trade.close_date - trade.open_date).total_seconds()
+                durations_count += 1
+
+            # Get current rate
+            try:
+                current_rate = self._freqtrade.exchange.get_rate(
+                    trade.pair, side='exit', is_short=trade.is_short, refresh=False)
+            except (PricingError, ExchangeError):
+                current_rate = NAN
+            if isnan(current_rate):
+                profit_ratio = NAN
+                profit_abs = NAN
             else:
-                # Get current rate
-                try:
-                    current_rate = self._freqtrade.exchange.get_rate(
-                        trade.pair, side='exit', is_short=trade.is_short, refresh=False)
-                except (PricingError, ExchangeError):
-                    current_rate = NAN
-                if isnan(current_rate):
-                    profit_ratio = NAN
-                    profit_abs = NAN
-                else:
-                    profit_ratio = trade.calc_profit_ratio(rate=current_rate)
-                    profit_abs = trade.calc_profit(
-                        rate=trade.close_rate or current_rate) + trade.realized_profit
+                profit_ratio = trade.calc_profit_ratio(rate=current_rate)
+                profit_abs = trade.calc_profit(
+                    rate=trade.close_rate or current_rate) + trade.realized_profit
 
             profit_all_coin.append(profit_abs)
             profit_all_ratio.append(profit_ratio)
 
-        best_pair = Trade.get_best_pair(start_date)
-        trading_volume = Trade.get_trading_volume(start_date)
+        best_pair = stats.best_pair()
+        trading_volume = stats.trading_volume
 
         # Prepare data to display
-        profit_closed_coin_sum = round(sum(profit_closed_coin), 8)
-        profit_closed_ratio_mean = float(mean(profit_closed_ratio) if profit_closed_ratio else 0.0)
-        profit_closed_ratio_sum = sum(profit_closed_ratio) if profit_closed_ratio else 0.0
+        profit_closed_coin_sum = round(stats.profit_abs_sum, 8)
+        profit_closed_ratio_mean = (stats.profit_ratio_sum / stats.trade_count
+                                    if stats.trade_count else 0.0)
+        profit_closed_ratio_sum = stats.profit_ratio_sum
 
         profit_closed_fiat = self._fiat_converter.convert_amount(
             profit_closed_coin_sum,
@@ -475,10 +438,11 @@ class RPC:
             fiat_display_currency
         ) if self._fiat_converter else 0
 
-        profit_all_coin_sum = round(sum(profit_all_coin), 8)
-        profit_all_ratio_mean = float(mean(profit_all_ratio) if profit_all_ratio else 0.0)
+        trade_count = stats.trade_count + len(trades)
+        profit_all_coin_sum = round(stats.profit_abs_sum + sum(profit_all_coin), 8)
         # Doing the sum is not right - overall profit needs to be based on initial capital
-        profit_all_ratio_sum = sum(profit_all_ratio) if profit_all_ratio else 0.0
+        profit_all_ratio_sum = stats.profit_ratio_sum + sum(profit_all_ratio)
+        profit_all_ratio_mean = float(profit_all_ratio_sum / trade_count if trade_count else 0.0)
         starting_balance = self._freqtrade.wallets.get_starting_balance()
         profit_closed_ratio_fromstart = 0
         profit_all_ratio_fromstart = 0
@@ -486,20 +450,10 @@ class RPC:
             profit_closed_ratio_fromstart = profit_closed_coin_sum / starting_balance
             profit_all_ratio_fromstart = profit_all_coin_sum / starting_balance
 
-        profit_factor = winning_profit / abs(losing_profit) if losing_profit else float('inf')
+        profit_factor = (stats.winning_profit / abs(stats.losing_profit)
+                         if stats.losing_profit else float('inf'))
 
-        trades_df = DataFrame([{'close_date': trade.close_date.strftime(DATETIME_PRINT_FORMAT),
-                                'profit_abs': trade.close_profit_abs}
-                               for trade in trades if not trade.is_open])
-        max_drawdown_abs = 0.0
-        max_drawdown = 0.0
-        if len(trades_df) > 0:
-            try:
-                (max_drawdown_abs, _, _, _, _, max_drawdown) = calculate_max_drawdown(
-                    trades_df, value_col='profit_abs', starting_balance=starting_balance)
-            except ValueError:
-                # ValueError if no losing trade.
-                pass
+        max_drawdown_abs, max_drawdown = stats.max_drawdown(starting_balance)
 
         profit_all_fiat = self._fiat_converter.convert_amount(
             profit_all_coin_sum,
@@ -507,9 +461,12 @@ class RPC:
             fiat_display_currency
         ) if self._fiat_converter else 0
 
-        first_date = trades[0].open_date if trades else None
-        last_date = trades[-1].open_date if trades else None
-        num = float(len(durations) or 1)
+        # First / latest trade by id - closed or open
+        first_last = [t for t in (stats.first_trade, stats.last_trade) if t] + [
+            (trade.id, trade.open_date) for trade in trades[:1] + trades[-1:]]
+        first_date = min(first_last)[1] if first_last else None
+        last_date = max(first_last)[1] if first_last else None
+        num = float(durations_count or 1)
         return {
             'profit_closed_coin': profit_closed_coin_sum,
             'profit_closed_percent_mean': round(profit_closed_ratio_mean * 100, 2),
@@ -527,18 +484,18 @@ class RPC:
             'profit_all_ratio': profit_all_ratio_fromstart,
             'profit_all_percent': round(profit_all_ratio_fromstart * 100, 2),
             'profit_all_fiat': profit_all_fiat,
-            'trade_count': len(trades),
-            'closed_trade_count': len([t for t in trades if not t.is_open]),
+            'trade_count': trade_count,
+            'closed_trade_count': stats.trade_count,
             'first_trade_date': arrow.get(first_date).humanize() if first_date else '',
             'first_trade_timestamp': int(first_date.timestamp() * 1000) if first_date else 0,
             'latest_trade_date': arrow.get(last_date).humanize() if last_date else '',
             'latest_trade_timestamp': int(last_date.timestamp() * 1000) if last_date else 0,
-            'avg_duration': str(timedelta(seconds=sum(durations) / num)).split('.')[0],
+            'avg_duration': str(timedelta(seconds=durations_sum / num)).split('.')[0],
             'best_pair': best_pair[0] if best_pair else '',
             'best_rate': round(best_pair[1] * 100, 2) if best_pair else 0,  # Deprecated
             'best_pair_profit_ratio': best_pair[1] if best_pair else 0,
-            'winning_trades': winning_trades,
-            'losing_trades': losing_trades,
+            'winning_trades': stats.winning_trades,
+            'losing_trades': stats.losing_trades,
             'profit_factor': profit_factor,
             'max_drawdown': max_drawdown,
             'max_drawdown_abs': max_drawdown_abs,
@@ -1082,10 +1039,11 @@ class RPC:
             "ram_pct": psutil.virtual_memory().percent
         }
 
-    def _health(self) -> Dict[str, Union[str, int]]:
+    def _health(self) -> Dict[str, Any]:
         last_p = self._freqtrade.last_process
         return {
             'last_process': str(last_p),
             'last_process_loc': last_p.astimezone(tzlocal()).strftime(DATETIME_PRINT_FORMAT),
             'last_process_ts': int(last_p.timestamp()),
+            'rpc_queues': self._freqtrade.rpc.queue_stats(),
         }
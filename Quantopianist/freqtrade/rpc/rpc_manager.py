@@ -6,6 +6,7 @@ from typing import Any, Dict, List
 
 from freqtrade.enums import RPCMessageType
 from freqtrade.rpc import RPC, RPCHandler
+from freqtrade.rpc.rpc_queue import RPCMessageQueue
 
 
 logger = logging.getLogger(__name__)
@@ -41,9 +42,25 @@ class RPCManager:
             apiserver.add_rpc_handler(self._rpc)
             self.registered_modules.append(apiserver)
 
+        # Deliver messages of handlers doing network calls in the background,
+        # so slow endpoints don't delay the bot loop.
+        self._queues: Dict[str, RPCMessageQueue] = {}
+        internals = config.get('internals', {})
+        queue_size = internals.get('rpc_queue_size', 1000)
+        if queue_size > 0:
+            for mod in self.registered_modules:
+                if mod.blocking_send:
+                    self._queues[mod.name] = RPCMessageQueue(
+                        mod, queue_size, internals.get('rpc_queue_drop', 'oldest'))
+
     def cleanup(self) -> None:
         """ Stops all enabled rpc modules """
         logger.info('Cleaning up rpc modules ...')
+        # Deliver pending messages first
+        while self._queues:
+            name, queue = self._queues.popitem()
+            queue.stop()
+            logger.info(f"rpc.{name} message queue: {queue.stats}")
         while self.registered_modules:
             mod = self.registered_modules.pop()
             logger.info('Cleaning up rpc.%s ...', mod.name)
@@ -66,11 +83,21 @@ class RPCManager:
                 })
         for mod in self.registered_modules:
             logger.debug('Forwarding message to rpc.%s', mod.name)
+            if mod.name in self._queues:
+                # Handlers may modify the message
+                self._queues[mod.name].put(dict(msg))
+                continue
             try:
                 mod.send_msg(msg)
             except NotImplementedError:
                 logger.error(f"Message type '{msg['type']}' not implemented by handler {mod.name}.")
 
+    def queue_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Delivery statistics of the background message queues, per rpc module.
+        """
+        return {name: queue.stats for name, queue in self._queues.items()}
+
     def startup_messages(self, config: Dict[str, Any], pairlist, protections) -> None:
         if config['dry_run']:
             self.send_msg({
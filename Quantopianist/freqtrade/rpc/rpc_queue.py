@@ -0,0 +1,118 @@
+"""
+Background delivery of RPC messages, to keep slow handlers (network calls) off the trading thread.
+"""
+import logging
+import time
+from collections import deque
+from threading import Condition, Thread
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from freqtrade.enums import RPCMessageType
+from freqtrade.mixins import LoggingMixin
+from freqtrade.rpc.rpc import RPCHandler
+
+
+logger = logging.getLogger(__name__)
+
+# Message types which only carry a status text - identical pending messages are coalesced
+COALESCED_MESSAGE_TYPES = (RPCMessageType.STATUS, RPCMessageType.WARNING)
+
+
+class RPCMessageQueue(LoggingMixin):
+    """
+    Bounded message queue in front of one RPC handler, drained by a daemon thread.
+    When the queue is full, either the oldest pending message or the new message is dropped.
+    """
+
+    def __init__(self, handler: RPCHandler, maxsize: int, drop: str = 'oldest') -> None:
+        """
+        :param handler: RPC handler messages are delivered to
+        :param maxsize: Maximum number of pending messages
+        :param drop: Message to drop when the queue is full - 'oldest' or 'newest'
+        """
+        LoggingMixin.__init__(self, logger, 60)
+        self._handler = handler
+        self._maxsize = maxsize
+        self._drop = drop
+        # (enqueue time, message)
+        self._messages: Deque[Tuple[float, Dict[str, Any]]] = deque()
+        self._cond = Condition()
+        self._running = True
+        self._stats = {'sent': 0, 'failed': 0, 'dropped': 0, 'coalesced': 0, 'max_depth': 0}
+        self._max_delay = 0.0
+        self._thread = Thread(target=self._run, name=f'rpc-{handler.name}', daemon=True)
+        self._thread.start()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Delivery counters, current and maximum queue depth, and the maximum delay (seconds)
+        between queueing and delivering a message.
+        """
+        with self._cond:
+            return {**self._stats, 'depth': len(self._messages), 'max_delay': self._max_delay}
+
+    def put(self, msg: Dict[str, Any]) -> None:
+        """
+        Queue a message for delivery. Never blocks.
+        """
+        with self._cond:
+            if not self._running:
+                return
+            if msg['type'] in COALESCED_MESSAGE_TYPES and any(
+                    pending['type'] == msg['type'] and pending.get('status') == msg.get('status')
+                    for _, pending in self._messages):
+                self._stats['coalesced'] += 1
+                return
+            if len(self._messages) >= self._maxsize:
+                self._stats['dropped'] += 1
+                self.log_once(f"Message queue of rpc.{self._handler.name} is full "
+                              f"({self._maxsize} messages), dropping {self._drop} messages.",
+                              logger.warning)
+                if self._drop == 'newest':
+                    return
+                self._messages.popleft()
+            self._messages.append((time.monotonic(), msg))
+            self._stats['max_depth'] = max(self._stats['max_depth'], len(self._messages))
+            self._cond.notify()
+
+    def stop(self, timeout: float = 10) -> None:
+        """
+        Deliver pending messages (waiting at most `timeout` seconds) and stop the worker thread.
+        """
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self._thread.join(timeout=timeout)
+        if self._thread.is_alive():
+            logger.warning(f"rpc.{self._handler.name} did not deliver all pending messages "
+                           f"within {timeout}s.")
+
+    def _run(self) -> None:
+        while True:
+            item = self._next()
+            if item is None:
+                return
+            queued_at, msg = item
+            with self._cond:
+                self._max_delay = max(self._max_delay, time.monotonic() - queued_at)
+            self._deliver(msg)
+
+    def _next(self) -> Optional[Tuple[float, Dict[str, Any]]]:
+        with self._cond:
+            while not self._messages and self._running:
+                self._cond.wait()
+            return self._messages.popleft() if self._messages else None
+
+    def _deliver(self, msg: Dict[str, Any]) -> None:
+        result = 'failed'
+        try:
+            self._handler.send_msg(msg)
+            result = 'sent'
+        except NotImplementedError:
+            logger.error(f"Message type '{msg['type']}' not implemented by handler "
+                         f"{self._handler.name}.")
+        except Exception:
+            logger.exception(f"Error sending message via rpc.{self._handler.name}.")
+        with self._cond:
+            self._stats[result] += 1
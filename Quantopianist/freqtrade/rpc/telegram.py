@@ -77,6 +77,7 @@ def authorized_only(command_handler: Callable[..., None]) -> Callable[..., Any]:
 
 class Telegram(RPCHandler):
     """  This class handles all telegram communication """
+    blocking_send = True
 
     def __init__(self, rpc: RPC, config: Dict[str, Any]) -> None:
         """
@@ -1388,11 +1389,15 @@ class Telegram(RPCHandler):
     def _health(self, update: Update, context: CallbackContext) -> None:
         """
         Handler for /health
-        Shows the last process timestamp
+        Shows the last process timestamp and the delivery statistics of the message queues
         """
         try:
             health = self._rpc._health()
             message = f"Last process: `{health['last_process_loc']}`"
+            for name, stats in health['rpc_queues'].items():
+                message += (f"\n`{name}` messages: sent `{stats['sent']}`, "
+                            f"failed `{stats['failed']}`, dropped `{stats['dropped']}`, "
+                            f"pending `{stats['depth']}`, max delay `{stats['max_delay']:.1f}s`")
             self._send_msg(message)
         except RPCException as e:
             self._send_msg(str(e))
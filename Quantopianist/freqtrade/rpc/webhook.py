@@ -5,7 +5,7 @@ import logging
 import time
 from typing import Any, Dict
 
-from requests import RequestException, post
+from requests import RequestException, Session
 
 from freqtrade.enums import RPCMessageType
 from freqtrade.rpc import RPC, RPCHandler
@@ -18,6 +18,7 @@ logger.debug('Included module rpc.webhook ...')
 
 class Webhook(RPCHandler):
     """  This class handles all webhook communication """
+    blocking_send = True
 
     def __init__(self, rpc: RPC, config: Dict[str, Any]) -> None:
         """
@@ -32,13 +33,15 @@ class Webhook(RPCHandler):
         self._format = self._config['webhook'].get('format', 'form')
         self._retries = self._config['webhook'].get('retries', 0)
         self._retry_delay = self._config['webhook'].get('retry_delay', 0.1)
+        # Keeps connections to the webhook url open between messages
+        self._session = Session()
 
     def cleanup(self) -> None:
         """
         Cleanup pending module resources.
-        This will do nothing for webhooks, they will simply not be called anymore
+        Closes pooled connections, webhooks will simply not be called anymore
         """
-        pass
+        self._session.close()
 
     def send_msg(self, msg: Dict[str, Any]) -> None:
         """ Send a message to telegram channel """
@@ -87,12 +90,12 @@ class Webhook(RPCHandler):
 
             try:
                 if self._format == 'form':
-                    response = post(self._url, data=payload)
+                    response = self._session.post(self._url, data=payload)
                 elif self._format == 'json':
-                    response = post(self._url, json=payload)
+                    response = self._session.post(self._url, json=payload)
                 elif self._format == 'raw':
-                    response = post(self._url, data=payload['data'],
-                                    headers={'Content-Type': 'text/plain'})
+                    response = self._session.post(self._url, data=payload['data'],
+                                                  headers={'Content-Type': 'text/plain'})
                 else:
                     raise NotImplementedError('Unknown format: {}'.format(self._format))
 
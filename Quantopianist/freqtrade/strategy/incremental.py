@@ -0,0 +1,284 @@
+"""
+Incrementally updated indicators.
+
+Strategies list them in `incremental_indicators` - they are populated before
+populate_indicators() is called. In dry / live mode, only candles which arrived since the
+previous analysis are computed (O(1) per new candle), all earlier values are carried over.
+"""
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from pandas import DataFrame, concat
+
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalIndicator:
+    """
+    Base class for incremental indicators.
+    Subclasses implement populate() (full computation) and update() (new candles only),
+    both returning the indicator values and the state after the last candle.
+    """
+
+    def __init__(self, column: str, period: int, source: str = 'close') -> None:
+        """
+        :param column: Dataframe column the indicator is stored in
+        :param period: Indicator period
+        :param source: Source column (where applicable)
+        """
+        self.column = column
+        self.period = period
+        self.source = source
+
+    @property
+    def source_columns(self) -> Tuple[str, ...]:
+        """
+        Dataframe columns the indicator is computed from.
+        """
+        return (self.source, )
+
+    def populate(self, dataframe: DataFrame) -> Tuple[np.ndarray, Any]:
+        """
+        Compute the indicator for the whole dataframe.
+        :return: Tuple of indicator values and state after the last candle
+        """
+        raise NotImplementedError()
+
+    def update(self, dataframe: DataFrame, state: Any) -> Tuple[np.ndarray, Any]:
+        """
+        Compute the indicator for new candles, continuing from `state`.
+        :param dataframe: New candles only
+        :param state: State after the last previously computed candle
+        :return: Tuple of indicator values of the new candles and the new state
+        """
+        raise NotImplementedError()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.column!r}, {self.period})"
+
+
+class EMA(IncrementalIndicator):
+    """
+    Exponential moving average - seeded with the simple average of the first `period`
+    values (like ta-lib).
+    """
+
+    def populate(self, dataframe: DataFrame) -> Tuple[np.ndarray, Any]:
+        values = dataframe[self.source].values.astype(float)
+        result = np.full(len(values), np.nan)
+        if len(values) < self.period:
+            return result, None
+        result[self.period - 1] = values[:self.period].mean()
+        result[self.period:], state = self.update(dataframe.iloc[self.period:],
+                                                  result[self.period - 1])
+        return result, state
+
+    def update(self, dataframe: DataFrame, state: Any) -> Tuple[np.ndarray, Any]:
+        values = dataframe[self.source].values.astype(float)
+        if state is None:
+            # Not enough candles before
+            return np.full(len(values), np.nan), None
+        alpha = 2 / (self.period + 1)
+        result = np.empty(len(values))
+        ema = state
+        for i, value in enumerate(values):
+            ema += alpha * (value - ema)
+            result[i] = ema
+        return result, ema
+
+
+class RSI(IncrementalIndicator):
+    """
+    Relative strength index with Wilder's smoothing (like ta-lib).
+    State: (average gain, average loss, last close).
+    """
+
+    def populate(self, dataframe: DataFrame) -> Tuple[np.ndarray, Any]:
+        close = dataframe[self.source].values.astype(float)
+        result = np.full(len(close), np.nan)
+        if len(close) <= self.period:
+            return result, None
+        change = np.diff(close[:self.period + 1])
+        avg_gain = change.clip(min=0).mean()
+        avg_loss = -change.clip(max=0).mean()
+        result[self.period] = self._rsi(avg_gain, avg_loss)
+        result[self.period + 1:], state = self.update(
+            dataframe.iloc[self.period + 1:], (avg_gain, avg_loss, close[self.period]))
+        return result, state
+
+    def update(self, dataframe: DataFrame, state: Any) -> Tuple[np.ndarray, Any]:
+        close = dataframe[self.source].values.astype(float)
+        if state is None:
+            return np.full(len(close), np.nan), None
+        avg_gain, avg_loss, last_close = state
+        result = np.empty(len(close))
+        for i, value in enumerate(close):
+            change = value - last_close
+            avg_gain = (avg_gain * (self.period - 1) + max(change, 0)) / self.period
+            avg_loss = (avg_loss * (self.period - 1) + max(-change, 0)) / self.period
+            result[i] = self._rsi(avg_gain, avg_loss)
+            last_close = value
+        return result, (avg_gain, avg_loss, last_close)
+
+    @staticmethod
+    def _rsi(avg_gain: float, avg_loss: float) -> float:
+        total = avg_gain + avg_loss
+        return 100 * avg_gain / total if total else 0.0
+
+
+class ATR(IncrementalIndicator):
+    """
+    Average true range with Wilder's smoothing (like ta-lib).
+    State: (average true range, last close).
+    """
+
+    @property
+    def source_columns(self) -> Tuple[str, ...]:
+        return ('high', 'low', 'close')
+
+    def populate(self, dataframe: DataFrame) -> Tuple[np.ndarray, Any]:
+        high = dataframe['high'].values.astype(float)
+        low = dataframe['low'].values.astype(float)
+        close = dataframe['close'].values.astype(float)
+        result = np.full(len(close), np.nan)
+        if len(close) <= self.period:
+            return result, None
+        prev_close = close[:self.period]
+        true_range = np.maximum(high[1:self.period + 1], prev_close) - np.minimum(
+            low[1:self.period + 1], prev_close)
+        result[self.period] = true_range.mean()
+        result[self.period + 1:], state = self.update(
+            dataframe.iloc[self.period + 1:], (result[self.period], close[self.period]))
+        return result, state
+
+    def update(self, dataframe: DataFrame, state: Any) -> Tuple[np.ndarray, Any]:
+        high = dataframe['high'].values.astype(float)
+        low = dataframe['low'].values.astype(float)
+        close = dataframe['close'].values.astype(float)
+        if state is None:
+            return np.full(len(close), np.nan), None
+        atr, last_close = state
+        result = np.empty(len(close))
+        for i in range(len(close)):
+            true_range = max(high[i], last_close) - min(low[i], last_close)
+            atr = (atr * (self.period - 1) + true_range) / self.period
+            result[i] = atr
+            last_close = close[i]
+        return result, (atr, last_close)
+
+
+class _PairState:
+    """
+    Indicator values and states of the last analysis of one pair.
+    """
+    __slots__ = ('dates', 'sources', 'values', 'states', 'history')
+
+    def __init__(self, dates: np.ndarray, sources: np.ndarray, values: Dict[str, np.ndarray],
+                 states: Dict[str, Any], history: Optional[DataFrame]) -> None:
+        self.dates = dates
+        # Source columns of all indicators - to detect changed candles
+        self.sources = sources
+        self.values = values
+        self.states = states
+        # Verify mode only: candles since the last full computation
+        self.history = history
+
+
+class IncrementalIndicatorCache:
+    """
+    Keeps indicator values and states per pair, to only compute new candles on the next call.
+    """
+
+    def __init__(self, indicators: List[IncrementalIndicator]) -> None:
+        """
+        :param indicators: Indicators to populate
+        """
+        self._indicators = indicators
+        self._source_columns = sorted({column for indicator in indicators
+                                       for column in indicator.source_columns})
+        self._pairs: Dict[str, _PairState] = {}
+
+    def populate(self, dataframe: DataFrame, pair: str, verify: bool = False) -> DataFrame:
+        """
+        Populate all indicators - incrementally if the dataframe continues the previous one.
+        :param verify: Compare incremental results against full recomputation (slow)
+        """
+        dates = dataframe['date'].values.astype('datetime64[ns]').view(np.int64)
+        sources = dataframe[self._source_columns].values.astype(float)
+        previous = self._pairs.get(pair)
+        offset = self._continuation_offset(previous, dates, sources)
+        # Indicators without state had too few candles before - compute all from scratch,
+        # so all indicators (and the verify history) start at the same candle.
+        if previous is not None and any(state is None for state in previous.states.values()):
+            offset = None
+        history = None
+        if verify:
+            history = self._verify_history(previous, offset, dataframe)
+            if history is None:
+                offset = None
+                history = dataframe[['date', *self._source_columns]]
+
+        values: Dict[str, np.ndarray] = {}
+        states: Dict[str, Any] = {}
+        for indicator in self._indicators:
+            if offset is None or previous is None:
+                values[indicator.column], states[indicator.column] = indicator.populate(dataframe)
+                continue
+            carried = previous.values[indicator.column][offset:]
+            new_values, states[indicator.column] = indicator.update(
+                dataframe.iloc[len(carried):], previous.states[indicator.column])
+            values[indicator.column] = np.concatenate([carried, new_values])
+            if history is not None:
+                self._verify_indicator(indicator, history, values[indicator.column], pair)
+
+        for column, column_values in values.items():
+            dataframe[column] = column_values
+        self._pairs[pair] = _PairState(dates, sources, values, states, history)
+        return dataframe
+
+    @staticmethod
+    def _continuation_offset(previous: Optional[_PairState], dates: np.ndarray,
+                             sources: np.ndarray) -> Optional[int]:
+        """
+        Offset of the new dataframe's first candle within the previous dataframe, if the new
+        dataframe continues it - with unchanged candles in the overlapping part.
+        """
+        if previous is None or not len(dates):
+            return None
+        offset = np.searchsorted(previous.dates, dates[0])
+        overlap = len(previous.dates) - offset
+        if (offset >= len(previous.dates) or overlap > len(dates)
+                or not np.array_equal(previous.dates[offset:], dates[:overlap])
+                or not np.array_equal(previous.sources[offset:], sources[:overlap],
+                                      equal_nan=True)):
+            return None
+        return int(offset)
+
+    def _verify_history(self, previous: Optional[_PairState], offset: Optional[int],
+                        dataframe: DataFrame) -> Optional[DataFrame]:
+        """
+        Candles since the last full computation, including the new candles of `dataframe`.
+        Incremental values continue from that first candle - so a full recomputation over
+        the history is the exact reference, also for candles still affected by the seed.
+        :return: None if a full computation is due - no continuation, or the history grew
+            beyond twice the dataframe length (bounds memory in verify mode).
+        """
+        if offset is None or previous is None or previous.history is None:
+            return None
+        new_candles = dataframe.iloc[len(previous.dates) - offset:]
+        if len(previous.history) + len(new_candles) > 2 * len(dataframe):
+            return None
+        return concat([previous.history, new_candles[['date', *self._source_columns]]],
+                      ignore_index=True)
+
+    def _verify_indicator(self, indicator: IncrementalIndicator, history: DataFrame,
+                          values: np.ndarray, pair: str) -> None:
+        expected, _ = indicator.populate(history)
+        if not np.allclose(values, expected[-len(values):], rtol=1e-6, equal_nan=True):
+            logger.warning(f"Incremental indicator {indicator} of {pair} deviates from "
+                           f"full recomputation.")
+
+    def clear(self) -> None:
+        self._pairs.clear()
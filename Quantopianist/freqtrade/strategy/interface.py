@@ -5,6 +5,7 @@ This module defines the interface to apply for strategies
 import logging
 import warnings
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Tuple, Union
 
@@ -13,13 +14,14 @@ from pandas import DataFrame
 
 from freqtrade.constants import ListPairsWithTimeframes
 from freqtrade.data.dataprovider import DataProvider
-from freqtrade.enums import SellType, SignalTagType, SignalType
+from freqtrade.enums import TRADING_MODES, SellType, SignalTagType, SignalType
 from freqtrade.exceptions import OperationalException, StrategyError
 from freqtrade.exchange import timeframe_to_minutes, timeframe_to_seconds
 from freqtrade.exchange.exchange import timeframe_to_next_date
 from freqtrade.persistence import PairLocks, Trade
 from freqtrade.persistence.models import LocalTrade, Order
 from freqtrade.strategy.hyper import HyperStrategyMixin
+from freqtrade.strategy.incremental import IncrementalIndicator, IncrementalIndicatorCache
 from freqtrade.strategy.informative_decorator import (InformativeData, PopulateIndicators,
                                                       _create_and_merge_informative_pair,
                                                       _format_pair_name)
@@ -101,6 +103,12 @@ class IStrategy(ABC, HyperStrategyMixin):
     # run "populate_indicators" only for new candle
     process_only_new_candles: bool = False
 
+    # Indicators populated before "populate_indicators" - in dry / live mode only
+    # for new candles (see freqtrade.strategy.incremental)
+    incremental_indicators: List[IncrementalIndicator] = []
+    # Compare incremental indicators against full recomputation (slow - for validation only)
+    verify_incremental_indicators: bool = False
+
     use_sell_signal: bool
     sell_profit_only: bool
     sell_profit_offset: float
@@ -139,6 +147,8 @@ class IStrategy(ABC, HyperStrategyMixin):
         self.config = config
         # Dict to determine if analysis is necessary
         self._last_candle_seen_per_pair: Dict[str, datetime] = {}
+        self._incremental_cache = IncrementalIndicatorCache(self.incremental_indicators)
+        self._analysis_executor: Optional[ThreadPoolExecutor] = None
         super().__init__(config)
 
         # Gather informative pairs from @informative-decorated methods.
@@ -591,11 +601,29 @@ class IStrategy(ABC, HyperStrategyMixin):
     def analyze(self, pairs: List[str]) -> None:
         """
         Analyze all pairs using analyze_pair().
+        Pairs are analyzed concurrently if `analysis_workers` is configured - numpy / pandas
+        and ta-lib release the GIL for most of the indicator computation.
         :param pairs: List of pairs to analyze
         """
+        workers = self.config.get('analysis_workers', 1)
+        if workers > 1 and len(pairs) > 1:
+            if self._analysis_executor is None:
+                self._analysis_executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix='analysis')
+            # Results are published per pair (dp cache) - consume to raise exceptions
+            list(self._analysis_executor.map(self.analyze_pair, pairs))
+            return
         for pair in pairs:
             self.analyze_pair(pair)
 
+    def ft_bot_cleanup(self) -> None:
+        """
+        Release resources held by the strategy - called when the bot is cleaned up.
+        """
+        if self._analysis_executor is not None:
+            self._analysis_executor.shutdown(wait=False)
+            self._analysis_executor = None
+
     @staticmethod
     def preserve_df(dataframe: DataFrame) -> Tuple[int, float, datetime]:
         """ keep some data for dataframes """
@@ -908,6 +936,9 @@ class IStrategy(ABC, HyperStrategyMixin):
         """
         logger.debug(f"Populating indicators for pair {metadata.get('pair')}.")
 
+        if self.incremental_indicators:
+            dataframe = self._populate_incremental_indicators(dataframe, metadata)
+
         # call populate_indicators_Nm() which were tagged with @informative decorator.
         for inf_data, populate_fn in self._ft_informative:
             dataframe = _create_and_merge_informative_pair(
@@ -920,6 +951,19 @@ class IStrategy(ABC, HyperStrategyMixin):
         else:
             return self.populate_indicators(dataframe, metadata)
 
+    def _populate_incremental_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        """
+        Populate `incremental_indicators`. In dry / live mode, only candles which arrived since
+        the last analysis of this pair are computed. Otherwise (e.g. backtesting) all candles
+        are computed, without keeping state.
+        """
+        if self.config.get('runmode') in TRADING_MODES:
+            return self._incremental_cache.populate(
+                dataframe, str(metadata.get('pair')), self.verify_incremental_indicators)
+        for indicator in self.incremental_indicators:
+            dataframe[indicator.column], _ = indicator.populate(dataframe)
+        return dataframe
+
     def advise_buy(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
         Based on TA indicators, populates the buy signal for the given dataframe
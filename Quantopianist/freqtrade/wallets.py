@@ -66,7 +66,7 @@ class Wallets:
         """
         # Recreate _wallets to reset closed trade balances
         _wallets = {}
-        open_trades = Trade.get_trades_proxy(is_open=True)
+        open_trades = Trade.get_open_trades()
         # If not backtesting...
         # TODO: potentially remove the ._log workaround to determine backtest mode.
         if self._log:
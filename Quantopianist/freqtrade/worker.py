@@ -13,6 +13,7 @@ from freqtrade import __version__, constants
 from freqtrade.configuration import Configuration
 from freqtrade.enums import State
 from freqtrade.exceptions import OperationalException, TemporaryError
+from freqtrade.exchange.exchange import timeframe_to_next_date
 from freqtrade.freqtradebot import FreqtradeBot
 
 
@@ -36,6 +37,8 @@ class Worker:
 
         self.last_throttle_start_time: float = 0
         self._heartbeat_msg: float = 0
+        # Event-driven scheduler: time of the next full iteration (analysis)
+        self._next_analysis: float = 0
 
         # Tell systemd that we completed initialization phase
         self._notify("READY=1")
@@ -55,6 +58,14 @@ class Worker:
         self._throttle_secs = internals_config.get('process_throttle_secs',
                                                    constants.PROCESS_THROTTLE_SECS)
         self._heartbeat_interval = internals_config.get('heartbeat_interval', 60)
+        # 'throttle': process every process_throttle_secs.
+        # 'candle': analyze at candle close (+ candle_offset_secs), manage orders and exits
+        # every order_management_secs in between, or earlier on market data events.
+        self._scheduler = internals_config.get('scheduler', 'throttle')
+        self._candle_offset_secs = internals_config.get('candle_offset_secs', 1)
+        self._order_management_secs = internals_config.get('order_management_secs',
+                                                           self._throttle_secs)
+        self._next_analysis = 0
 
         self._sd_notify = sdnotify.SystemdNotifier() if \
             self._config.get('internals', {}).get('sd_notify', False) else None
@@ -111,7 +122,10 @@ class Worker:
             # Ping systemd watchdog before throttling
             self._notify("WATCHDOG=1\nSTATUS=State: RUNNING.")
 
-            self._throttle(func=self._process_running, throttle_secs=self._throttle_secs)
+            if self._scheduler == 'candle':
+                self._process_scheduled()
+            else:
+                self._throttle(func=self._process_running, throttle_secs=self._throttle_secs)
 
         if self._heartbeat_interval:
             now = time.time()
@@ -144,12 +158,49 @@ class Worker:
         time.sleep(sleep_duration)
         return result
 
+    def _process_scheduled(self) -> None:
+        """
+        One step of the event-driven scheduler: a full iteration if a candle closed (or analysis
+        was requested), order management otherwise. Then waits until the next candle close,
+        the next order management run or a market data event - whichever comes first.
+        """
+        # Clear before the step - events arriving during the step wake up the next wait
+        self.freqtrade.wakeup.clear()
+        self.last_throttle_start_time = time.time()
+        logger.debug("========================================")
+        if (self.last_throttle_start_time >= self._next_analysis
+                or self.freqtrade.analysis_requested):
+            self.freqtrade.analysis_requested = False
+            if self._process_running():
+                next_candle = timeframe_to_next_date(self._config['timeframe']).timestamp()
+                self._next_analysis = next_candle + self._candle_offset_secs
+            else:
+                # Keep the analysis due - retried on the next step
+                self._next_analysis = min(self._next_analysis, self.last_throttle_start_time)
+        else:
+            self._process_running(orders_only=True)
+        self.freqtrade.update_price_triggers()
+
+        now = time.time()
+        wakeup = min(self._next_analysis, now + self._order_management_secs)
+        logger.debug(f"Next analysis in {self._next_analysis - now:.2f} s, "
+                     f"last iteration took {now - self.last_throttle_start_time:.2f} s.")
+        if self.freqtrade.wakeup.wait(max(wakeup - now, 0.0)):
+            logger.debug("Woken up by market data event.")
+
     def _process_stopped(self) -> None:
         self.freqtrade.process_stopped()
 
-    def _process_running(self) -> None:
+    def _process_running(self, orders_only: bool = False) -> bool:
+        """
+        :return: True if the iteration completed
+        """
         try:
-            self.freqtrade.process()
+            if orders_only:
+                self.freqtrade.process_orders()
+            else:
+                self.freqtrade.process()
+            return True
         except TemporaryError as error:
             logger.warning(f"Error: {error}, retrying in {constants.RETRY_TIMEOUT} seconds...")
             time.sleep(constants.RETRY_TIMEOUT)
@@ -161,6 +212,7 @@ class Worker:
 
             logger.exception('OperationalException. Stopping trader ...')
             self.freqtrade.state = State.STOPPED
+        return False
 
     def _reconfigure(self) -> None:
         """
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Database benchmark for the queries the bot runs on every iteration / rpc call.
+
+Populates a database with a long trade history (closed trades with their orders,
+a few open trades, pair locks) and times the hot queries.
+Optionally prints the query plans, or drops the freqtrade indexes to compare.
+
+Usage:
+    python scripts/db_benchmark.py --db-url sqlite:///benchmark.sqlite --trades 100000
+"""
+import argparse
+import logging
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, List, Tuple
+
+from sqlalchemy import event, insert, inspect, text
+
+from freqtrade.persistence import Order, PairLocks, Trade, init_db
+from freqtrade.persistence.models import PairLock
+
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+)
+logger = logging.getLogger("db_benchmark")
+
+# Indexes added for the hot queries (see Trade / Order models and migrations)
+BENCHMARKED_INDEXES = [
+    ('trades', 'ix_trades_pair_is_open'),
+    ('trades', 'ix_trades_is_open_close_date'),
+    ('trades', 'ix_trades_open_order_id'),
+    ('orders', 'ix_orders_status_order_filled_date'),
+    ('pairlocks', 'ix_pairlocks_active_lock_end_time'),
+]
+CHUNK_SIZE = 10000
+
+
+def populate(trades: int, orders_per_trade: int, open_trades: int, pairs: List[str]) -> None:
+    """
+    Insert trades, orders and pair locks - open trades are the most recent ones.
+    """
+    session = Trade.query.session
+    now = datetime.utcnow()
+    for start in range(1, trades + 1, CHUNK_SIZE):
+        trade_rows = []
+        order_rows = []
+        for trade_id in range(start, min(start + CHUNK_SIZE, trades + 1)):
+            is_open = trade_id > trades - open_trades
+            pair = random.choice(pairs)
+            open_date = now - timedelta(minutes=(trades - trade_id) * 10 + 60)
+            close_date = None if is_open else open_date + timedelta(minutes=random.randint(5, 600))
+            profit_ratio = None if is_open else random.uniform(-0.05, 0.05)
+            trade_rows.append({
+                'id': trade_id, 'exchange': 'binance', 'pair': pair, 'is_open': is_open,
+                'fee_open': 0.001, 'fee_close': 0.001, 'open_rate': 1.0, 'amount': 100.0,
+                'stake_amount': 100.0, 'open_date': open_date, 'close_date': close_date,
+                'close_rate': None if is_open else 1.0 + profit_ratio,
+                'close_profit': profit_ratio,
+                'close_profit_abs': None if is_open else profit_ratio * 100,
+                'exit_reason': None if is_open else random.choice(['roi', 'stop_loss']),
+                'open_order_id': f'{trade_id}-0' if is_open and trade_id % 2 else None,
+                'is_short': False, 'interest_rate': 0.0,
+            })
+            for n in range(orders_per_trade):
+                order_open = is_open and n in (0, orders_per_trade - 1)
+                order_rows.append({
+                    'ft_trade_id': trade_id, 'ft_pair': pair, 'order_id': f'{trade_id}-{n}',
+                    'ft_order_side': 'stoploss' if n == orders_per_trade - 1 else 'buy',
+                    'ft_is_open': order_open, 'status': 'open' if order_open else 'closed',
+                    'order_type': 'limit', 'side': 'buy', 'price': 1.0, 'amount': 100.0,
+                    'filled': 0.0 if order_open else 100.0, 'cost': 100.0,
+                    'order_date': open_date,
+                    'order_filled_date': None if order_open else open_date,
+                })
+        session.execute(insert(Trade.__table__), trade_rows)
+        session.execute(insert(Order.__table__), order_rows)
+        logger.info(f"Inserted {trade_rows[-1]['id']} trades.")
+
+    lock_rows = [{
+        'pair': random.choice(pairs), 'side': '*', 'reason': 'benchmark',
+        'lock_time': now - timedelta(minutes=n * 30), 'active': n < 5,
+        'lock_end_time': now - timedelta(minutes=n * 30 - 60),
+    } for n in range(trades // 10)]
+    session.execute(insert(PairLock.__table__), lock_rows)
+    session.commit()
+
+
+def hot_queries(pairs: List[str], trades: int) -> List[Tuple[str, Callable[[], Any]]]:
+    now = datetime.utcnow()
+    return [
+        ('open trades', lambda: Trade.get_trades_proxy(is_open=True)),
+        ('open trades of pair', lambda: Trade.get_trades_proxy(pair=pairs[0], is_open=True)),
+        ('trades with open orders', Trade.get_open_order_trades),
+        ('open orders', Order.get_open_orders),
+        ('order by id', lambda: Order.order_by_id(f'{trades // 2}-1')),
+        ('total closed profit', Trade.get_total_closed_profit),
+        ('pair locks', lambda: PairLocks.get_pair_locks(pairs[0])),
+        ('daily profit (30 days)', lambda: Trade.get_profit_per_period(
+            'days', now - timedelta(days=30), now + timedelta(days=1))),
+        ('trading volume (1 day)', lambda: Trade.get_trading_volume(now - timedelta(days=1))),
+    ]
+
+
+def time_query(query: Callable[[], Any], repeat: int) -> float:
+    """
+    :return: Mean runtime in milliseconds
+    """
+    query()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        query()
+        Trade.query.session.expunge_all()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def explain(engine, query: Callable[[], Any]) -> List[str]:
+    """
+    Query plans of all statements emitted by `query`.
+    """
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, 'before_cursor_execute', capture)
+    try:
+        query()
+    finally:
+        event.remove(engine, 'before_cursor_execute', capture)
+
+    prefix = 'EXPLAIN QUERY PLAN' if engine.name == 'sqlite' else 'EXPLAIN'
+    plans = []
+    with engine.connect() as connection:
+        for statement, parameters in statements:
+            rows = connection.exec_driver_sql(f"{prefix} {statement}", parameters).all()
+            plans.append('\n'.join(f"    {row[-1]}" for row in rows))
+    return plans
+
+
+def drop_indexes(engine) -> None:
+    existing = {(table, index['name']) for table in ('trades', 'orders', 'pairlocks')
+                for index in inspect(engine).get_indexes(table)}
+    with engine.begin() as connection:
+        for table, name in BENCHMARKED_INDEXES:
+            if (table, name) in existing:
+                if engine.name == 'mysql':
+                    connection.execute(text(f"DROP INDEX {name} ON {table}"))
+                else:
+                    connection.execute(text(f"DROP INDEX {name}"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--db-url', default='sqlite://',
+                        help='Database to benchmark. Default: in-memory sqlite.')
+    parser.add_argument('--trades', type=int, default=100000, help='Number of trades.')
+    parser.add_argument('--orders-per-trade', type=int, default=5, help='Orders per trade.')
+    parser.add_argument('--open-trades', type=int, default=10, help='Number of open trades.')
+    parser.add_argument('--repeat', type=int, default=20, help='Runs per query.')
+    parser.add_argument('--no-populate', action='store_true',
+                        help='Use the existing data in the database.')
+    parser.add_argument('--drop-indexes', action='store_true',
+                        help='Drop the indexes for the hot queries before timing.')
+    parser.add_argument('--explain', action='store_true', help='Print query plans.')
+    args = parser.parse_args()
+
+    init_db(args.db_url)
+    engine = Trade.query.session.get_bind()
+    pairs = [f'COIN{n}/USDT' for n in range(200)]
+    if not args.no_populate:
+        populate(args.trades, args.orders_per_trade, args.open_trades, pairs)
+    if args.drop_indexes:
+        drop_indexes(engine)
+
+    for name, query in hot_queries(pairs, args.trades):
+        print(f"{name:<28} {time_query(query, args.repeat):10.3f} ms")
+        if args.explain:
+            for plan in explain(engine, query):
+                print(plan)
+
+
+if __name__ == '__main__':
+    main()
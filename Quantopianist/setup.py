@@ -66,6 +66,7 @@ setup(
         'pandas',
         'tables',
         'blosc',
+        'pyarrow',
         'fastapi',
         'uvicorn',
         'psutil',